@@ -0,0 +1,282 @@
+# Copyright 2019, OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+The opentelemetry-ext-asyncio package traces the scheduling of asyncio tasks.
+
+`enable` installs a task factory on an event loop that starts a child span
+for each task created while a span is current. The span is current in the
+task on Python 3.7+, where tasks run in a copy of the context they were
+created in, and ends when the task is done::
+
+    import asyncio
+
+    import opentelemetry.ext.asyncio
+    from opentelemetry import trace
+
+    opentelemetry.ext.asyncio.enable(trace.tracer_source())
+
+`EventLoopLagMonitor` measures how late the event loop runs a periodic
+callback. A blocking call in a coroutine delays all other callbacks and tasks
+on the loop, which shows up as lag. On a loop with task spans, the lag is
+also added as an event to the span of the task that blocked the loop::
+
+    monitor = opentelemetry.ext.asyncio.EventLoopLagMonitor(
+        threshold_millis=100,
+        lag_handle=meter.create_metric(
+            "event_loop.lag", "Event loop scheduling delay", "ms", float,
+            Measure,
+        ).get_handle(label_set),
+    )
+    monitor.start()
+"""
+
+import asyncio
+import collections.abc
+import functools
+import typing
+import weakref
+
+from opentelemetry import metrics, trace
+from opentelemetry.ext.asyncio.version import __version__
+from opentelemetry.trace.status import Status, StatusCanonicalCode
+
+_CANCELLED_STATUS = Status(StatusCanonicalCode.CANCELLED)
+
+# The started lag monitor of each event loop, see EventLoopLagMonitor.start.
+_LAG_MONITORS = (
+    weakref.WeakKeyDictionary()
+)  # type: typing.MutableMapping[asyncio.AbstractEventLoop, EventLoopLagMonitor]
+
+
+def enable(
+    tracer_source: trace.TracerSource,
+    loop: typing.Optional[asyncio.AbstractEventLoop] = None,
+) -> None:
+    """Starts a child span for each task created on ``loop`` while a span is
+    current.
+
+    The spans are named after the task's coroutine and end when the task is
+    done. Cancelled tasks get a ``CANCELLED`` status and failed tasks an
+    ``UNKNOWN`` status that describes the exception. The exception is not
+    marked as retrieved, so asyncio still logs failed tasks that are never
+    awaited.
+
+    Args:
+        tracer_source: The tracer source of the task spans.
+        loop: The event loop, defaults to the current event loop.
+    """
+    if loop is None:
+        loop = asyncio.get_event_loop()
+
+    # Guard against double instrumentation
+    disable(loop)
+
+    tracer = tracer_source.get_tracer(__name__, __version__)
+    wrapped = loop.get_task_factory()
+
+    def instrumented_task_factory(loop, coro, **kwargs):
+        parent = tracer.get_current_span()
+        if parent is None or not parent.get_context().is_valid():
+            return _create_task(wrapped, loop, coro, kwargs)
+
+        span = tracer.start_span(
+            getattr(coro, "__qualname__", None) or "asyncio.task", parent
+        )
+        # Only tasks created while a lag monitor runs report their steps,
+        # the others keep their coroutine for get_coro(), get_stack() and
+        # repr().
+        if _LAG_MONITORS.get(loop) is not None:
+            coro = _TaskCoroutine(coro, span, loop)
+        # The task copies the current context when it is created.
+        with tracer.use_span(span):
+            task = _create_task(wrapped, loop, coro, kwargs)
+        task.add_done_callback(functools.partial(_end_task_span, span))
+        return task
+
+    instrumented_task_factory.opentelemetry_ext_asyncio_applied = True
+    instrumented_task_factory.opentelemetry_ext_asyncio_wrapped = wrapped
+    loop.set_task_factory(instrumented_task_factory)
+
+
+def disable(loop: typing.Optional[asyncio.AbstractEventLoop] = None) -> None:
+    """Disables the task spans of `enable` on ``loop``.
+
+    Note that this only works if no other task factory was installed on top
+    of the one of `enable`.
+
+    Args:
+        loop: The event loop, defaults to the current event loop.
+    """
+    if loop is None:
+        loop = asyncio.get_event_loop()
+
+    task_factory = loop.get_task_factory()
+    if getattr(task_factory, "opentelemetry_ext_asyncio_applied", False):
+        loop.set_task_factory(
+            task_factory.opentelemetry_ext_asyncio_wrapped  # type: ignore
+        )
+
+
+def _create_task(
+    task_factory: typing.Optional[typing.Callable[..., asyncio.Task]],
+    loop: asyncio.AbstractEventLoop,
+    coro: typing.Any,
+    kwargs: typing.Dict[str, typing.Any],
+) -> asyncio.Task:
+    if task_factory is None:
+        return asyncio.Task(coro, loop=loop, **kwargs)
+    return task_factory(loop, coro, **kwargs)
+
+
+def _end_task_span(span: trace.Span, task: asyncio.Task) -> None:
+    if task.cancelled():
+        span.set_status(_CANCELLED_STATUS)
+    else:
+        # Task.exception() would mark the exception as retrieved and silence
+        # the "Task exception was never retrieved" log of asyncio.
+        exception = getattr(task, "_exception", None)
+        if exception is not None:
+            span.set_status(
+                Status(
+                    StatusCanonicalCode.UNKNOWN,
+                    "{}: {}".format(type(exception).__name__, exception),
+                )
+            )
+    span.end()
+
+
+class _TaskCoroutine(collections.abc.Coroutine):
+    """Coroutine of a task with a span created while an `EventLoopLagMonitor`
+    runs, which reports the event loop lag caused by the steps of the task to
+    the monitor."""
+
+    __slots__ = ("_coro", "_span", "_loop")
+
+    def __init__(
+        self,
+        coro: typing.Any,
+        span: trace.Span,
+        loop: asyncio.AbstractEventLoop,
+    ) -> None:
+        self._coro = coro
+        self._span = span
+        self._loop = loop
+
+    def send(self, value: typing.Any) -> typing.Any:
+        return self._step(self._coro.send, value)
+
+    def throw(self, *args: typing.Any) -> typing.Any:
+        return self._step(self._coro.throw, *args)
+
+    def close(self) -> None:
+        self._coro.close()
+
+    def __await__(self) -> typing.Any:
+        return self._coro.__await__()
+
+    def _step(
+        self, step: typing.Callable[..., typing.Any], *args: typing.Any
+    ) -> typing.Any:
+        monitor = _LAG_MONITORS.get(self._loop)
+        if monitor is None:
+            return step(*args)
+        started = self._loop.time()
+        try:
+            return step(*args)
+        finally:
+            monitor._step_done(  # pylint: disable=protected-access
+                self._span, started
+            )
+
+
+class EventLoopLagMonitor:
+    """Measures the scheduling delay of an event loop.
+
+    Every ``interval_millis`` the monitor runs a callback on the loop and
+    measures how much later than scheduled it runs. The lag is kept in
+    ``lag_millis`` and recorded to ``lag_handle``.
+
+    On a loop with the task spans of `enable`, a task step that is still
+    running when the callback is due and returns more than
+    ``threshold_millis`` late adds an ``event_loop.lag`` event to the span of
+    its task. The ``event_loop.lag_ms`` attribute of the event is the lag
+    when the step returned. Only tasks created after `start` are tracked this
+    way. A loop has at most one started monitor.
+
+    Args:
+        loop: The event loop, defaults to the current event loop.
+        interval_millis: The delay between two measurements.
+        threshold_millis: The lag above which span events are added.
+        lag_handle: The handle of a measure that records the lag in
+            milliseconds.
+    """
+
+    def __init__(
+        self,
+        loop: typing.Optional[asyncio.AbstractEventLoop] = None,
+        interval_millis: float = 100,
+        threshold_millis: float = 100,
+        lag_handle: typing.Optional[metrics.MeasureHandle] = None,
+    ):
+        if interval_millis <= 0:
+            raise ValueError("interval_millis must be positive.")
+        if threshold_millis < 0:
+            raise ValueError("threshold_millis must not be negative.")
+
+        self.loop = loop if loop is not None else asyncio.get_event_loop()
+        self.threshold_millis = threshold_millis
+        self.lag_handle = lag_handle
+        self.lag_millis = 0.0
+        self._interval = interval_millis / 1e3
+        self._scheduled_time = 0.0
+        self._timer = None  # type: typing.Optional[asyncio.TimerHandle]
+
+    def start(self) -> None:
+        """Starts measuring, must be called from the loop's thread."""
+        if self._timer is None:
+            _LAG_MONITORS[self.loop] = self
+            self._schedule(self.loop.time())
+
+    def stop(self) -> None:
+        """Stops measuring, must be called from the loop's thread."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+            if _LAG_MONITORS.get(self.loop) is self:
+                del _LAG_MONITORS[self.loop]
+
+    def _schedule(self, now: float) -> None:
+        self._scheduled_time = now + self._interval
+        self._timer = self.loop.call_at(self._scheduled_time, self._probe)
+
+    def _probe(self) -> None:
+        now = self.loop.time()
+        # Callbacks may run slightly early, within the loop's clock
+        # resolution.
+        lag = max(now - self._scheduled_time, 0.0) * 1e3
+        self.lag_millis = lag
+        if self.lag_handle is not None:
+            self.lag_handle.record(lag)
+        self._schedule(now)
+
+    def _step_done(self, span: trace.Span, started: float) -> None:
+        """Adds an event to ``span`` if its task step blocked the loop past
+        the time the callback was due."""
+        scheduled_time = self._scheduled_time
+        if started > scheduled_time:
+            return
+        lag = (self.loop.time() - scheduled_time) * 1e3
+        if lag > self.threshold_millis:
+            span.add_event("event_loop.lag", {"event_loop.lag_ms": lag})
@@ -0,0 +1,215 @@
+# Copyright 2019, OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import collections.abc
+import sys
+import unittest
+from unittest import mock
+
+import opentelemetry.ext.asyncio
+from opentelemetry.ext.asyncio import EventLoopLagMonitor
+from opentelemetry.sdk import trace
+from opentelemetry.sdk.trace import export
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+    InMemorySpanExporter,
+)
+from opentelemetry.trace.status import StatusCanonicalCode
+
+
+class TestAsyncioIntegration(unittest.TestCase):
+    def setUp(self):
+        self.tracer_source = trace.TracerSource()
+        self.tracer = self.tracer_source.get_tracer(__name__)
+        self.exporter = InMemorySpanExporter()
+        self.tracer_source.add_span_processor(
+            export.SimpleExportSpanProcessor(self.exporter)
+        )
+        self.loop = asyncio.new_event_loop()
+        self.addCleanup(self.loop.close)
+
+    def test_task_spans(self):
+        opentelemetry.ext.asyncio.enable(self.tracer_source, self.loop)
+        self.loop.run_until_complete(asyncio.sleep(0))
+        with self.tracer.start_as_current_span("parent") as parent:
+            self.loop.run_until_complete(
+                self.loop.create_task(asyncio.sleep(0))
+            )
+        spans = self.exporter.get_finished_spans()
+        self.assertEqual(len(spans), 2)
+        self.assertEqual(spans[0].parent, parent.get_context())
+
+    @unittest.skipIf(
+        sys.version_info < (3, 7), "tasks copy the context since Python 3.7"
+    )
+    def test_current_span_in_task(self):
+        tracer = self.tracer
+
+        class GetCurrentSpan(collections.abc.Coroutine):
+            def send(self, value):
+                raise StopIteration(tracer.get_current_span())
+
+            def throw(self, typ, val=None, tb=None):
+                raise typ
+
+            def __await__(self):
+                return self
+
+        opentelemetry.ext.asyncio.enable(self.tracer_source, self.loop)
+        with tracer.start_as_current_span("parent") as parent:
+            current_span = self.loop.run_until_complete(
+                self.loop.create_task(GetCurrentSpan())
+            )
+        self.assertEqual(current_span.name, "asyncio.task")
+        self.assertIs(current_span.parent, parent)
+        self.assertIs(tracer.get_current_span(), None)
+
+    def test_cancelled_task(self):
+        opentelemetry.ext.asyncio.enable(self.tracer_source, self.loop)
+        with self.tracer.start_as_current_span("parent"):
+            task = self.loop.create_task(asyncio.sleep(10))
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                self.loop.run_until_complete(task)
+        span = self.exporter.get_finished_spans()[0]
+        self.assertIs(
+            span.status.canonical_code, StatusCanonicalCode.CANCELLED
+        )
+
+    def test_failed_task(self):
+        async def fail():
+            raise ValueError("failed")
+
+        opentelemetry.ext.asyncio.enable(self.tracer_source, self.loop)
+        with self.tracer.start_as_current_span("parent"):
+            task = self.loop.create_task(fail())
+            with self.assertRaises(ValueError):
+                self.loop.run_until_complete(task)
+        span = self.exporter.get_finished_spans()[0]
+        self.assertIs(span.status.canonical_code, StatusCanonicalCode.UNKNOWN)
+        self.assertEqual(span.status.description, "ValueError: failed")
+
+    def test_failed_task_not_retrieved(self):
+        async def fail():
+            raise ValueError("failed")
+
+        exception_handler = mock.Mock()
+        self.loop.set_exception_handler(exception_handler)
+        opentelemetry.ext.asyncio.enable(self.tracer_source, self.loop)
+        with self.tracer.start_as_current_span("parent"):
+            task = self.loop.create_task(fail())
+            self.loop.run_until_complete(asyncio.sleep(0))
+        span = self.exporter.get_finished_spans()[0]
+        self.assertIs(span.status.canonical_code, StatusCanonicalCode.UNKNOWN)
+
+        del task
+        exception_handler.assert_called_once()
+        context = exception_handler.call_args[0][1]
+        self.assertEqual(
+            context["message"], "Task exception was never retrieved"
+        )
+
+    def test_disable(self):
+        created_tasks = []
+
+        def task_factory(loop, coro):
+            created_tasks.append(asyncio.Task(coro, loop=loop))
+            return created_tasks[-1]
+
+        self.loop.set_task_factory(task_factory)
+        opentelemetry.ext.asyncio.enable(self.tracer_source, self.loop)
+        opentelemetry.ext.asyncio.enable(self.tracer_source, self.loop)
+        with self.tracer.start_as_current_span("parent"):
+            self.loop.run_until_complete(
+                self.loop.create_task(asyncio.sleep(0))
+            )
+        self.assertEqual(len(created_tasks), 1)
+        self.assertEqual(len(self.exporter.get_finished_spans()), 2)
+
+        opentelemetry.ext.asyncio.disable(self.loop)
+        self.assertIs(self.loop.get_task_factory(), task_factory)
+
+
+class TestEventLoopLagMonitor(unittest.TestCase):
+    def setUp(self):
+        self.tracer_source = trace.TracerSource()
+        self.tracer = self.tracer_source.get_tracer(__name__)
+        self.exporter = InMemorySpanExporter()
+        self.tracer_source.add_span_processor(
+            export.SimpleExportSpanProcessor(self.exporter)
+        )
+        self.loop = asyncio.new_event_loop()
+        self.addCleanup(self.loop.close)
+        # The loop and the monitor run on a fake clock, which tasks advance
+        # to simulate blocking calls.
+        self.clock = 0.0
+        self.loop.time = lambda: self.clock
+
+    def test_lag(self):
+        async def block(seconds):
+            self.clock += seconds
+            await asyncio.sleep(0)
+
+        lag_handle = mock.Mock()
+        opentelemetry.ext.asyncio.enable(self.tracer_source, self.loop)
+        monitor = EventLoopLagMonitor(
+            self.loop,
+            interval_millis=10,
+            threshold_millis=20,
+            lag_handle=lag_handle,
+        )
+        monitor.start()
+        with self.tracer.start_as_current_span("parent"):
+            self.loop.run_until_complete(self.loop.create_task(block(0.015)))
+            self.assertAlmostEqual(monitor.lag_millis, 5)
+
+            # Blocks the loop past the next measurement.
+            self.loop.run_until_complete(self.loop.create_task(block(0.06)))
+            self.assertAlmostEqual(monitor.lag_millis, 50)
+            monitor.stop()
+            self.loop.run_until_complete(self.loop.create_task(block(0.06)))
+
+        lags = [call[0][0] for call in lag_handle.record.call_args_list]
+        self.assertEqual(len(lags), 2)
+        spans = self.exporter.get_finished_spans()
+        self.assertEqual([len(span.events) for span in spans], [0, 1, 0, 0])
+        event = spans[1].events[0]
+        self.assertEqual(event.name, "event_loop.lag")
+        self.assertAlmostEqual(event.attributes["event_loop.lag_ms"], 50)
+
+    @unittest.skipIf(
+        sys.version_info < (3, 8), "Task.get_coro was added in Python 3.8"
+    )
+    def test_task_coroutine(self):
+        def create_task():
+            coro = asyncio.sleep(0)
+            task = self.loop.create_task(coro)
+            self.loop.run_until_complete(task)
+            return task.get_coro() is coro
+
+        opentelemetry.ext.asyncio.enable(self.tracer_source, self.loop)
+        monitor = EventLoopLagMonitor(self.loop)
+        with self.tracer.start_as_current_span("parent"):
+            self.assertTrue(create_task())
+            monitor.start()
+            self.assertFalse(create_task())
+            monitor.stop()
+            self.assertTrue(create_task())
+        self.assertEqual(len(self.exporter.get_finished_spans()), 4)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            EventLoopLagMonitor(self.loop, interval_millis=0)
+        with self.assertRaises(ValueError):
+            EventLoopLagMonitor(self.loop, threshold_millis=-1)
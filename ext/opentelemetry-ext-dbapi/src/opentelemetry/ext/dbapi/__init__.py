@@ -24,11 +24,14 @@ import typing
 
 import wrapt
 
-from opentelemetry.trace import SpanKind, Tracer
+from opentelemetry.trace import LazyAttributeValue, SpanKind, Tracer
 from opentelemetry.trace.status import Status, StatusCanonicalCode
 
 logger = logging.getLogger(__name__)
 
+# Types of statement parameters that can not change after the query ran.
+_IMMUTABLE_PARAMETER_TYPES = (bool, int, float, str, bytes, type(None))
+
 
 def trace_integration(
     tracer: Tracer,
@@ -171,25 +174,18 @@ class TracedCursor:
         with self._db_api_integration.tracer.start_as_current_span(
             self._db_api_integration.name, kind=SpanKind.CLIENT
         ) as span:
-            span.set_attribute(
-                "component", self._db_api_integration.database_component
-            )
-            span.set_attribute(
-                "db.type", self._db_api_integration.database_type
-            )
-            span.set_attribute(
-                "db.instance", self._db_api_integration.database
-            )
-            span.set_attribute("db.statement", statement)
-
-            for (
-                attribute_key,
-                attribute_value,
-            ) in self._db_api_integration.span_attributes.items():
-                span.set_attribute(attribute_key, attribute_value)
-
-            if len(args) > 1:
-                span.set_attribute("db.statement.parameters", str(args[1]))
+            attributes = {
+                "component": self._db_api_integration.database_component,
+                "db.type": self._db_api_integration.database_type,
+                "db.instance": self._db_api_integration.database,
+                "db.statement": statement,
+            }
+            attributes.update(self._db_api_integration.span_attributes)
+            if len(args) > 1 and span.is_recording_events():
+                attributes["db.statement.parameters"] = _parameters_value(
+                    args[1]
+                )
+            span.set_attributes(attributes)
 
             try:
                 result = query_method(*args, **kwargs)
@@ -200,6 +196,27 @@ class TracedCursor:
                 raise ex
 
 
+def _parameters_value(parameters: typing.Any) -> typing.Any:
+    """Returns the attribute value for statement parameters.
+
+    Tuples of plain values, the common case, are only converted to a string
+    if the span is exported. Anything else, such as the lists of
+    ``executemany`` or objects the application may reuse or change, is
+    converted right away.
+    """
+    if _is_immutable(parameters):
+        return LazyAttributeValue(functools.partial(str, parameters))
+    return str(parameters)
+
+
+def _is_immutable(parameters: typing.Any) -> bool:
+    if isinstance(parameters, _IMMUTABLE_PARAMETER_TYPES):
+        return True
+    # Subclasses of tuple may be mutable or have a custom __str__.
+    # pylint: disable=unidiomatic-typecheck
+    return type(parameters) is tuple and all(map(_is_immutable, parameters))
+
+
 # pylint: disable=abstract-method
 class TracedCursorProxy(wrapt.ObjectProxy):
 
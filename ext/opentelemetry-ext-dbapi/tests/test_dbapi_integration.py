@@ -71,7 +71,7 @@ class TestDBApiIntegration(unittest.TestCase):
         self.assertEqual(self.span.attributes["db.instance"], "testdatabase")
         self.assertEqual(self.span.attributes["db.statement"], "Test query")
         self.assertEqual(
-            self.span.attributes["db.statement.parameters"],
+            self.span.attributes["db.statement.parameters"].resolve(),
             "('param1Value', False)",
         )
         self.assertEqual(self.span.attributes["db.user"], "testuser")
@@ -110,6 +110,21 @@ class TestDBApiIntegration(unittest.TestCase):
         self.assertTrue(self.start_as_current_span.called)
         self.assertEqual(self.span.attributes["db.statement"], "Test query")
 
+    def test_mutable_parameters(self):
+        db_integration = DatabaseApiIntegration(self.tracer, "testcomponent")
+        mock_connection = db_integration.wrapped_connection(
+            mock_connect, {}, {}
+        )
+        cursor = mock_connection.cursor()
+        parameters = [("param1Value",), ("param2Value",)]
+        cursor.executemany("Test query", parameters)
+        parameters.clear()
+        # Lists may be reused by the caller, so they are converted at once.
+        self.assertEqual(
+            self.span.attributes["db.statement.parameters"],
+            "[('param1Value',), ('param2Value',)]",
+        )
+
     def test_callproc(self):
         db_integration = DatabaseApiIntegration(self.tracer, "testcomponent")
         mock_connection = db_integration.wrapped_connection(
@@ -174,8 +189,15 @@ class MockSpan:
         self.kind = trace_api.SpanKind.INTERNAL
         self.attributes = {}
 
+    @staticmethod
+    def is_recording_events():
+        return True
+
     def set_attribute(self, key, value):
         self.attributes[key] = value
 
+    def set_attributes(self, attributes):
+        self.attributes.update(attributes)
+
     def set_status(self, status):
         self.status = status
@@ -0,0 +1,198 @@
+# Copyright 2019, OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+The opentelemetry-ext-futures package provides a
+`concurrent.futures.ThreadPoolExecutor` that runs submitted callables in the
+context they were submitted in, so that spans started by the callables have
+the submitting span as their parent::
+
+    from opentelemetry import trace
+    from opentelemetry.ext.futures import TracingThreadPoolExecutor
+
+    tracer = trace.tracer_source().get_tracer(__name__)
+    with TracingThreadPoolExecutor(max_workers=4) as executor:
+        with tracer.start_as_current_span("fan-out"):
+            results = list(executor.map(fetch, urls))
+
+The context is captured with `opentelemetry.context.Context.capture`, which
+takes constant time regardless of the number of context slots.
+
+Optionally, the executor records how long tasks waited in its queue and how
+busy its workers were, so that latency caused by a backlog in the executor can
+be told apart from latency of the work itself:
+
+* With a ``tracer``, each task runs in a span named ``<name>.task`` with the
+  attributes ``executor.queue_wait_ms``, ``executor.pending_tasks``,
+  ``executor.active_workers`` and ``executor.max_workers``.
+* With metric handles, the same values are recorded to a measure and two
+  gauges::
+
+    label_set = meter.get_label_set({"executor": "fetch"})
+    executor = TracingThreadPoolExecutor(
+        max_workers=4,
+        queue_wait_handle=meter.create_metric(
+            "executor.queue_wait", "Time tasks waited for a worker", "ms",
+            float, Measure, ("executor",),
+        ).get_handle(label_set),
+        active_workers_handle=meter.create_metric(
+            "executor.active_workers", "Workers running a task", "1",
+            int, Gauge, ("executor",),
+        ).get_handle(label_set),
+    )
+"""
+
+import threading
+import typing
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from opentelemetry import metrics, trace
+from opentelemetry.context import Context
+from opentelemetry.context.base_context import CapturedContext
+from opentelemetry.util import perf_counter_ns
+
+
+class TracingThreadPoolExecutor(ThreadPoolExecutor):
+    """A `concurrent.futures.ThreadPoolExecutor` that propagates the context
+    of `submit` and `map` calls to the worker threads.
+
+    Args:
+        *args: The arguments of `concurrent.futures.ThreadPoolExecutor`.
+        tracer: The tracer that starts a span for each task.
+        queue_wait_handle: The handle of a measure that records how long
+            each task waited for a worker, in milliseconds.
+        pending_tasks_handle: The handle of a gauge that is set to the
+            number of tasks waiting for a worker whenever a task starts or
+            a waiting task is cancelled.
+        active_workers_handle: The handle of a gauge that is set to the
+            number of workers running a task whenever a task starts.
+        name: The name of the executor, used for span names.
+        **kwargs: The arguments of `concurrent.futures.ThreadPoolExecutor`.
+    """
+
+    def __init__(
+        self,
+        *args: typing.Any,
+        tracer: typing.Optional[trace.Tracer] = None,
+        queue_wait_handle: typing.Optional[metrics.MeasureHandle] = None,
+        pending_tasks_handle: typing.Optional[metrics.GaugeHandle] = None,
+        active_workers_handle: typing.Optional[metrics.GaugeHandle] = None,
+        name: str = "executor",
+        **kwargs: typing.Any
+    ):
+        super().__init__(*args, **kwargs)
+        self.name = name
+        self._tracer = tracer
+        self._span_name = name + ".task"
+        self._instrumented = tracer is not None or (
+            queue_wait_handle,
+            pending_tasks_handle,
+            active_workers_handle,
+        ) != (None, None, None)
+        self._counter_lock = threading.Lock()
+        self._pending_tasks = 0
+        self._active_workers = 0
+        self._queue_wait_handle = queue_wait_handle
+        self._pending_tasks_handle = pending_tasks_handle
+        self._active_workers_handle = active_workers_handle
+
+    def submit(  # pylint: disable=arguments-differ
+        self,
+        func: typing.Callable[..., typing.Any],
+        *args: typing.Any,
+        **kwargs: typing.Any
+    ) -> Future:
+        captured = Context.capture()
+        if not self._instrumented:
+            return super().submit(captured.run, func, *args, **kwargs)
+
+        with self._counter_lock:
+            self._pending_tasks += 1
+        try:
+            future = super().submit(
+                self._run_instrumented,
+                captured,
+                perf_counter_ns(),
+                func,
+                args,
+                kwargs,
+            )
+        except BaseException:
+            with self._counter_lock:
+                self._pending_tasks -= 1
+            raise
+        future.add_done_callback(self._task_done)
+        return future
+
+    def _task_done(self, future: Future) -> None:
+        # Tasks cancelled while they wait for a worker never start, so they
+        # are no longer pending once they are done.
+        if not future.cancelled():
+            return
+        with self._counter_lock:
+            self._pending_tasks -= 1
+            pending_tasks = self._pending_tasks
+        if self._pending_tasks_handle is not None:
+            self._pending_tasks_handle.set(pending_tasks)
+
+    def _run_instrumented(
+        self,
+        captured: CapturedContext,
+        submitted: int,
+        func: typing.Callable[..., typing.Any],
+        args: typing.Tuple[typing.Any, ...],
+        kwargs: typing.Dict[str, typing.Any],
+    ) -> typing.Any:
+        queue_wait = (perf_counter_ns() - submitted) / 1e6
+        with self._counter_lock:
+            self._pending_tasks -= 1
+            self._active_workers += 1
+            pending_tasks = self._pending_tasks
+            active_workers = self._active_workers
+        try:
+            if self._queue_wait_handle is not None:
+                self._queue_wait_handle.record(queue_wait)
+            if self._pending_tasks_handle is not None:
+                self._pending_tasks_handle.set(pending_tasks)
+            if self._active_workers_handle is not None:
+                self._active_workers_handle.set(active_workers)
+            if self._tracer is None:
+                return captured.run(func, *args, **kwargs)
+            return captured.run(
+                self._run_in_span,
+                {
+                    "executor.queue_wait_ms": queue_wait,
+                    "executor.pending_tasks": pending_tasks,
+                    "executor.active_workers": active_workers,
+                    "executor.max_workers": self._max_workers,
+                },
+                func,
+                args,
+                kwargs,
+            )
+        finally:
+            with self._counter_lock:
+                self._active_workers -= 1
+
+    def _run_in_span(
+        self,
+        attributes: typing.Dict[str, typing.Any],
+        func: typing.Callable[..., typing.Any],
+        args: typing.Tuple[typing.Any, ...],
+        kwargs: typing.Dict[str, typing.Any],
+    ) -> typing.Any:
+        with self._tracer.start_as_current_span(
+            self._span_name, attributes=attributes
+        ):
+            return func(*args, **kwargs)
@@ -0,0 +1,134 @@
+# Copyright 2019, OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import unittest
+from unittest import mock
+
+from opentelemetry.ext.futures import TracingThreadPoolExecutor
+from opentelemetry.sdk import metrics, trace
+from opentelemetry.sdk.trace import export
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+    InMemorySpanExporter,
+)
+
+
+class TestTracingThreadPoolExecutor(unittest.TestCase):
+    def setUp(self):
+        tracer_source = trace.TracerSource()
+        self.tracer = tracer_source.get_tracer(__name__)
+        self.exporter = InMemorySpanExporter()
+        tracer_source.add_span_processor(
+            export.SimpleExportSpanProcessor(self.exporter)
+        )
+
+    def test_context_propagation(self):
+        with TracingThreadPoolExecutor(max_workers=2) as executor:
+            with self.tracer.start_as_current_span("parent") as parent:
+                current_spans = list(
+                    executor.map(lambda _: self.tracer.get_current_span(), [1])
+                )
+                future = executor.submit(
+                    self.tracer.start_as_current_span("child").__enter__
+                )
+                child = future.result()
+                child.end()
+            # Work submitted outside of the span does not see it.
+            outside = executor.submit(self.tracer.get_current_span).result()
+
+        self.assertIs(current_spans[0], parent)
+        self.assertIs(child.parent, parent)
+        self.assertIsNot(outside, parent)
+
+    def test_task_spans(self):
+        release = threading.Event()
+        with TracingThreadPoolExecutor(
+            max_workers=1, tracer=self.tracer, name="pool"
+        ) as executor:
+            with self.tracer.start_as_current_span("parent") as parent:
+                blocked = executor.submit(release.wait)
+                queued = executor.submit(self.tracer.get_current_span)
+                release.set()
+                blocked.result()
+                task_span = queued.result()
+
+        spans = self.exporter.get_finished_spans()
+        self.assertEqual([span.name for span in spans[:2]], ["pool.task"] * 2)
+        self.assertIs(task_span.parent, parent)
+        attributes = spans[1].attributes
+        self.assertGreater(attributes["executor.queue_wait_ms"], 0)
+        self.assertEqual(attributes["executor.pending_tasks"], 0)
+        self.assertEqual(attributes["executor.active_workers"], 1)
+        self.assertEqual(attributes["executor.max_workers"], 1)
+
+    def test_metrics(self):
+        meter = metrics.Meter()
+        label_set = meter.get_label_set({"executor": "pool"})
+        queue_wait = mock.Mock()
+        pending_tasks, active_workers = (
+            meter.create_metric(
+                name, "", "1", int, metrics.Gauge, ("executor",)
+            ).get_handle(label_set)
+            for name in ("pending_tasks", "active_workers")
+        )
+        release = threading.Event()
+        with TracingThreadPoolExecutor(
+            max_workers=1,
+            queue_wait_handle=queue_wait,
+            pending_tasks_handle=pending_tasks,
+            active_workers_handle=active_workers,
+        ) as executor:
+            for _ in range(3):
+                executor.submit(release.wait)
+            release.set()
+        self.assertEqual(queue_wait.record.call_count, 3)
+        self.assertEqual(pending_tasks.data, 0)
+        self.assertEqual(active_workers.data, 1)
+
+    def test_exception(self):
+        with TracingThreadPoolExecutor(
+            max_workers=1, tracer=self.tracer
+        ) as executor:
+            future = executor.submit(int, "not a number")
+            self.assertIsInstance(future.exception(), ValueError)
+        self.assertEqual(len(self.exporter.get_finished_spans()), 1)
+        # pylint: disable=protected-access
+        self.assertEqual(executor._active_workers, 0)
+        self.assertEqual(executor._pending_tasks, 0)
+
+    def test_cancelled_task(self):
+        # pylint: disable=protected-access
+        meter = metrics.Meter()
+        pending_tasks = meter.create_metric(
+            "pending_tasks", "", "1", int, metrics.Gauge, ("executor",)
+        ).get_handle(meter.get_label_set({"executor": "pool"}))
+        started = threading.Event()
+        release = threading.Event()
+
+        def block():
+            started.set()
+            release.wait()
+
+        with TracingThreadPoolExecutor(
+            max_workers=1, pending_tasks_handle=pending_tasks
+        ) as executor:
+            executor.submit(block)
+            started.wait()
+            queued = executor.submit(block)
+            self.assertEqual(executor._pending_tasks, 1)
+            self.assertTrue(queued.cancel())
+            self.assertEqual(executor._pending_tasks, 0)
+            self.assertEqual(pending_tasks.data, 0)
+            release.set()
+        self.assertEqual(executor._pending_tasks, 0)
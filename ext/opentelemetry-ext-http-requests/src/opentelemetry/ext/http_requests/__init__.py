@@ -23,7 +23,7 @@ from urllib.parse import urlparse
 from requests.sessions import Session
 
 from opentelemetry import propagators
-from opentelemetry.context import Context
+from opentelemetry.context import is_instrumentation_suppressed
 from opentelemetry.ext.http_requests.version import __version__
 from opentelemetry.trace import SpanKind
 
@@ -54,7 +54,7 @@ def enable(tracer_source):
 
     @functools.wraps(wrapped)
     def instrumented_request(self, method, url, *args, **kwargs):
-        if Context.suppress_instrumentation:
+        if is_instrumentation_suppressed():
             return wrapped(self, method, url, *args, **kwargs)
 
         # See
@@ -320,6 +320,24 @@ class TestJaegerSpanExporter(unittest.TestCase):
 
         self.assertEqual(spans, expected_spans)
 
+    @mock.patch("opentelemetry.sdk.trace.perf_counter_ns")
+    @mock.patch("opentelemetry.sdk.trace.time_ns")
+    def test_translate_clock_jump(self, time_ns, perf_counter_ns):
+        """The duration is measured with the monotonic clock even if the
+        wall clock jumps backwards while the span runs."""
+        time_ns.return_value = 1579000000 * 10 ** 9
+        perf_counter_ns.return_value = 10 ** 9
+        span = trace.Span("test_span", context=self._test_span.context)
+        span.start()
+        time_ns.return_value -= 3600 * 10 ** 9
+        perf_counter_ns.return_value += 250 * 10 ** 3
+        span.end()
+
+        # pylint: disable=protected-access
+        jaeger_span = jaeger_exporter._translate_to_jaeger((span,))[0]
+        self.assertEqual(jaeger_span.startTime, 1579000000 * 10 ** 6)
+        self.assertEqual(jaeger_span.duration, 250)
+
     def test_export(self):
         """Test that agent and/or collector are invoked"""
         exporter = jaeger_exporter.JaegerSpanExporter(
@@ -52,22 +52,29 @@ class CommandTracer(monitoring.CommandListener):
 
         try:
             span = self._tracer.start_span(name, kind=SpanKind.CLIENT)
-            span.set_attribute("component", DATABASE_TYPE)
-            span.set_attribute("db.type", DATABASE_TYPE)
-            span.set_attribute("db.instance", event.database_name)
-            span.set_attribute("db.statement", statement)
+            attributes = {
+                "component": DATABASE_TYPE,
+                "db.type": DATABASE_TYPE,
+                "db.instance": event.database_name,
+                "db.statement": statement,
+            }
             if event.connection_id is not None:
-                span.set_attribute("net.peer.name", event.connection_id[0])
-                span.set_attribute("net.peer.port", event.connection_id[1])
+                attributes["net.peer.name"] = event.connection_id[0]
+                attributes["net.peer.port"] = event.connection_id[1]
 
             # pymongo specific, not specified by spec
-            span.set_attribute("db.mongo.operation_id", event.operation_id)
-            span.set_attribute("db.mongo.request_id", event.request_id)
-
-            for attr in COMMAND_ATTRIBUTES:
-                _attr = event.command.get(attr)
-                if _attr is not None:
-                    span.set_attribute("db.mongo." + attr, str(_attr))
+            attributes["db.mongo.operation_id"] = event.operation_id
+            attributes["db.mongo.request_id"] = event.request_id
+
+            # The command documents belong to the application, which may
+            # change them once the command ran, so they are converted right
+            # away, and only for recorded spans.
+            if span.is_recording_events():
+                for attr in COMMAND_ATTRIBUTES:
+                    _attr = event.command.get(attr)
+                    if _attr is not None:
+                        attributes["db.mongo." + attr] = str(_attr)
+            span.set_attributes(attributes)
 
             # Add Span to dictionary
             self._span_dict[_get_span_dict_key(event)] = span
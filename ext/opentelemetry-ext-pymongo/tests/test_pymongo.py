@@ -163,9 +163,16 @@ class MockSpan:
         self.attributes = None
         self.end_time = None
 
+    @staticmethod
+    def is_recording_events():
+        return True
+
     def set_attribute(self, key, value):
         self.attributes[key] = value
 
+    def set_attributes(self, attributes):
+        self.attributes.update(attributes)
+
     def set_status(self, status):
         self.status = status
 
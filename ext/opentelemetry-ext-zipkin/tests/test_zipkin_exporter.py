@@ -233,6 +233,27 @@ class TestZipkinSpanExporter(unittest.TestCase):
             headers={"Content-Type": "application/json"},
         )
 
+    @patch("opentelemetry.sdk.trace.perf_counter_ns")
+    @patch("opentelemetry.sdk.trace.time_ns")
+    @patch("requests.post")
+    def test_export_clock_jump(self, mock_post, time_ns, perf_counter_ns):
+        """The duration is measured with the monotonic clock even if the
+        wall clock jumps backwards while the span runs."""
+        mock_post.return_value = MockResponse(200)
+        time_ns.return_value = 1579000000 * 10 ** 9
+        perf_counter_ns.return_value = 10 ** 9
+        span = trace.Span("test_span", context=self._test_span.context)
+        span.start()
+        time_ns.return_value -= 3600 * 10 ** 9
+        perf_counter_ns.return_value += 250 * 10 ** 3
+        span.end()
+
+        exporter = ZipkinSpanExporter("test-service")
+        self.assertEqual(SpanExportResult.SUCCESS, exporter.export([span]))
+        zipkin_span = json.loads(mock_post.call_args[1]["data"])[0]
+        self.assertEqual(zipkin_span["timestamp"], 1579000000 * 10 ** 6)
+        self.assertEqual(zipkin_span["duration"], 250)
+
     @patch("requests.post")
     def test_invalid_response(self, mock_post):
         mock_post.return_value = MockResponse(404)
@@ -97,6 +97,13 @@ Here goes another example using thread pool::
         pool.join()
         println('Main thread: {}'.format(Context))
 
+``Context.capture`` takes a snapshot of the whole context in constant time,
+which can be run later, also in other threads::
+
+    snapshot = Context.capture()
+    Context.operation_id = 'changed'
+    snapshot.run(work, 'snapshot')  # sees operation_id == 'main'
+
 Here goes a simple demo of how async could work in Python 3.7+::
 
     import asyncio
@@ -136,11 +143,36 @@ Here goes a simple demo of how async could work in Python 3.7+::
 
     if __name__ == '__main__':
         asyncio.run(main())
+
+Code on hot paths should use a `ContextKey` instead, which is bound to its
+slot when it is created and sets values with tokens::
+
+    from opentelemetry.context import ContextKey
+
+    REQUEST_ID = ContextKey("request_id", None)  # type: ContextKey[str]
+
+    token = REQUEST_ID.attach("1234")
+    try:
+        handle_request()  # REQUEST_ID.get() returns "1234"
+    finally:
+        REQUEST_ID.detach(token)
+
+Keys share their values with ``Context``, ``Context.request_id`` above is
+``"1234"`` as well.
 """
 
+import typing
+
 from .base_context import BaseRuntimeContext
 
-__all__ = ["Context"]
+__all__ = [
+    "Context",
+    "ContextKey",
+    "SUPPRESS_INSTRUMENTATION",
+    "is_instrumentation_suppressed",
+]
+
+_T = typing.TypeVar("_T")
 
 try:
     from .async_context import AsyncRuntimeContext
@@ -150,3 +182,55 @@ except ImportError:
     from .thread_local_context import ThreadLocalRuntimeContext
 
     Context = ThreadLocalRuntimeContext()
+
+
+class ContextKey(typing.Generic[_T]):
+    """Typed key of a value in the runtime context.
+
+    The key is bound to the `Context` slot of the same name when it is
+    created, so reading and writing it skips the attribute lookups of
+    ``Context``. Keys are meant to be created once, at module level.
+
+    Args:
+        name: The name of the slot.
+        default: The value of the key in contexts that did not set it, or a
+            function returning it.
+    """
+
+    __slots__ = ("name", "_slot")
+
+    def __init__(self, name: str, default: object = None) -> None:
+        self.name = name
+        self._slot = Context.register_slot(name, default)
+
+    def __repr__(self) -> str:
+        return "{}({!r})".format(type(self).__name__, self.name)
+
+    def get(self) -> _T:
+        """Returns the value of the key in the current context."""
+        return self._slot.get()  # type: ignore
+
+    def attach(self, value: _T) -> object:
+        """Sets the value of the key in the current context.
+
+        Returns:
+            A token for `detach`.
+        """
+        return self._slot.attach(value)
+
+    def detach(self, token: object) -> None:
+        """Restores the value of the key from before the `attach` call that
+        returned ``token``."""
+        self._slot.detach(token)
+
+
+#: Set by exporters so that instrumentations do not trace their requests.
+SUPPRESS_INSTRUMENTATION = ContextKey(
+    "suppress_instrumentation", False
+)  # type: ContextKey[bool]
+
+
+def is_instrumentation_suppressed() -> bool:
+    """Returns whether instrumentations should not create spans, see
+    `SUPPRESS_INSTRUMENTATION`."""
+    return bool(SUPPRESS_INSTRUMENTATION.get())
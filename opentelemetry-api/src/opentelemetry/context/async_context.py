@@ -13,19 +13,44 @@
 # limitations under the License.
 
 try:
-    from contextvars import ContextVar
+    from contextvars import Context, ContextVar, Token, copy_context
 except ImportError:
     pass
 else:
     import typing  # pylint: disable=unused-import
     from . import base_context
 
+    class _CapturedContextVars(base_context.CapturedContext):
+        __slots__ = ("_context",)
+
+        def __init__(self, context: Context) -> None:
+            self._context = context
+
+        def run(
+            self,
+            func: typing.Callable[..., object],
+            *args: object,
+            **kwargs: object
+        ) -> object:
+            def call() -> object:
+                return func(*args, **kwargs)
+
+            # A contextvars.Context can only be entered by one thread at a
+            # time, copies are cheap and keep the snapshot unchanged.
+            return self._context.copy().run(call)
+
     class AsyncRuntimeContext(base_context.BaseRuntimeContext):
         class Slot(base_context.BaseRuntimeContext.Slot):
             def __init__(self, name: str, default: object):
                 # pylint: disable=super-init-not-called
                 self.name = name
-                self.contextvar = ContextVar(name)  # type: ContextVar[object]
+                if callable(default):
+                    self.contextvar = ContextVar(
+                        name
+                    )  # type: ContextVar[object]
+                else:
+                    # Reading a constant default needs no LookupError path.
+                    self.contextvar = ContextVar(name, default=default)
                 self.default = base_context.wrap_callable(
                     default
                 )  # type: typing.Callable[..., object]
@@ -43,3 +68,22 @@ else:
 
             def set(self, value: object) -> None:
                 self.contextvar.set(value)
+
+            def attach(self, value: object) -> object:
+                return self.contextvar.set(value)
+
+            def detach(self, token: object) -> None:
+                # attach returns the tokens of the context variable.
+                var_token = typing.cast("Token[object]", token)
+                try:
+                    self.contextvar.reset(var_token)
+                except ValueError:
+                    # The token was created in another context, e.g. by
+                    # another asyncio task, so the value is restored by hand.
+                    previous = var_token.old_value  # type: object
+                    if previous is Token.MISSING:
+                        previous = self.default()
+                    self.contextvar.set(previous)
+
+        def capture(self) -> base_context.CapturedContext:
+            return _CapturedContextVars(copy_context())
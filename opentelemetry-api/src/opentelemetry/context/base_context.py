@@ -23,6 +23,24 @@ def wrap_callable(target: "object") -> typing.Callable[[], object]:
     return lambda: target
 
 
+class CapturedContext:
+    """A snapshot of the runtime context, see
+    `BaseRuntimeContext.capture`."""
+
+    def run(
+        self,
+        func: typing.Callable[..., "object"],
+        *args: "object",
+        **kwargs: "object"
+    ) -> "object":
+        """Calls ``func`` in the captured context.
+
+        Changes that ``func`` makes to the context are discarded when it
+        returns. A snapshot may be run several times, also concurrently.
+        """
+        raise NotImplementedError
+
+
 class BaseRuntimeContext:
     class Slot:
         def __init__(self, name: str, default: "object"):
@@ -37,6 +55,21 @@ class BaseRuntimeContext:
         def set(self, value: "object") -> None:
             raise NotImplementedError
 
+        def attach(self, value: "object") -> "object":
+            """Sets the value of the slot.
+
+            Returns:
+                A token for `detach`.
+            """
+            previous = self.get()
+            self.set(value)
+            return previous
+
+        def detach(self, token: "object") -> None:
+            """Restores the value of the slot from before the `attach` call
+            that returned ``token``."""
+            self.set(token)
+
     _lock = threading.Lock()
     _slots = {}  # type: typing.Dict[str, 'BaseRuntimeContext.Slot']
 
@@ -79,6 +112,14 @@ class BaseRuntimeContext:
         keys = self._slots.keys()
         return dict((n, self._slots[n].get()) for n in keys)
 
+    def capture(self) -> CapturedContext:
+        """Captures the current context.
+
+        Unlike `snapshot`, capturing takes constant time regardless of the
+        number of slots.
+        """
+        raise NotImplementedError
+
     def __repr__(self) -> str:
         return "{}({})".format(type(self).__name__, self.snapshot())
 
@@ -102,12 +143,17 @@ class BaseRuntimeContext:
 
     @contextmanager  # type: ignore
     def use(self, **kwargs: typing.Dict[str, object]) -> typing.Iterator[None]:
-        snapshot = {key: self[key] for key in kwargs}
-        for key in kwargs:
-            self[key] = kwargs[key]
-        yield
-        for key in kwargs:
-            self[key] = snapshot[key]
+        tokens = []
+        for name, value in kwargs.items():
+            if name not in self._slots:
+                self.register_slot(name, None)
+            slot = self._slots[name]
+            tokens.append((slot, slot.attach(value)))
+        try:
+            yield
+        finally:
+            for slot, token in reversed(tokens):
+                slot.detach(token)
 
     def with_current_context(
         self, func: typing.Callable[..., "object"]
@@ -115,16 +161,14 @@ class BaseRuntimeContext:
         """Capture the current context and apply it to the provided func.
         """
 
-        caller_context = self.snapshot()
+        caller_context = self.capture()
 
         def call_with_current_context(
             *args: "object", **kwargs: "object"
         ) -> "object":
-            try:
-                backup_context = self.snapshot()
-                self.apply(caller_context)
+            def call() -> "object":
                 return func(*args, **kwargs)
-            finally:
-                self.apply(backup_context)
+
+            return caller_context.run(call)
 
         return call_with_current_context
@@ -12,8 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import functools
 import re
 import typing
+from collections import OrderedDict
 
 import opentelemetry.trace as trace
 from opentelemetry.context.propagation import httptextformat
@@ -143,9 +145,16 @@ def _parse_tracestate(header_list: typing.List[str]) -> trace.TraceState:
         If the number of keys is beyond the maximum, all values
         will be discarded and an empty tracestate will be returned.
     """
-    tracestate = trace.TraceState()
-    value_count = 0
-    for header in header_list:
+    if not header_list:
+        return trace.DEFAULT_TRACE_STATE
+    return _parse_tracestate_headers(tuple(header_list))
+
+
+def _parse_tracestate_tuple(
+    headers: typing.Tuple[str, ...]
+) -> trace.TraceState:
+    entries = OrderedDict()  # type: typing.Dict[str, str]
+    for header in headers:
         for member in re.split(_DELIMITER_FORMAT_RE, header):
             # empty members are valid, but no need to process further.
             if not member:
@@ -153,19 +162,26 @@ def _parse_tracestate(header_list: typing.List[str]) -> trace.TraceState:
             match = _MEMBER_FORMAT_RE.fullmatch(member)
             if not match:
                 # TODO: log this?
-                return trace.TraceState()
+                return trace.DEFAULT_TRACE_STATE
             key, _eq, value = match.groups()
-            if key in tracestate:  # pylint:disable=E1135
+            if key in entries:
                 # duplicate keys are not legal in
                 # the header, so we will remove
-                return trace.TraceState()
-            # typing.Dict's update is not recognized by pylint:
-            # https://github.com/PyCQA/pylint/issues/2420
-            tracestate[key] = value  # pylint:disable=E1137
-            value_count += 1
-            if value_count > _TRACECONTEXT_MAXIMUM_TRACESTATE_KEYS:
-                return trace.TraceState()
-    return tracestate
+                return trace.DEFAULT_TRACE_STATE
+            entries[key] = value
+            if len(entries) > _TRACECONTEXT_MAXIMUM_TRACESTATE_KEYS:
+                return trace.DEFAULT_TRACE_STATE
+    if not entries:
+        return trace.DEFAULT_TRACE_STATE
+    return trace.TraceState(entries)
+
+
+# Trace states are immutable, so requests carrying the same headers, which
+# is common between a few services, share a single parsed trace state. The
+# cache is assigned with an explicit type since lru_cache is untyped.
+_parse_tracestate_headers = functools.lru_cache(maxsize=64)(
+    _parse_tracestate_tuple
+)  # type: typing.Callable[[typing.Tuple[str, ...]], trace.TraceState]
 
 
 def _format_tracestate(tracestate: trace.TraceState) -> str:
@@ -178,4 +194,4 @@ def _format_tracestate(tracestate: trace.TraceState) -> str:
         A string that adheres to the w3c tracestate
         header format.
     """
-    return ",".join(key + "=" + value for key, value in tracestate.items())
+    return tracestate.to_header()
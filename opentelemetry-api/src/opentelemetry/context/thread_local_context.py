@@ -17,11 +17,42 @@ import typing  # pylint: disable=unused-import
 
 from . import base_context
 
+# The slot values of each thread are kept in a single dict that is replaced
+# instead of changed, so that capturing a context only has to keep a
+# reference to it.
+_THREAD_LOCAL = threading.local()
+_EMPTY = {}  # type: typing.Dict[str, object]
+
+
+def _values() -> typing.Dict[str, object]:
+    values = getattr(
+        _THREAD_LOCAL, "values", _EMPTY
+    )  # type: typing.Dict[str, object]
+    return values
+
+
+class _CapturedThreadLocals(base_context.CapturedContext):
+    __slots__ = ("_values",)
+
+    def __init__(self, values: typing.Dict[str, object]) -> None:
+        self._values = values
+
+    def run(
+        self,
+        func: typing.Callable[..., object],
+        *args: object,
+        **kwargs: object
+    ) -> object:
+        backup = _values()
+        _THREAD_LOCAL.values = self._values
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _THREAD_LOCAL.values = backup
+
 
 class ThreadLocalRuntimeContext(base_context.BaseRuntimeContext):
     class Slot(base_context.BaseRuntimeContext.Slot):
-        _thread_local = threading.local()
-
         def __init__(self, name: str, default: "object"):
             # pylint: disable=super-init-not-called
             self.name = name
@@ -30,16 +61,21 @@ class ThreadLocalRuntimeContext(base_context.BaseRuntimeContext):
             )  # type: typing.Callable[..., object]
 
         def clear(self) -> None:
-            setattr(self._thread_local, self.name, self.default())
+            self.set(self.default())
 
         def get(self) -> "object":
             try:
-                got = getattr(self._thread_local, self.name)  # type: object
+                got = _values()[self.name]  # type: object
                 return got
-            except AttributeError:
+            except KeyError:
                 value = self.default()
                 self.set(value)
                 return value
 
         def set(self, value: "object") -> None:
-            setattr(self._thread_local, self.name, value)
+            values = dict(_values())
+            values[self.name] = value
+            _THREAD_LOCAL.values = values
+
+    def capture(self) -> base_context.CapturedContext:
+        return _CapturedThreadLocals(_values())
@@ -68,8 +68,10 @@ implicit or explicit context propagation consistently throughout.
 
 import abc
 import enum
+import threading
 import types as python_types
 import typing
+from collections import OrderedDict
 from contextlib import contextmanager
 
 from opentelemetry.trace.status import Status
@@ -78,16 +80,23 @@ from opentelemetry.util import loader, types
 # TODO: quarantine
 ParentSpan = typing.Optional[typing.Union["Span", "SpanContext"]]
 
+# Read-only placeholder shared by all links without attributes.
+_EMPTY_ATTRIBUTES = python_types.MappingProxyType(
+    {}
+)  # type: typing.Mapping[str, types.AttributeValue]
+
 
 class Link:
     """A link to a `Span`."""
 
+    __slots__ = ("_context", "_attributes")
+
     def __init__(
         self, context: "SpanContext", attributes: types.Attributes = None
     ) -> None:
         self._context = context
         if attributes is None:
-            self._attributes = {}  # type: types.Attributes
+            self._attributes = _EMPTY_ATTRIBUTES
         else:
             self._attributes = attributes
 
@@ -96,13 +105,17 @@ class Link:
         return self._context
 
     @property
-    def attributes(self) -> types.Attributes:
+    def attributes(self) -> typing.Mapping[str, types.AttributeValue]:
+        """The link's attributes, a read-only mapping shared by all links
+        created without attributes."""
         return self._attributes
 
 
 class Event:
     """A text annotation with a set of attributes."""
 
+    __slots__ = ("_name", "_attributes", "_timestamp")
+
     def __init__(
         self, name: str, attributes: types.Attributes, timestamp: int
     ) -> None:
@@ -123,6 +136,39 @@ class Event:
         return self._timestamp
 
 
+class LazyAttributeValue:
+    """An attribute value that is only computed if it is needed.
+
+    Wraps a function without arguments that returns the actual attribute
+    value. Spans that are not recorded never call it, and the SDK calls it
+    when the span is exported, off the thread that set the attribute::
+
+        span.set_attribute(
+            "db.statement.parameters", LazyAttributeValue(lambda: str(params))
+        )
+
+    The function must not depend on state that changes before the span is
+    exported.
+
+    Args:
+        function: Returns the attribute value.
+    """
+
+    __slots__ = ("function",)
+
+    def __init__(
+        self, function: typing.Callable[[], types.AttributeValue]
+    ) -> None:
+        self.function = function
+
+    def resolve(self) -> types.AttributeValue:
+        """Calls the wrapped function and returns the attribute value."""
+        return self.function()
+
+    def __repr__(self) -> str:
+        return "{}({!r})".format(type(self).__name__, self.function)
+
+
 class SpanKind(enum.Enum):
     """Specifies additional details on how this span relates to its parent span.
 
@@ -155,6 +201,9 @@ class SpanKind(enum.Enum):
 class Span(abc.ABC):
     """A span represents a single operation within a trace."""
 
+    # Allow implementations to define __slots__ to keep spans small.
+    __slots__ = ()
+
     @abc.abstractmethod
     def end(self, end_time: typing.Optional[int] = None) -> None:
         """Sets the current time as the span's end time.
@@ -181,8 +230,20 @@ class Span(abc.ABC):
         """Sets an Attribute.
 
         Sets a single Attribute with the key and value passed as arguments.
+        The value may be a `LazyAttributeValue` to defer computing it.
         """
 
+    def set_attributes(
+        self, attributes: typing.Mapping[str, types.AttributeValue]
+    ) -> None:
+        """Sets several Attributes.
+
+        Equivalent to calling `set_attribute` for each item of the mapping,
+        but implementations may apply the whole batch at once.
+        """
+        for key, value in attributes.items():
+            self.set_attribute(key, value)
+
     @abc.abstractmethod
     def add_event(
         self,
@@ -204,6 +265,15 @@ class Span(abc.ABC):
         Adds an `Event` that has previously been created.
         """
 
+    def add_events(self, events: typing.Iterable[Event]) -> None:
+        """Adds several `Event` objects.
+
+        Equivalent to calling `add_lazy_event` for each event, but
+        implementations may add the whole batch at once.
+        """
+        for event in events:
+            self.add_lazy_event(event)
+
     @abc.abstractmethod
     def update_name(self, name: str) -> None:
         """Updates the `Span` name.
@@ -273,21 +343,113 @@ class TraceOptions(int):
 DEFAULT_TRACE_OPTIONS = TraceOptions.get_default()
 
 
-class TraceState(typing.Dict[str, str]):
+class TraceState(typing.Mapping[str, str]):
     """A list of key-value pairs representing vendor-specific trace info.
 
     Keys and values are strings of up to 256 printable US-ASCII characters.
     Implementations should conform to the `W3C Trace Context - Tracestate`_
     spec, which describes additional restrictions on valid field values.
 
+    Trace states are immutable, so the `SpanContext` of a child span shares
+    the trace state of its parent. `add`, `update` and `delete` return new
+    trace states, and the header value of a trace state is only built once,
+    see `to_header`.
+
     .. _W3C Trace Context - Tracestate:
         https://www.w3.org/TR/trace-context/#tracestate-field
+
+    Args:
+        entries: The key-value pairs, in the order of the header.
     """
 
+    __slots__ = ("_entries", "_header")
+
+    #: The maximum number of entries, `add` ignores further ones.
+    MAX_ENTRIES = 32
+
+    def __init__(
+        self,
+        entries: typing.Union[
+            typing.Mapping[str, str], typing.Iterable[typing.Tuple[str, str]]
+        ] = (),
+    ) -> None:
+        self._entries = OrderedDict(entries)  # type: typing.Mapping[str, str]
+        self._header = None  # type: typing.Optional[str]
+
     @classmethod
     def get_default(cls) -> "TraceState":
         return cls()
 
+    def __getitem__(self, key: str) -> str:
+        return self._entries[key]
+
+    def __iter__(self) -> typing.Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return "{}({!r})".format(
+            type(self).__name__, list(self._entries.items())
+        )
+
+    def add(self, key: str, value: str) -> "TraceState":
+        """Returns a copy with a new entry in front of the others.
+
+        The trace state is returned unchanged if it already has an entry for
+        ``key`` or has `MAX_ENTRIES` entries.
+        """
+        entries = self._entries
+        if key in entries or len(entries) >= self.MAX_ENTRIES:
+            return self
+        trace_state = self._with_first_entry(key, value)
+        if self._header is not None:
+            # The other entries keep their order, so their header is reused.
+            member = key + "=" + value
+            trace_state._header = (  # pylint: disable=protected-access
+                member + "," + self._header if entries else member
+            )
+        return trace_state
+
+    def update(self, key: str, value: str) -> "TraceState":
+        """Returns a copy in which the entry for ``key`` has a new value and
+        is moved in front of the others.
+
+        The trace state is returned unchanged if it has no entry for ``key``.
+        """
+        if key not in self._entries:
+            return self
+        return self._with_first_entry(key, value)
+
+    def delete(self, key: str) -> "TraceState":
+        """Returns a copy without the entry for ``key``.
+
+        The trace state is returned unchanged if it has no entry for ``key``.
+        """
+        if key not in self._entries:
+            return self
+        return TraceState(
+            item for item in self._entries.items() if item[0] != key
+        )
+
+    def _with_first_entry(self, key: str, value: str) -> "TraceState":
+        entries = [(key, value)]
+        entries.extend(
+            item for item in self._entries.items() if item[0] != key
+        )
+        return TraceState(entries)
+
+    def to_header(self) -> str:
+        """Returns the value of the W3C ``tracestate`` header for this trace
+        state."""
+        header = self._header
+        if header is None:
+            header = self._header = ",".join(
+                key + "=" + value for key, value in self._entries.items()
+            )
+        return header
+
 
 DEFAULT_TRACE_STATE = TraceState.get_default()
 
@@ -313,6 +475,8 @@ class SpanContext:
         trace_state: Tracing-system-specific info to propagate.
     """
 
+    __slots__ = ("trace_id", "span_id", "trace_options", "trace_state")
+
     def __init__(
         self,
         trace_id: int,
@@ -358,6 +522,8 @@ class DefaultSpan(Span):
     All operations are no-op except context propagation.
     """
 
+    __slots__ = ("_context",)
+
     def __init__(self, context: "SpanContext") -> None:
         self._context = context
 
@@ -373,6 +539,11 @@ class DefaultSpan(Span):
     def set_attribute(self, key: str, value: types.AttributeValue) -> None:
         pass
 
+    def set_attributes(
+        self, attributes: typing.Mapping[str, types.AttributeValue]
+    ) -> None:
+        pass
+
     def add_event(
         self,
         name: str,
@@ -384,6 +555,9 @@ class DefaultSpan(Span):
     def add_lazy_event(self, event: Event) -> None:
         pass
 
+    def add_events(self, events: typing.Iterable[Event]) -> None:
+        pass
+
     def update_name(self, name: str) -> None:
         pass
 
@@ -444,7 +618,7 @@ class DefaultTracerSource(TracerSource):
         instrumenting_library_version: str = "",
     ) -> "Tracer":
         # pylint:disable=no-self-use,unused-argument
-        return DefaultTracer()
+        return _DEFAULT_TRACER
 
 
 class Tracer(abc.ABC):
@@ -636,6 +810,8 @@ class DefaultTracer(Tracer):
         yield
 
 
+_DEFAULT_TRACER = DefaultTracer()
+
 # Once https://github.com/python/mypy/issues/7092 is resolved,
 # the following type definition should be replaced with
 # from opentelemetry.util.loader import ImplementationFactory
@@ -645,28 +821,39 @@ ImplementationFactory = typing.Callable[
 
 _TRACER_SOURCE = None  # type: typing.Optional[TracerSource]
 _TRACER_SOURCE_FACTORY = None  # type: typing.Optional[ImplementationFactory]
+_TRACER_SOURCE_LOCK = threading.Lock()
 
 
 def tracer_source() -> TracerSource:
     """Gets the current global :class:`~.TracerSource` object.
 
-    If there isn't one set yet, a default will be loaded.
+    If there isn't one set yet, a default will be loaded. Once loaded, this
+    only reads a global, so it is cheap enough to call on every request.
     """
-    global _TRACER_SOURCE, _TRACER_SOURCE_FACTORY  # pylint:disable=global-statement
+    source = _TRACER_SOURCE
+    if source is None:
+        source = _load_tracer_source()
+    return source
 
-    if _TRACER_SOURCE is None:
-        # pylint:disable=protected-access
-        try:
-            _TRACER_SOURCE = loader._load_impl(
-                TracerSource, _TRACER_SOURCE_FACTORY  # type: ignore
-            )
-        except TypeError:
-            # if we raised an exception trying to instantiate an
-            # abstract class, default to no-op tracer impl
-            _TRACER_SOURCE = DefaultTracerSource()
-        del _TRACER_SOURCE_FACTORY
 
-    return _TRACER_SOURCE
+def _load_tracer_source() -> TracerSource:
+    """Loads the global tracer source exactly once, even if several threads
+    ask for it at the same time."""
+    global _TRACER_SOURCE, _TRACER_SOURCE_FACTORY  # pylint:disable=global-statement
+
+    with _TRACER_SOURCE_LOCK:
+        if _TRACER_SOURCE is None:
+            # pylint:disable=protected-access
+            try:
+                _TRACER_SOURCE = loader._load_impl(
+                    TracerSource, _TRACER_SOURCE_FACTORY  # type: ignore
+                )
+            except TypeError:
+                # if we raised an exception trying to instantiate an
+                # abstract class, default to no-op tracer impl
+                _TRACER_SOURCE = DefaultTracerSource()
+            del _TRACER_SOURCE_FACTORY
+        return _TRACER_SOURCE
 
 
 def set_preferred_tracer_source_implementation(
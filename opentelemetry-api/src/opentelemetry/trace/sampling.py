@@ -13,12 +13,32 @@
 # limitations under the License.
 
 import abc
-from typing import Dict, Mapping, Optional, Sequence
+import inspect
+import re
+import threading
+import time
+from types import MappingProxyType
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Pattern,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
 
 # pylint: disable=unused-import
-from opentelemetry.trace import Link, SpanContext
+from opentelemetry.trace import Link, SpanContext, SpanKind
 from opentelemetry.util.types import Attributes, AttributeValue
 
+_EMPTY_ATTRIBUTES = MappingProxyType({})  # type: Mapping[str, AttributeValue]
+
 
 class Decision:
     """A sampling decision as applied to a newly-created Span.
@@ -33,16 +53,27 @@ class Decision:
             type(self).__name__, str(self.sampled), str(self.attributes)
         )
 
+    __slots__ = ("sampled", "attributes")
+
     def __init__(
         self,
         sampled: bool = False,
         attributes: Optional[Mapping[str, "AttributeValue"]] = None,
     ) -> None:
         self.sampled = sampled  # type: bool
-        if attributes is None:
-            self.attributes = {}  # type: Dict[str, "AttributeValue"]
+        if attributes:
+            self.attributes = dict(
+                attributes
+            )  # type: Mapping[str, "AttributeValue"]
         else:
-            self.attributes = dict(attributes)
+            # Decisions without attributes share a read-only mapping.
+            self.attributes = _EMPTY_ATTRIBUTES
+
+
+# Shared decisions for samplers that don't add attributes, which must not be
+# modified.
+_SAMPLED = Decision(True)
+_NOT_SAMPLED = Decision(False)
 
 
 class Sampler(abc.ABC):
@@ -55,8 +86,69 @@ class Sampler(abc.ABC):
         name: str,
         attributes: Optional[Attributes] = None,
         links: Sequence["Link"] = (),
+        kind: Optional[SpanKind] = None,
     ) -> "Decision":
-        pass
+        """Decides whether a new span is sampled.
+
+        ``kind`` is passed by keyword and only to samplers whose
+        ``should_sample`` accepts it, see `call_should_sample`, so samplers
+        written before it was added keep working.
+        """
+
+
+# Whether the should_sample method of a sampler class accepts kind.
+_ACCEPTS_KIND = {}  # type: Dict[Type[Sampler], bool]
+
+
+def _accepts_kind(sampler: Sampler) -> bool:
+    sampler_type = type(sampler)
+    accepts_kind = _ACCEPTS_KIND.get(sampler_type)
+    if accepts_kind is None:
+        try:
+            signature = inspect.signature(sampler.should_sample)
+        except (TypeError, ValueError):
+            # Signatures of builtins may be unavailable, assume the current
+            # one.
+            accepts_kind = True
+        else:
+            accepts_kind = any(
+                parameter.name == "kind"
+                or parameter.kind == parameter.VAR_KEYWORD
+                for parameter in signature.parameters.values()
+            )
+        _ACCEPTS_KIND[sampler_type] = accepts_kind
+    return accepts_kind
+
+
+def call_should_sample(
+    sampler: Sampler,
+    parent_context: Optional["SpanContext"],
+    trace_id: int,
+    span_id: int,
+    name: str,
+    attributes: Optional[Attributes] = None,
+    links: Sequence["Link"] = (),
+    kind: Optional[SpanKind] = None,
+) -> "Decision":
+    """Calls `Sampler.should_sample`, passing ``kind`` only if the sampler
+    accepts it.
+
+    Samplers that implement the signature without ``kind`` are called without
+    it, whether a sampler class accepts it is looked up once.
+    """
+    if _accepts_kind(sampler):
+        return sampler.should_sample(
+            parent_context,
+            trace_id,
+            span_id,
+            name,
+            attributes,
+            links,
+            kind=kind,
+        )
+    return sampler.should_sample(
+        parent_context, trace_id, span_id, name, attributes, links
+    )
 
 
 class StaticSampler(Sampler):
@@ -73,6 +165,7 @@ class StaticSampler(Sampler):
         name: str,
         attributes: Optional[Attributes] = None,
         links: Sequence["Link"] = (),
+        kind: Optional[SpanKind] = None,
     ) -> "Decision":
         return self._decision
 
@@ -111,18 +204,297 @@ class ProbabilitySampler(Sampler):
         name: str,
         attributes: Optional[Attributes] = None,  # TODO
         links: Sequence["Link"] = (),
+        kind: Optional[SpanKind] = None,
+    ) -> "Decision":
+        if parent_context is not None:
+            sampled = parent_context.trace_options.sampled
+        else:
+            sampled = trace_id & self.CHECK_BYTES < self.bound
+        return _SAMPLED if sampled else _NOT_SAMPLED
+
+
+class RateLimitingSampler(Sampler):
+    """Sampler that samples at most ``max_traces_per_second`` new traces.
+
+    Only root spans are subject to the limit, spans with a parent follow the
+    sampled flag of the parent's ``trace_options``. The limit is enforced
+    with a token bucket that refills continuously and holds up to one
+    second's worth of traces, or a single trace for lower rates, so short
+    bursts are sampled as long as the average rate stays below the limit. A
+    rate of ``0`` samples no new traces.
+
+    Args:
+        max_traces_per_second: The maximum rate of sampled new traces.
+    """
+
+    def __init__(self, max_traces_per_second: float):
+        if max_traces_per_second < 0:
+            raise ValueError("max_traces_per_second must not be negative.")
+        self._max_traces_per_second = max_traces_per_second
+        self._max_balance = (
+            max(max_traces_per_second, 1.0) if max_traces_per_second else 0.0
+        )
+        self._balance = self._max_balance
+        self._last_tick = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def max_traces_per_second(self) -> float:
+        return self._max_traces_per_second
+
+    def should_sample(
+        self,
+        parent_context: Optional["SpanContext"],
+        trace_id: int,
+        span_id: int,
+        name: str,
+        attributes: Optional[Attributes] = None,
+        links: Sequence["Link"] = (),
+        kind: Optional[SpanKind] = None,
     ) -> "Decision":
         if parent_context is not None:
-            return Decision(parent_context.trace_options.sampled)
+            if parent_context.trace_options.sampled:
+                return _SAMPLED
+            return _NOT_SAMPLED
 
-        return Decision(trace_id & self.CHECK_BYTES < self.bound)
+        lock = self._lock
+        lock.acquire()
+        try:
+            now = time.monotonic()
+            balance = self._balance + (
+                (now - self._last_tick) * self._max_traces_per_second
+            )
+            self._last_tick = now
+            if balance > self._max_balance:
+                balance = self._max_balance
+            sampled = balance >= 1.0
+            if sampled:
+                balance -= 1.0
+            self._balance = balance
+        finally:
+            lock.release()
+        return _SAMPLED if sampled else _NOT_SAMPLED
 
 
 # Samplers that ignore the parent sampling decision and never/always sample.
-ALWAYS_OFF = StaticSampler(Decision(False))
-ALWAYS_ON = StaticSampler(Decision(True))
+ALWAYS_OFF = StaticSampler(_NOT_SAMPLED)
+ALWAYS_ON = StaticSampler(_SAMPLED)
 
 # Samplers that respect the parent sampling decision, but otherwise
 # never/always sample.
 DEFAULT_OFF = ProbabilitySampler(0.0)
 DEFAULT_ON = ProbabilitySampler(1.0)
+
+
+AttributePredicate = Union[
+    "AttributeValue", Callable[["AttributeValue"], bool]
+]
+
+
+class SamplingRule:
+    """A rule of a `RuleBasedSampler`.
+
+    A rule matches a span if all of its conditions hold, rules without
+    conditions match every span.
+
+    Args:
+        sampler: The sampler that decides for matching spans, or a sampling
+            rate for a `ProbabilitySampler`.
+        name: Matches spans with exactly this name.
+        name_prefix: Matches spans whose name starts with this prefix.
+        name_pattern: Matches spans whose name matches this regular
+            expression, see `re.match`.
+        kind: Matches spans of this kind.
+        attributes: Matches spans that have all of these attributes. Each
+            value is either the attribute value to compare with or a
+            predicate that is called with the attribute value.
+    """
+
+    def __init__(
+        self,
+        sampler: Union[Sampler, float],
+        *,
+        name: Optional[str] = None,
+        name_prefix: Optional[str] = None,
+        name_pattern: Union[str, Pattern[str], None] = None,
+        kind: Optional[SpanKind] = None,
+        attributes: Optional[Mapping[str, AttributePredicate]] = None
+    ) -> None:
+        if not isinstance(sampler, Sampler):
+            sampler = ProbabilitySampler(sampler)
+        if isinstance(name_pattern, str):
+            name_pattern = re.compile(name_pattern)
+        self.sampler = sampler
+        self.name = name
+        self.name_prefix = name_prefix
+        self.name_pattern = name_pattern
+        self.kind = kind
+        self.attributes = dict(attributes) if attributes else {}
+
+    def matches_name(self, name: str) -> bool:
+        """Returns whether the name conditions of this rule match ``name``."""
+        return (
+            (self.name is None or name == self.name)
+            and (self.name_prefix is None or name.startswith(self.name_prefix))
+            and (
+                self.name_pattern is None
+                or self.name_pattern.match(name) is not None
+            )
+        )
+
+
+# An attribute condition compiled for RuleBasedSampler: the attribute key and
+# either a predicate or the value to compare with.
+_CompiledPredicate = Tuple[
+    str,
+    Optional[Callable[["AttributeValue"], bool]],
+    Optional["AttributeValue"],
+]
+
+# A rule compiled for RuleBasedSampler: its span kind, its attribute
+# conditions and its sampler.
+_CompiledRule = Tuple[
+    Optional[SpanKind], Tuple[_CompiledPredicate, ...], Sampler
+]
+
+
+def _compile_predicate(
+    key: str, predicate: AttributePredicate
+) -> _CompiledPredicate:
+    if callable(predicate):
+        return (key, predicate, None)
+    return (key, None, predicate)
+
+
+class RuleBasedSampler(Sampler):
+    """Sampler that delegates to the sampler of the first matching rule.
+
+    The rules are compiled once: the rules whose name conditions match a span
+    name are looked up in a table, so only the span kind and attribute
+    conditions are checked per span. The table remembers up to
+    ``max_cached_names`` distinct span names, names that do not fit are
+    matched against all compiled rules.
+
+    Args:
+        rules: The `SamplingRule` objects in order of precedence.
+        default: The sampler used for spans that match no rule.
+        max_cached_names: The maximum number of span names to remember the
+            matching rules for.
+    """
+
+    def __init__(
+        self,
+        rules: Sequence[SamplingRule],
+        default: Sampler = ALWAYS_ON,
+        max_cached_names: int = 1024,
+    ) -> None:
+        self._rules = tuple(rules)
+        self._default = default
+        self._max_cached_names = max_cached_names
+        self._compiled = tuple(
+            (
+                rule,
+                (
+                    rule.kind,
+                    tuple(
+                        _compile_predicate(key, predicate)
+                        for key, predicate in rule.attributes.items()
+                    ),
+                    rule.sampler,
+                ),
+            )
+            for rule in self._rules
+        )  # type: Tuple[Tuple[SamplingRule, _CompiledRule], ...]
+        # Rules with exact names are indexed by name, only the others need to
+        # be matched against new span names. Both hold the indices of the
+        # rules, which are their precedence.
+        self._rules_by_name = {}  # type: Dict[str, Tuple[int, ...]]
+        unnamed_rules = []  # type: List[int]
+        for index, rule in enumerate(self._rules):
+            if rule.name is None:
+                unnamed_rules.append(index)
+            else:
+                named_rules = self._rules_by_name.get(rule.name, ())
+                self._rules_by_name[rule.name] = named_rules + (index,)
+        self._unnamed_rules = tuple(unnamed_rules)
+        self._compiled_rules = {}  # type: Dict[str, Tuple[_CompiledRule, ...]]
+
+    @property
+    def rules(self) -> Tuple[SamplingRule, ...]:
+        return self._rules
+
+    def _compile(self, name: str) -> Tuple[_CompiledRule, ...]:
+        """Returns the compiled rules whose name conditions match ``name``."""
+        candidates = self._rules_by_name.get(name, ())
+        if self._unnamed_rules:
+            # Restore the order of precedence across both tables.
+            candidates = tuple(sorted(candidates + self._unnamed_rules))
+        compiled = self._compiled
+        return tuple(
+            compiled[index][1]
+            for index in candidates
+            if compiled[index][0].matches_name(name)
+        )
+
+    def _iter_matching(self, name: str) -> Iterator[_CompiledRule]:
+        """Yields the compiled rules whose name conditions match ``name``,
+        for names that are not in the table."""
+        for rule, compiled_rule in self._compiled:
+            if rule.matches_name(name):
+                yield compiled_rule
+
+    def should_sample(
+        self,
+        parent_context: Optional["SpanContext"],
+        trace_id: int,
+        span_id: int,
+        name: str,
+        attributes: Optional[Attributes] = None,
+        links: Sequence["Link"] = (),
+        kind: Optional[SpanKind] = None,
+    ) -> "Decision":
+        compiled_rules = self._compiled_rules.get(
+            name
+        )  # type: Optional[Iterable[_CompiledRule]]
+        if compiled_rules is None:
+            if len(self._compiled_rules) < self._max_cached_names:
+                compiled_rules = self._compile(name)
+                self._compiled_rules[name] = compiled_rules
+            else:
+                compiled_rules = self._iter_matching(name)
+        sampler = self._default
+        for rule_kind, predicates, rule_sampler in compiled_rules:
+            if rule_kind is not None and rule_kind is not kind:
+                continue
+            if predicates and not _match_attributes(predicates, attributes):
+                continue
+            sampler = rule_sampler
+            break
+        return call_should_sample(
+            sampler,
+            parent_context,
+            trace_id,
+            span_id,
+            name,
+            attributes,
+            links,
+            kind,
+        )
+
+
+def _match_attributes(
+    predicates: Tuple[_CompiledPredicate, ...],
+    attributes: Optional[Attributes],
+) -> bool:
+    if not attributes:
+        return False
+    for key, predicate, expected in predicates:
+        if key not in attributes:
+            return False
+        value = attributes[key]
+        if predicate is not None:
+            if not predicate(value):
+                return False
+        elif value != expected:
+            return False
+    return True
@@ -161,6 +161,8 @@ class Status:
         description: An optional description of the status.
     """
 
+    __slots__ = ("_canonical_code", "_description")
+
     def __init__(
         self,
         canonical_code: StatusCanonicalCode = StatusCanonicalCode.OK,
@@ -10,3 +10,12 @@ except AttributeError:
 
     def time_ns() -> int:
         return int(time.time() * 1e9)
+
+
+try:
+    perf_counter_ns = time.perf_counter_ns
+# Python versions < 3.7
+except AttributeError:
+
+    def perf_counter_ns() -> int:
+        return int(time.perf_counter() * 1e9)
@@ -210,3 +210,20 @@ class TestTraceContextFormat(unittest.TestCase):
             },
         )
         self.assertEqual(span_context.trace_state["foo"], "1")
+
+    def test_tracestate_shared(self):
+        """Equal tracestate headers share an immutable trace state."""
+        carrier = {
+            "traceparent": [
+                "00-12345678901234567890123456789012-1234567890123456-00"
+            ],
+            "tracestate": ["foo=1,bar=2"],
+        }
+        first = FORMAT.extract(get_as_list, carrier)
+        second = FORMAT.extract(get_as_list, carrier)
+        self.assertIs(first.trace_state, second.trace_state)
+
+        no_tracestate = FORMAT.extract(
+            get_as_list, {"traceparent": carrier["traceparent"]}
+        )
+        self.assertIs(no_tracestate.trace_state, trace.DEFAULT_TRACE_STATE)
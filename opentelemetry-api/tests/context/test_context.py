@@ -0,0 +1,120 @@
+# Copyright 2019, OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import unittest
+
+from opentelemetry import context
+from opentelemetry.context import Context, ContextKey
+from opentelemetry.context.thread_local_context import (
+    ThreadLocalRuntimeContext,
+)
+
+try:
+    from opentelemetry.context.async_context import AsyncRuntimeContext
+except ImportError:
+    AsyncRuntimeContext = None
+
+
+class TestContextKey(unittest.TestCase):
+    def test_attach_detach(self):
+        key = ContextKey("test_attach_detach", "default")
+        self.assertEqual(key.get(), "default")
+        token = key.attach("outer")
+        inner_token = key.attach("inner")
+        self.assertEqual(key.get(), "inner")
+        key.detach(inner_token)
+        self.assertEqual(key.get(), "outer")
+        key.detach(token)
+        self.assertEqual(key.get(), "default")
+
+    def test_shared_with_context(self):
+        key = ContextKey("test_shared_with_context")
+        self.assertIsNone(key.get())
+        token = key.attach(1)
+        self.assertEqual(Context.test_shared_with_context, 1)
+        key.detach(token)
+        Context.test_shared_with_context = 2
+        self.assertEqual(key.get(), 2)
+        Context.test_shared_with_context = None
+
+    def test_suppress_instrumentation(self):
+        self.assertFalse(context.is_instrumentation_suppressed())
+        with Context.use(suppress_instrumentation=True):
+            self.assertTrue(context.is_instrumentation_suppressed())
+        self.assertFalse(context.is_instrumentation_suppressed())
+
+    def test_use_restores_on_error(self):
+        with self.assertRaises(ValueError):
+            with Context.use(suppress_instrumentation=True):
+                raise ValueError
+        self.assertFalse(context.SUPPRESS_INSTRUMENTATION.get())
+
+
+class TestCapture(unittest.TestCase):
+    def for_each_runtime_context(self, test):
+        # Slots are registered on BaseRuntimeContext, so each runtime context
+        # gets its own slot name.
+        runtime_contexts = [ThreadLocalRuntimeContext()]
+        if AsyncRuntimeContext is not None:
+            runtime_contexts.append(AsyncRuntimeContext())
+        for runtime_context in runtime_contexts:
+            name = "{}_{}".format(
+                type(runtime_context).__name__, test.__name__
+            )
+            with self.subTest(name):
+                test(runtime_context, runtime_context.register_slot(name))
+
+    def test_capture(self):
+        self.for_each_runtime_context(self.check_capture)
+
+    def check_capture(self, runtime_context, slot):
+        slot.set("captured")
+        snapshot = runtime_context.capture()
+        slot.set("changed")
+
+        def work():
+            self.assertEqual(slot.get(), "captured")
+            slot.set("inner")
+            return slot.get()
+
+        self.assertEqual(snapshot.run(work), "inner")
+        self.assertEqual(snapshot.run(work), "inner")
+        self.assertEqual(slot.get(), "changed")
+
+    def test_with_current_context_threads(self):
+        self.for_each_runtime_context(self.check_with_current_context_threads)
+
+    def check_with_current_context_threads(self, runtime_context, slot):
+        slot.set("main")
+        barrier = threading.Barrier(2)
+        results = []
+
+        def work(value):
+            # Both threads run the same snapshot at the same time.
+            barrier.wait()
+            results.append(slot.get())
+            slot.set(value)
+
+        wrapped = runtime_context.with_current_context(work)
+        threads = [
+            threading.Thread(target=wrapped, args=(value,))
+            for value in ("a", "b")
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(results, ["main", "main"])
+        self.assertEqual(slot.get(), "main")
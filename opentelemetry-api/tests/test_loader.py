@@ -14,9 +14,11 @@
 
 import os
 import sys
+import threading
 import unittest
 from importlib import reload
 from typing import Any, Callable
+from unittest import mock
 
 from opentelemetry import trace
 from opentelemetry.util import loader
@@ -80,6 +82,26 @@ class TestLoader(unittest.TestCase):
             loader.set_preferred_default_implementation
         )
 
+    def test_load_once(self):
+        factory = mock.Mock(side_effect=get_opentelemetry_implementation)
+        trace.set_preferred_tracer_source_implementation(factory)
+        barrier = threading.Barrier(8)
+        sources = []
+
+        def load():
+            barrier.wait()
+            sources.append(trace.tracer_source())
+
+        threads = [threading.Thread(target=load) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        factory.assert_called_once_with(trace.TracerSource)
+        self.assertEqual(sources, [DUMMY_TRACER_SOURCE] * 8)
+        self.assertIs(trace.tracer_source(), DUMMY_TRACER_SOURCE)
+
     def test_try_set_again(self):
         self.assertTrue(trace.tracer_source())
         # Try setting after the tracer_source has already been created:
@@ -25,6 +25,11 @@ class TestDefaultSpan(unittest.TestCase):
         span = trace.DefaultSpan(context)
         self.assertEqual(context, span.get_context())
 
+    def test_immutable(self):
+        span = trace.DefaultSpan(trace.INVALID_SPAN_CONTEXT)
+        with self.assertRaises(AttributeError):
+            span.name = "span"  # pylint: disable=assigning-non-slot
+
     def test_invalid_span(self):
         self.assertIsNotNone(trace.INVALID_SPAN)
         self.assertIsNotNone(trace.INVALID_SPAN.get_context())
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import unittest
+from unittest import mock
 
 from opentelemetry import trace
 from opentelemetry.trace import sampling
@@ -153,6 +154,21 @@ class TestSampler(unittest.TestCase):
             ).sampled
         )
 
+    def test_probability_sampler_shared_decisions(self):
+        sampler = sampling.ProbabilitySampler(0.5)
+        self.assertIs(
+            sampler.should_sample(None, 0x1, 0xDEADBEEF, "span name"),
+            sampler.should_sample(None, 0x2, 0xDEADBEEF, "span name"),
+        )
+        self.assertIs(
+            sampler.should_sample(
+                None, 0x8000000000000000, 0xDEADBEEF, "span name"
+            ),
+            sampler.should_sample(
+                None, 0x8000000000000001, 0xDEADBEEF, "span name"
+            ),
+        )
+
     def test_probability_sampler_zero(self):
         default_off = sampling.ProbabilitySampler(0.0)
         self.assertFalse(
@@ -221,3 +237,197 @@ class TestSampler(unittest.TestCase):
         #     sampling.ProbabilitySampler.get_bound_for_rate(1 - 2 ** -64)),
         #     0xffffffffffffffff,
         # )
+
+
+class TestRuleBasedSampler(unittest.TestCase):
+    def should_sample(self, sampler, name, attributes=None, kind=None):
+        return sampler.should_sample(
+            None, 0xDEADBEEF, 0xDEADBEF0, name, attributes, (), kind
+        ).sampled
+
+    def test_name_rules(self):
+        sampler = sampling.RuleBasedSampler(
+            [
+                sampling.SamplingRule(sampling.ALWAYS_ON, name="/health/ok"),
+                sampling.SamplingRule(0.0, name_prefix="/health"),
+                sampling.SamplingRule(0.0, name_pattern=r"internal\.\w+$"),
+            ]
+        )
+        self.assertTrue(self.should_sample(sampler, "/health/ok"))
+        self.assertFalse(self.should_sample(sampler, "/health"))
+        self.assertFalse(self.should_sample(sampler, "/healthz"))
+        self.assertFalse(self.should_sample(sampler, "internal.flush"))
+        self.assertTrue(self.should_sample(sampler, "internal.flush.x"))
+        self.assertTrue(self.should_sample(sampler, "/users"))
+
+    def test_rule_order(self):
+        sampler = sampling.RuleBasedSampler(
+            [
+                sampling.SamplingRule(0.0, name_prefix="/"),
+                sampling.SamplingRule(sampling.ALWAYS_ON, name="/users"),
+            ]
+        )
+        self.assertFalse(self.should_sample(sampler, "/users"))
+
+    def test_kind_and_attributes(self):
+        sampler = sampling.RuleBasedSampler(
+            [
+                sampling.SamplingRule(
+                    sampling.ALWAYS_OFF,
+                    kind=trace.SpanKind.SERVER,
+                    attributes={
+                        "http.method": "GET",
+                        "http.status_code": lambda code: code < 400,
+                    },
+                )
+            ]
+        )
+        ok_get = {"http.method": "GET", "http.status_code": 200}
+        self.assertFalse(
+            self.should_sample(sampler, "/", ok_get, trace.SpanKind.SERVER)
+        )
+        self.assertTrue(
+            self.should_sample(sampler, "/", ok_get, trace.SpanKind.CLIENT)
+        )
+        self.assertTrue(
+            self.should_sample(
+                sampler,
+                "/",
+                {"http.method": "GET", "http.status_code": 500},
+                trace.SpanKind.SERVER,
+            )
+        )
+        self.assertTrue(
+            self.should_sample(
+                sampler, "/", {"http.method": "GET"}, trace.SpanKind.SERVER
+            )
+        )
+        self.assertTrue(
+            self.should_sample(sampler, "/", None, trace.SpanKind.SERVER)
+        )
+
+    def test_default_sampler(self):
+        sampler = sampling.RuleBasedSampler(
+            [sampling.SamplingRule(sampling.ALWAYS_ON, name="/users")],
+            default=sampling.ALWAYS_OFF,
+        )
+        self.assertTrue(self.should_sample(sampler, "/users"))
+        self.assertFalse(self.should_sample(sampler, "/orders"))
+
+    def test_sampler_without_kind(self):
+        class LegacySampler(sampling.Sampler):
+            # pylint: disable=arguments-differ,unused-argument
+            def should_sample(
+                self,
+                parent_context,
+                trace_id,
+                span_id,
+                name,
+                attributes=None,
+                links=(),
+            ):
+                return sampling.Decision(True)
+
+        sampler = sampling.RuleBasedSampler(
+            [sampling.SamplingRule(LegacySampler(), name="/users")],
+            default=LegacySampler(),
+        )
+        self.assertTrue(
+            self.should_sample(sampler, "/users", kind=trace.SpanKind.SERVER)
+        )
+        self.assertTrue(
+            self.should_sample(sampler, "/orders", kind=trace.SpanKind.SERVER)
+        )
+
+    def test_rate_respects_parent(self):
+        sampler = sampling.RuleBasedSampler(
+            [sampling.SamplingRule(0.0, name="/health")]
+        )
+        self.assertTrue(
+            sampler.should_sample(
+                trace.SpanContext(
+                    0xDEADBEEF, 0xDEADBEF0, trace_options=TO_SAMPLED
+                ),
+                0xDEADBEEF,
+                0xDEADBEF1,
+                "/health",
+            ).sampled
+        )
+
+    def test_max_cached_names(self):
+        sampler = sampling.RuleBasedSampler(
+            [sampling.SamplingRule(0.0, name_prefix="/health")],
+            max_cached_names=2,
+        )
+        for name in ("/a", "/b", "/health", "/healthz"):
+            self.assertEqual(self.should_sample(sampler, name), name[1] != "h")
+        # pylint: disable=protected-access
+        self.assertEqual(sorted(sampler._compiled_rules), ["/a", "/b"])
+        # Names beyond the table are matched against the compiled rules.
+        with mock.patch.object(sampler, "_compile") as compile_rules:
+            for index in range(10):
+                name = "/health/{}".format(index)
+                self.assertFalse(self.should_sample(sampler, name))
+                self.assertTrue(self.should_sample(sampler, str(index)))
+        compile_rules.assert_not_called()
+        self.assertEqual(sorted(sampler._compiled_rules), ["/a", "/b"])
+        self.assertTrue(self.should_sample(sampler, "/a"))
+
+
+class TestRateLimitingSampler(unittest.TestCase):
+    def should_sample(self, sampler, parent_context=None):
+        return sampler.should_sample(
+            parent_context, 0xDEADBEEF, 0xDEADBEF0, "span name"
+        ).sampled
+
+    @mock.patch("time.monotonic")
+    def test_rate_limit(self, monotonic):
+        monotonic.return_value = 100.0
+        sampler = sampling.RateLimitingSampler(2)
+
+        # The bucket starts full.
+        self.assertTrue(self.should_sample(sampler))
+        self.assertTrue(self.should_sample(sampler))
+        self.assertFalse(self.should_sample(sampler))
+
+        monotonic.return_value = 100.25
+        self.assertFalse(self.should_sample(sampler))
+        monotonic.return_value = 100.5
+        self.assertTrue(self.should_sample(sampler))
+        self.assertFalse(self.should_sample(sampler))
+
+        # The bucket never holds more than a second's worth of traces.
+        monotonic.return_value = 200.0
+        self.assertTrue(self.should_sample(sampler))
+        self.assertTrue(self.should_sample(sampler))
+        self.assertFalse(self.should_sample(sampler))
+
+    @mock.patch("time.monotonic")
+    def test_low_rate(self, monotonic):
+        monotonic.return_value = 100.0
+        sampler = sampling.RateLimitingSampler(0.1)
+        self.assertTrue(self.should_sample(sampler))
+        self.assertFalse(self.should_sample(sampler))
+        monotonic.return_value = 109.0
+        self.assertFalse(self.should_sample(sampler))
+        monotonic.return_value = 110.0
+        self.assertTrue(self.should_sample(sampler))
+
+    def test_zero_rate(self):
+        sampler = sampling.RateLimitingSampler(0)
+        self.assertFalse(self.should_sample(sampler))
+
+    def test_negative_rate(self):
+        with self.assertRaises(ValueError):
+            sampling.RateLimitingSampler(-1)
+
+    def test_parent(self):
+        sampler = sampling.RateLimitingSampler(0)
+        sampled_parent = trace.SpanContext(
+            0xDEADBEEF, 0xDEADBEF0, trace_options=TO_SAMPLED
+        )
+        unsampled_parent = trace.SpanContext(
+            0xDEADBEEF, 0xDEADBEF0, trace_options=TO_DEFAULT
+        )
+        self.assertTrue(self.should_sample(sampler, sampled_parent))
+        self.assertFalse(self.should_sample(sampler, unsampled_parent))
@@ -0,0 +1,64 @@
+# Copyright 2019, OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from opentelemetry import trace
+
+
+class TestTraceState(unittest.TestCase):
+    def test_immutable(self):
+        trace_state = trace.TraceState([("foo", "1")])
+        with self.assertRaises(TypeError):
+            # pylint: disable=unsupported-assignment-operation
+            trace_state["bar"] = "2"  # type: ignore
+        with self.assertRaises(AttributeError):
+            trace_state.other = None  # type: ignore
+
+    def test_add(self):
+        trace_state = trace.TraceState([("foo", "1")])
+        self.assertEqual(trace_state.to_header(), "foo=1")
+        added = trace_state.add("bar", "2")
+        self.assertEqual(list(added.items()), [("bar", "2"), ("foo", "1")])
+        self.assertEqual(added.to_header(), "bar=2,foo=1")
+        self.assertEqual(list(trace_state.items()), [("foo", "1")])
+
+        # Existing keys are not overwritten.
+        self.assertIs(added.add("foo", "3"), added)
+        self.assertEqual(
+            trace.DEFAULT_TRACE_STATE.add("foo", "1").to_header(), "foo=1"
+        )
+
+    def test_max_entries(self):
+        trace_state = trace.TraceState(
+            ("key{}".format(index), "value")
+            for index in range(trace.TraceState.MAX_ENTRIES)
+        )
+        self.assertIs(trace_state.add("other", "value"), trace_state)
+
+    def test_update(self):
+        trace_state = trace.TraceState([("foo", "1"), ("bar", "2")])
+        updated = trace_state.update("bar", "3")
+        self.assertEqual(list(updated.items()), [("bar", "3"), ("foo", "1")])
+        self.assertEqual(updated.to_header(), "bar=3,foo=1")
+        self.assertEqual(trace_state["bar"], "2")
+        self.assertIs(trace_state.update("baz", "4"), trace_state)
+
+    def test_delete(self):
+        trace_state = trace.TraceState([("foo", "1"), ("bar", "2")])
+        deleted = trace_state.delete("foo")
+        self.assertEqual(deleted, {"bar": "2"})
+        self.assertEqual(deleted.to_header(), "bar=2")
+        self.assertEqual(len(trace_state), 2)
+        self.assertIs(trace_state.delete("baz"), trace_state)
@@ -97,7 +97,7 @@ class B3Format(HTTPTextFormat):
             trace_id=int(trace_id, 16),
             span_id=int(span_id, 16),
             trace_options=trace.TraceOptions(options),
-            trace_state=trace.TraceState(),
+            trace_state=trace.DEFAULT_TRACE_STATE,
         )
 
     @classmethod
@@ -15,101 +15,62 @@
 
 import atexit
 import logging
-import random
+import sys
 import threading
-from contextlib import contextmanager
+from collections import OrderedDict, namedtuple
 from numbers import Number
-from types import TracebackType
-from typing import Iterator, Optional, Sequence, Tuple, Type
+from types import MappingProxyType, TracebackType
+from typing import (
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+)
 
 from opentelemetry import trace as trace_api
 from opentelemetry.context import Context
+from opentelemetry.context.base_context import BaseRuntimeContext
 from opentelemetry.sdk import util
-from opentelemetry.sdk.util import BoundedDict, BoundedList
+from opentelemetry.sdk.trace.active_span import _ActiveSpan
+from opentelemetry.sdk.trace.id_generator import IdGenerator, RandomIdGenerator
+from opentelemetry.sdk.trace.limits import (
+    MAX_NUM_ATTRIBUTES,
+    MAX_NUM_EVENTS,
+    MAX_NUM_LINKS,
+    SpanLimits,
+)
+from opentelemetry.sdk.trace.readable_span import (
+    _PRIMITIVE_ATTRIBUTE_TYPES,
+    ReadableSpan,
+    _AttributesDict,
+)
+from opentelemetry.sdk.trace.span_pool import SpanPool
+from opentelemetry.sdk.trace.span_processor import (
+    MultiSpanProcessor,
+    SpanProcessor,
+)
 from opentelemetry.trace import SpanContext, sampling
 from opentelemetry.trace.status import Status, StatusCanonicalCode
-from opentelemetry.util import time_ns, types
+from opentelemetry.util import perf_counter_ns, time_ns, types
 
 logger = logging.getLogger(__name__)
 
-MAX_NUM_ATTRIBUTES = 32
-MAX_NUM_EVENTS = 128
-MAX_NUM_LINKS = 32
+# Status is immutable, so all spans that end without one share this.
+_OK_STATUS = Status(canonical_code=StatusCanonicalCode.OK)
 
+# Span names and attribute keys are mostly the same few strings, but are
+# often built anew for every span, e.g. from URL paths or format strings.
+# Spans store canonical instances instead, each table bounded so that
+# high-cardinality span names can not crowd out attribute keys.
+_SPAN_NAMES = util.InternTable(1024)
+_ATTRIBUTE_KEYS = util.InternTable(1024, max_length=128)
 
-class SpanProcessor:
-    """Interface which allows hooks for SDK's `Span` start and end method
-    invocations.
-
-    Span processors can be registered directly using
-    :func:`TracerSource.add_span_processor` and they are invoked
-    in the same order as they were registered.
-    """
-
-    def on_start(self, span: "Span") -> None:
-        """Called when a :class:`opentelemetry.trace.Span` is started.
-
-        This method is called synchronously on the thread that starts the
-        span, therefore it should not block or throw an exception.
-
-        Args:
-            span: The :class:`opentelemetry.trace.Span` that just started.
-        """
-
-    def on_end(self, span: "Span") -> None:
-        """Called when a :class:`opentelemetry.trace.Span` is ended.
-
-        This method is called synchronously on the thread that ends the
-        span, therefore it should not block or throw an exception.
-
-        Args:
-            span: The :class:`opentelemetry.trace.Span` that just ended.
-        """
-
-    def shutdown(self) -> None:
-        """Called when a :class:`opentelemetry.sdk.trace.Tracer` is shutdown.
-        """
-
-    def force_flush(self, timeout_millis: int = 30000) -> bool:
-        """Export all ended spans to the configured Exporter that have not yet
-        been exported.
-
-        Args:
-            timeout_millis: The maximum amount of time to wait for spans to be
-                exported.
-
-        Returns:
-            False if the timeout is exceeded, True otherwise.
-        """
-
-
-class MultiSpanProcessor(SpanProcessor):
-    """Implementation of :class:`SpanProcessor` that forwards all received
-    events to a list of `SpanProcessor`.
-    """
-
-    def __init__(self):
-        # use a tuple to avoid race conditions when adding a new span and
-        # iterating through it on "on_start" and "on_end".
-        self._span_processors = ()  # type: Tuple[SpanProcessor, ...]
-        self._lock = threading.Lock()
-
-    def add_span_processor(self, span_processor: SpanProcessor) -> None:
-        """Adds a SpanProcessor to the list handled by this instance."""
-        with self._lock:
-            self._span_processors = self._span_processors + (span_processor,)
-
-    def on_start(self, span: "Span") -> None:
-        for sp in self._span_processors:
-            sp.on_start(span)
-
-    def on_end(self, span: "Span") -> None:
-        for sp in self._span_processors:
-            sp.on_end(span)
-
-    def shutdown(self) -> None:
-        for sp in self._span_processors:
-            sp.shutdown()
+_DEFAULT_SPAN_LIMITS = SpanLimits()
 
 
 class Span(trace_api.Span):
@@ -118,6 +79,16 @@ class Span(trace_api.Span):
     Users should create `Span` objects via the `Tracer` instead of this
     constructor.
 
+    Spans use ``__slots__`` and only allocate their attribute and event
+    containers once something is recorded. The containers are plain builtins
+    guarded by the span's own lock, which every mutation acquires exactly
+    once; once a limit is reached the oldest entry is dropped and counted in
+    `dropped_attributes`, `dropped_events` or `dropped_links`. When the span
+    ends its containers are frozen and span processors receive a
+    `ReadableSpan` record of it instead of the live span. Span names and
+    attribute keys are interned in bounded tables, so that the spans of an
+    operation share these strings even if they were built for every span.
+
     Args:
         name: The name of the operation this span represents
         context: The immutable span context
@@ -131,14 +102,48 @@ class Span(trace_api.Span):
         links: Links to other spans to be exported
         span_processor: `SpanProcessor` to invoke when starting and ending
             this `Span`.
+        thread_safe: Whether the span may be mutated from several threads.
+            Spans confined to the thread that created them can skip locking.
+        limits: The `SpanLimits` of the span.
+        validate_attributes: Whether attribute values are validated when
+            they are set. If ``False`` they are stored as given and
+            validated by `ReadableSpan.resolve_attributes` on export.
     """
 
-    # Initialize these lazily assuming most spans won't have them.
-    empty_attributes = BoundedDict(MAX_NUM_ATTRIBUTES)
-    empty_events = BoundedList(MAX_NUM_EVENTS)
-    empty_links = BoundedList(MAX_NUM_LINKS)
-
-    def __init__(
+    __slots__ = (
+        "name",
+        "context",
+        "parent",
+        "sampler",
+        "trace_config",
+        "resource",
+        "kind",
+        "instrumentation_info",
+        "span_processor",
+        "status",
+        "_set_status_on_exception",
+        "_validate_attributes",
+        "_limits",
+        "_lock",
+        "_attributes",
+        "_events",
+        "_links",
+        "_dropped_attributes",
+        "_dropped_events",
+        "_dropped_links",
+        "_start_time",
+        "_end_time",
+        "_start_perf_counter",
+        "_released",
+    )
+
+    # Read-only placeholders shared by all spans that have no attributes,
+    # events or links.
+    empty_attributes = MappingProxyType({})  # type: types.Attributes
+    empty_events = ()  # type: Sequence[trace_api.Event]
+    empty_links = ()  # type: Sequence[trace_api.Link]
+
+    def __init__(  # pylint: disable=too-many-locals
         self,
         name: str,
         context: trace_api.SpanContext,
@@ -153,9 +158,12 @@ class Span(trace_api.Span):
         span_processor: SpanProcessor = SpanProcessor(),
         instrumentation_info: "InstrumentationInfo" = None,
         set_status_on_exception: bool = True,
+        thread_safe: bool = True,
+        validate_attributes: bool = True,
+        limits: SpanLimits = _DEFAULT_SPAN_LIMITS,
     ) -> None:
 
-        self.name = name
+        self.name = _SPAN_NAMES.intern(name)
         self.context = context
         self.parent = parent
         self.sampler = sampler
@@ -163,84 +171,211 @@ class Span(trace_api.Span):
         self.resource = resource
         self.kind = kind
         self._set_status_on_exception = set_status_on_exception
+        self._validate_attributes = validate_attributes
+        self._limits = limits
 
         self.span_processor = span_processor
         self.status = None
-        self._lock = threading.Lock()
-
-        if attributes is None:
-            self.attributes = Span.empty_attributes
-        else:
-            self.attributes = BoundedDict.from_map(
-                MAX_NUM_ATTRIBUTES, attributes
-            )
-
-        if events is None:
-            self.events = Span.empty_events
-        else:
-            self.events = BoundedList.from_seq(MAX_NUM_EVENTS, events)
-
-        if links is None:
-            self.links = Span.empty_links
-        else:
-            self.links = BoundedList.from_seq(MAX_NUM_LINKS, links)
+        self._lock = (
+            threading.Lock() if thread_safe else None
+        )  # type: Optional[threading.Lock]
+
+        self._attributes = None  # type: Optional[_AttributesDict]
+        self._dropped_attributes = 0
+        if attributes:
+            for key, value in attributes.items():
+                self._set_attribute_locked(key, value)
+
+        self._events = None  # type: Optional[List[trace_api.Event]]
+        self._dropped_events = 0
+        if events:
+            events = list(map(limits.limit_event, events))
+            if len(events) > limits.max_events:
+                self._dropped_events = len(events) - limits.max_events
+                del events[: self._dropped_events]
+            self._events = events
+
+        self._links = Span.empty_links  # type: Sequence[trace_api.Link]
+        self._dropped_links = 0
+        if links:
+            links = tuple(links)
+            if len(links) > limits.max_links:
+                self._dropped_links = len(links) - limits.max_links
+                links = links[self._dropped_links :]
+            self._links = links
 
         self._end_time = None  # type: Optional[int]
         self._start_time = None  # type: Optional[int]
+        self._start_perf_counter = None  # type: Optional[int]
         self.instrumentation_info = instrumentation_info
+        self._released = False
 
     @property
     def start_time(self):
         return self._start_time
 
+    def _time_ns(self) -> int:
+        """Returns the current time, measured from the span's start.
+
+        Spans started without an explicit start time read the wall clock once
+        and measure the time that passed since with a monotonic clock, so
+        durations are accurate and never negative even if the wall clock is
+        adjusted while the span is running.
+        """
+        start_perf_counter = self._start_perf_counter
+        if start_perf_counter is None:
+            return time_ns()
+        return self._start_time + (perf_counter_ns() - start_perf_counter)
+
     @property
     def end_time(self):
         return self._end_time
 
+    @property
+    def attributes(self) -> types.Attributes:
+        if self._attributes is None:
+            return Span.empty_attributes
+        return self._attributes
+
+    @property
+    def events(self) -> Sequence[trace_api.Event]:
+        if self._events is None:
+            return Span.empty_events
+        return self._events
+
+    @property
+    def links(self) -> Sequence[trace_api.Link]:
+        return self._links
+
+    @property
+    def dropped_attributes(self) -> int:
+        """The number of attributes dropped because of
+        `SpanLimits.max_attributes`."""
+        return self._dropped_attributes
+
+    @property
+    def dropped_events(self) -> int:
+        """The number of events dropped because of `SpanLimits.max_events`."""
+        return self._dropped_events
+
+    @property
+    def dropped_links(self) -> int:
+        """The number of links dropped because of `SpanLimits.max_links`."""
+        return self._dropped_links
+
     def __repr__(self):
         return '{}(name="{}", context={})'.format(
             type(self).__name__, self.name, self.context
         )
 
     def __str__(self):
-        return (
-            '{}(name="{}", context={}, kind={}, '
-            "parent={}, start_time={}, end_time={})"
-        ).format(
-            type(self).__name__,
-            self.name,
-            self.context,
-            self.kind,
-            repr(self.parent),
-            util.ns_to_iso_str(self.start_time) if self.start_time else "None",
-            util.ns_to_iso_str(self.end_time) if self.end_time else "None",
-        )
+        return ReadableSpan.__str__(self)
 
     def get_context(self):
         return self.context
 
     def set_attribute(self, key: str, value: types.AttributeValue) -> None:
-        with self._lock:
-            if not self.is_recording_events():
-                return
-            has_ended = self.end_time is not None
+        if not self.is_recording_events():
+            return
+        if self._validate_attributes and not self._is_valid_attribute_value(
+            value
+        ):
+            return
+
+        lock = self._lock
+        if lock is not None:
+            lock.acquire()
+        try:
+            has_ended = self._end_time is not None
             if not has_ended:
-                if self.attributes is Span.empty_attributes:
-                    self.attributes = BoundedDict(MAX_NUM_ATTRIBUTES)
+                self._set_attribute_locked(key, value)
+        finally:
+            if lock is not None:
+                lock.release()
         if has_ended:
-            logger.warning("Setting attribute on ended span.")
+            self._warn_ended("Setting attribute on ended span.")
+
+    def set_attributes(
+        self, attributes: Mapping[str, types.AttributeValue]
+    ) -> None:
+        if not self.is_recording_events():
+            return
+        # Validate outside of the lock, invalid values are skipped like in
+        # set_attribute.
+        if self._validate_attributes:
+            items = [
+                item
+                for item in attributes.items()
+                if self._is_valid_attribute_value(item[1])
+            ]
+        else:
+            items = attributes.items()
+        if not items:
             return
 
+        lock = self._lock
+        if lock is not None:
+            lock.acquire()
+        try:
+            has_ended = self._end_time is not None
+            if not has_ended:
+                set_attribute_locked = self._set_attribute_locked
+                for key, value in items:
+                    set_attribute_locked(key, value)
+        finally:
+            if lock is not None:
+                lock.release()
+        if has_ended:
+            self._warn_ended("Setting attribute on ended span.")
+
+    def _set_attribute_locked(
+        self, key: str, value: types.AttributeValue
+    ) -> None:
+        """Inserts an attribute, dropping the oldest one if the span is full.
+
+        Must be called with the span's lock held or before the span is shared
+        with other threads.
+        """
+        limits = self._limits
+        if limits.max_attributes == 0:
+            self._dropped_attributes += 1
+            return
+        key = _ATTRIBUTE_KEYS.intern(key)
+        attributes = self._attributes
+        if attributes is None:
+            attributes = self._attributes = _AttributesDict()
+        if key in attributes:
+            # Re-inserting moves the key to the end so that it is the last
+            # one to be dropped.
+            del attributes[key]
+        elif len(attributes) >= limits.max_attributes:
+            del attributes[next(iter(attributes))]
+            self._dropped_attributes += 1
+        if limits.max_attribute_length is not None:
+            value = limits.truncate_attribute_value(value)
+        attributes[key] = value
+
+    @classmethod
+    def _is_valid_attribute_value(
+        cls, value: types.AttributeValue, allow_lazy: bool = True
+    ) -> bool:
+        """Checks the type of an attribute value, logging invalid ones."""
+        if type(value) in _PRIMITIVE_ATTRIBUTE_TYPES:
+            # Skips the slower abstract base class checks, which would also
+            # scan strings character by character as sequences.
+            return True
+        if allow_lazy and isinstance(value, trace_api.LazyAttributeValue):
+            # Checked once the value is resolved on export.
+            return True
         if isinstance(value, Sequence):
-            error_message = self._check_attribute_value_sequence(value)
+            error_message = cls._check_attribute_value_sequence(value)
             if error_message is not None:
                 logger.warning("%s in attribute value sequence", error_message)
-                return
-        elif not isinstance(value, (bool, str, Number, Sequence)):
+                return False
+        elif not isinstance(value, (bool, str, Number)):
             logger.warning("invalid type for attribute value")
-            return
-
-        self.attributes[key] = value
+            return False
+        return True
 
     @staticmethod
     def _check_attribute_value_sequence(sequence: Sequence) -> Optional[str]:
@@ -273,76 +408,176 @@ class Span(trace_api.Span):
             trace_api.Event(
                 name,
                 Span.empty_attributes if attributes is None else attributes,
-                time_ns() if timestamp is None else timestamp,
+                self._time_ns() if timestamp is None else timestamp,
             )
         )
 
     def add_lazy_event(self, event: trace_api.Event) -> None:
-        with self._lock:
-            if not self.is_recording_events():
-                return
-            has_ended = self.end_time is not None
+        self.add_events((event,))
+
+    def add_events(self, events: Iterable[trace_api.Event]) -> None:
+        if not self.is_recording_events():
+            return
+        lock = self._lock
+        if lock is not None:
+            lock.acquire()
+        try:
+            has_ended = self._end_time is not None
             if not has_ended:
-                if self.events is Span.empty_events:
-                    self.events = BoundedList(MAX_NUM_EVENTS)
+                limits = self._limits
+                span_events = self._events
+                if span_events is None:
+                    span_events = self._events = []
+                span_events.extend(map(limits.limit_event, events))
+                excess = len(span_events) - limits.max_events
+                if excess > 0:
+                    del span_events[:excess]
+                    self._dropped_events += excess
+        finally:
+            if lock is not None:
+                lock.release()
         if has_ended:
-            logger.warning("Calling add_event() on an ended span.")
-            return
-        self.events.append(event)
+            self._warn_ended("Calling add_event() on an ended span.")
 
     def start(self, start_time: Optional[int] = None) -> None:
-        with self._lock:
-            if not self.is_recording_events():
-                return
-            has_started = self.start_time is not None
+        if not self.is_recording_events():
+            return
+        lock = self._lock
+        if lock is not None:
+            lock.acquire()
+        try:
+            has_started = self._start_time is not None
             if not has_started:
-                self._start_time = (
-                    start_time if start_time is not None else time_ns()
-                )
+                if start_time is None:
+                    self._start_perf_counter = perf_counter_ns()
+                    start_time = time_ns()
+                self._start_time = start_time
+        finally:
+            if lock is not None:
+                lock.release()
         if has_started:
             logger.warning("Calling start() on a started span.")
             return
         self.span_processor.on_start(self)
 
     def end(self, end_time: Optional[int] = None) -> None:
-        with self._lock:
-            if not self.is_recording_events():
-                return
-            if self.start_time is None:
+        if not self.is_recording_events():
+            return
+        lock = self._lock
+        if lock is not None:
+            lock.acquire()
+        try:
+            if self._start_time is None:
                 raise RuntimeError("Calling end() on a not started span.")
-            has_ended = self.end_time is not None
+            has_ended = self._end_time is not None
             if not has_ended:
                 if self.status is None:
-                    self.status = Status(canonical_code=StatusCanonicalCode.OK)
+                    self.status = _OK_STATUS
 
                 self._end_time = (
-                    end_time if end_time is not None else time_ns()
+                    end_time if end_time is not None else self._time_ns()
                 )
+                self._freeze()
+        finally:
+            if lock is not None:
+                lock.release()
 
         if has_ended:
-            logger.warning("Calling end() on an ended span.")
+            self._warn_ended("Calling end() on an ended span.")
             return
 
-        self.span_processor.on_end(self)
+        self.span_processor.on_end(self._readable_span())
+
+    def _freeze(self) -> None:
+        """Replaces the span's containers with immutable ones.
+
+        Ended spans are never written to again, so exporters can iterate over
+        their attributes and events without locking or copying them.
+        """
+        if self._attributes is not None:
+            self._attributes = MappingProxyType(self._attributes)
+        if self._events is not None:
+            self._events = tuple(self._events)
+
+    def _release(self) -> None:
+        """Drops the data of this ended span, see `SpanPool.release`.
+
+        The frozen containers now only belong to the span's `ReadableSpan`.
+        Until the pool reuses the span, calls to it are rejected and logged
+        as errors by `_warn_ended`.
+        """
+        self._released = True
+        self.parent = None
+        self.status = None
+        self._attributes = None
+        self._events = None
+        self._links = Span.empty_links
+
+    def _warn_ended(self, message: str) -> None:
+        if self._released:
+            logger.error(
+                "%s The span was released to a SpanPool and must not be "
+                "used any longer.",
+                message,
+            )
+        else:
+            logger.warning(message)
+
+    def _readable_span(self) -> ReadableSpan:
+        """Returns an immutable record of this ended span."""
+        parent = self.parent
+        if isinstance(parent, trace_api.Span):
+            parent = parent.get_context()
+        return ReadableSpan(
+            self.name,
+            self.context,
+            parent,
+            self.kind,
+            self._start_time,
+            self._end_time,
+            self.attributes,
+            self.events,
+            self._links,
+            self.status,
+            self.resource,
+            self.instrumentation_info,
+            self._dropped_attributes,
+            self._dropped_events,
+            self._dropped_links,
+            self._limits,
+        )
 
     def update_name(self, name: str) -> None:
-        with self._lock:
-            has_ended = self.end_time is not None
+        name = _SPAN_NAMES.intern(name)
+        lock = self._lock
+        if lock is not None:
+            lock.acquire()
+        try:
+            has_ended = self._end_time is not None
+            if not has_ended:
+                self.name = name
+        finally:
+            if lock is not None:
+                lock.release()
         if has_ended:
-            logger.warning("Calling update_name() on an ended span.")
-            return
-        self.name = name
+            self._warn_ended("Calling update_name() on an ended span.")
 
     def is_recording_events(self) -> bool:
         return True
 
     def set_status(self, status: trace_api.Status) -> None:
-        with self._lock:
-            has_ended = self.end_time is not None
+        lock = self._lock
+        if lock is not None:
+            lock.acquire()
+        try:
+            has_ended = self._end_time is not None
+            if not has_ended:
+                self.status = status
+        finally:
+            if lock is not None:
+                lock.release()
         if has_ended:
-            logger.warning("Calling set_status() on an ended span.")
-            return
-        self.status = status
+            self._warn_ended("Calling set_status() on an ended span.")
 
     def __exit__(
         self,
@@ -368,12 +603,17 @@ class Span(trace_api.Span):
         super().__exit__(exc_type, exc_val, exc_tb)
 
 
+_DEFAULT_ID_GENERATOR = RandomIdGenerator()
+
+_SAMPLED_TRACE_OPTIONS = trace_api.TraceOptions(trace_api.TraceOptions.SAMPLED)
+
+
 def generate_span_id() -> int:
     """Get a new random span ID.
     Returns:
         A random 64-bit int for use as a span ID
     """
-    return random.getrandbits(64)
+    return _DEFAULT_ID_GENERATOR.generate_span_id()
 
 
 def generate_trace_id() -> int:
@@ -381,7 +621,7 @@ def generate_trace_id() -> int:
     Returns:
         A random 128-bit int for use as a trace ID
     """
-    return random.getrandbits(128)
+    return _DEFAULT_ID_GENERATOR.generate_trace_id()
 
 
 class InstrumentationInfo:
@@ -427,19 +667,24 @@ class InstrumentationInfo:
 class Tracer(trace_api.Tracer):
     """See `opentelemetry.trace.Tracer`.
 
+    Tracers are created and cached by `TracerSource.get_tracer`.
+
     Args:
-        name: The name of the tracer.
-        shutdown_on_exit: Register an atexit hook to shut down the tracer when
-            the application exits.
+        source: The `TracerSource` that created the tracer.
+        instrumentation_info: The instrumentation library of the tracer.
+        enabled: Whether the tracer records spans, see
+            `TracerSource.disable_instrumentation`.
     """
 
     def __init__(
         self,
         source: "TracerSource",
         instrumentation_info: InstrumentationInfo,
+        enabled: bool = True,
     ) -> None:
         self.source = source
         self.instrumentation_info = instrumentation_info
+        self.enabled = enabled
 
     def get_current_span(self):
         """See `opentelemetry.trace.Tracer.get_current_span`."""
@@ -452,7 +697,7 @@ class Tracer(trace_api.Tracer):
         kind: trace_api.SpanKind = trace_api.SpanKind.INTERNAL,
         attributes: Optional[types.Attributes] = None,
         links: Sequence[trace_api.Link] = (),
-    ) -> Iterator[trace_api.Span]:
+    ) -> "_ActiveSpan":
         """See `opentelemetry.trace.Tracer.start_as_current_span`."""
 
         span = self.start_span(name, parent, kind, attributes, links)
@@ -482,107 +727,148 @@ class Tracer(trace_api.Tracer):
         ):
             raise TypeError
 
+        if not self.enabled:
+            # Spans of disabled instrumentations are transparent: they carry
+            # their parent's context, so spans started inside them become
+            # children of the parent.
+            if parent_context is None or not parent_context.is_valid():
+                return trace_api.INVALID_SPAN
+            return trace_api.DefaultSpan(parent_context)
+
+        source = self.source
+        id_generator = source.id_generator
         if parent_context is None or not parent_context.is_valid():
             parent = parent_context = None
-            trace_id = generate_trace_id()
+            trace_id = id_generator.generate_trace_id()
             trace_options = None
             trace_state = None
         else:
             trace_id = parent_context.trace_id
             trace_options = parent_context.trace_options
             trace_state = parent_context.trace_state
-
-        context = trace_api.SpanContext(
-            trace_id, generate_span_id(), trace_options, trace_state
-        )
+        span_id = id_generator.generate_span_id()
 
         # The sampler decides whether to create a real or no-op span at the
         # time of span creation. No-op spans do not record events, and are not
         # exported.
         # The sampler may also add attributes to the newly-created span, e.g.
         # to include information about the sampling decision.
-        sampling_decision = self.source.sampler.should_sample(
-            parent_context,
-            context.trace_id,
-            context.span_id,
-            name,
-            attributes,
-            links,
+        sampling_decision = sampling.call_should_sample(
+            source.sampler,
+            parent_context=parent_context,
+            trace_id=trace_id,
+            span_id=span_id,
+            name=name,
+            attributes=attributes,
+            links=links,
+            kind=kind,
         )
 
-        if sampling_decision.sampled:
+        # New traces record the sampling decision in their trace options so
+        # that samplers respecting the parent's decision keep whole traces.
+        if parent_context is None and sampling_decision.sampled:
+            trace_options = _SAMPLED_TRACE_OPTIONS
+        context = trace_api.SpanContext(
+            trace_id, span_id, trace_options, trace_state
+        )
+
+        if not sampling_decision.sampled:
+            # Unsampled spans only carry their context, the attributes and
+            # links are neither copied nor validated.
+            return trace_api.DefaultSpan(context)
+
+        span_attributes = attributes
+        if sampling_decision.attributes:
             if attributes is None:
                 span_attributes = sampling_decision.attributes
             else:
                 # apply sampling decision attributes after initial attributes
-                span_attributes = attributes.copy()
+                span_attributes = dict(attributes)
                 span_attributes.update(sampling_decision.attributes)
-            span = Span(
-                name=name,
-                context=context,
-                parent=parent,
-                sampler=self.source.sampler,
-                attributes=span_attributes,
-                span_processor=self.source._active_span_processor,  # pylint:disable=protected-access
-                kind=kind,
-                links=links,
-                instrumentation_info=self.instrumentation_info,
-                set_status_on_exception=set_status_on_exception,
-            )
-            span.start(start_time=start_time)
-        else:
-            span = trace_api.DefaultSpan(context=context)
+        span = source._new_span()  # pylint:disable=protected-access
+        # Initialized explicitly since pooled spans are recycled objects.
+        Span.__init__(
+            span,
+            name=name,
+            context=context,
+            parent=parent,
+            sampler=source.sampler,
+            attributes=span_attributes,
+            span_processor=source._active_span_processor,  # pylint:disable=protected-access
+            kind=kind,
+            links=links,
+            instrumentation_info=self.instrumentation_info,
+            set_status_on_exception=set_status_on_exception,
+            thread_safe=source.thread_safe_spans,
+            validate_attributes=not source.defer_attribute_validation,
+            limits=source.span_limits,
+        )
+        span.start(start_time=start_time)
         return span
 
-    @contextmanager
     def use_span(
         self, span: trace_api.Span, end_on_exit: bool = False
-    ) -> Iterator[trace_api.Span]:
+    ) -> "_ActiveSpan":
         """See `opentelemetry.trace.Tracer.use_span`."""
-        try:
-            span_snapshot = self.source.get_current_span()
-            self.source._current_span_slot.set(  # pylint:disable=protected-access
-                span
-            )
-            try:
-                yield span
-            finally:
-                self.source._current_span_slot.set(  # pylint:disable=protected-access
-                    span_snapshot
-                )
-
-        except Exception as error:  # pylint: disable=broad-except
-            if (
-                span.status is None
-                and span._set_status_on_exception  # pylint:disable=protected-access  # noqa
-            ):
-                span.set_status(
-                    Status(
-                        canonical_code=StatusCanonicalCode.UNKNOWN,
-                        description="{}: {}".format(
-                            type(error).__name__, error
-                        ),
-                    )
-                )
+        return _ActiveSpan(
+            self.source._current_span_slot,  # pylint:disable=protected-access
+            span,
+            end_on_exit,
+        )
 
-                raise
 
-        finally:
-            if end_on_exit:
-                span.end()
+class TracerSource(trace_api.TracerSource):
+    """See `opentelemetry.trace.TracerSource`.
 
+    Args:
+        sampler: The sampler used to decide whether new spans are recorded.
+        shutdown_on_exit: Register an atexit hook to shut down the span
+            processors when the application exits.
+        thread_safe_spans: Set to ``False`` if every span is only mutated by
+            the thread that started it, so spans can skip locking.
+        id_generator: The `IdGenerator` used for new trace and span IDs,
+            defaults to a shared `RandomIdGenerator`.
+        span_processor_workers: The number of threads that call
+            `SpanProcessor.on_end` of span processors that set
+            `SpanProcessor.on_end_async_safe`, see `MultiSpanProcessor`.
+        defer_attribute_validation: Set to ``True`` to store attribute values
+            unchecked and drop invalid ones on export instead, on the worker
+            thread of a `BatchExportSpanProcessor`. Span processors other
+            than the exporting ones then see unvalidated values.
+        span_limits: The `SpanLimits` of new spans.
+        span_pool: The `SpanPool` that new spans are taken from.
+    """
 
-class TracerSource(trace_api.TracerSource):
     def __init__(
         self,
         sampler: sampling.Sampler = trace_api.sampling.ALWAYS_ON,
         shutdown_on_exit: bool = True,
+        thread_safe_spans: bool = True,
+        id_generator: Optional[IdGenerator] = None,
+        span_processor_workers: int = 0,
+        defer_attribute_validation: bool = False,
+        span_limits: Optional[SpanLimits] = None,
+        span_pool: Optional[SpanPool] = None,
     ):
         # TODO: How should multiple TracerSources behave? Should they get their own contexts?
         # This could be done by adding `str(id(self))` to the slot name.
         self._current_span_slot = Context.register_slot("current_span")
-        self._active_span_processor = MultiSpanProcessor()
+        self._active_span_processor = MultiSpanProcessor(
+            max_workers=span_processor_workers
+        )
         self.sampler = sampler
+        self.thread_safe_spans = thread_safe_spans
+        self.defer_attribute_validation = defer_attribute_validation
+        if span_limits is None:
+            span_limits = _DEFAULT_SPAN_LIMITS
+        self.span_limits = span_limits
+        self.span_pool = span_pool
+        self._tracers = {}  # type: Dict[Tuple[str, str], Tracer]
+        self._disabled_instrumentations = set()  # type: Set[str]
+        self._tracers_lock = threading.Lock()
+        if id_generator is None:
+            id_generator = _DEFAULT_ID_GENERATOR
+        self.id_generator = id_generator
         self._atexit_handler = None
         if shutdown_on_exit:
             self._atexit_handler = atexit.register(self.shutdown)
@@ -592,19 +878,83 @@ class TracerSource(trace_api.TracerSource):
         instrumenting_module_name: str,
         instrumenting_library_version: str = "",
     ) -> "trace_api.Tracer":
+        """See `opentelemetry.trace.TracerSource.get_tracer`.
+
+        Returns the same `Tracer` for every call with the same name and
+        version, so instrumentations may call this for every request.
+        """
+        key = (instrumenting_module_name, instrumenting_library_version)
+        tracer = self._tracers.get(key)
+        if tracer is not None:
+            return tracer
+
         if not instrumenting_module_name:  # Reject empty strings too.
             instrumenting_module_name = "ERROR:MISSING MODULE NAME"
             logger.error("get_tracer called with missing module name.")
-        return Tracer(
-            self,
-            InstrumentationInfo(
-                instrumenting_module_name, instrumenting_library_version
-            ),
-        )
+        with self._tracers_lock:
+            tracer = self._tracers.get(key)
+            if tracer is None:
+                tracer = Tracer(
+                    self,
+                    InstrumentationInfo(
+                        instrumenting_module_name,
+                        instrumenting_library_version,
+                    ),
+                    enabled=instrumenting_module_name
+                    not in self._disabled_instrumentations,
+                )
+                self._tracers[key] = tracer
+        return tracer
+
+    def disable_instrumentation(self, instrumenting_module_name: str) -> None:
+        """Turns the tracers of an instrumentation into no-op tracers.
+
+        This applies to tracers that were already returned by `get_tracer`
+        as well as future ones, of all versions of the instrumentation.
+        Their spans are not recorded and spans started within them become
+        children of their parent instead.
+
+        Args:
+            instrumenting_module_name: The name that the instrumentation
+                passes to `get_tracer`.
+        """
+        self._set_instrumentation_enabled(instrumenting_module_name, False)
+
+    def enable_instrumentation(self, instrumenting_module_name: str) -> None:
+        """Reverts `disable_instrumentation`.
+
+        Args:
+            instrumenting_module_name: The name that the instrumentation
+                passes to `get_tracer`.
+        """
+        self._set_instrumentation_enabled(instrumenting_module_name, True)
+
+    def _set_instrumentation_enabled(
+        self, instrumenting_module_name: str, enabled: bool
+    ) -> None:
+        with self._tracers_lock:
+            if enabled:
+                self._disabled_instrumentations.discard(
+                    instrumenting_module_name
+                )
+            else:
+                self._disabled_instrumentations.add(instrumenting_module_name)
+            for (name, _), tracer in self._tracers.items():
+                if name == instrumenting_module_name:
+                    tracer.enabled = enabled
 
     def get_current_span(self) -> Span:
         return self._current_span_slot.get()
 
+    def _new_span(self) -> Span:
+        """Returns an uninitialized span, recycled if the span pool has one."""
+        span_pool = self.span_pool
+        if span_pool is not None:
+            span = span_pool.acquire()
+            if span is not None:
+                return span
+        return Span.__new__(Span)
+
     def add_span_processor(self, span_processor: SpanProcessor) -> None:
         """Registers a new :class:`SpanProcessor` for this `TracerSource`.
 
@@ -615,6 +965,18 @@ class TracerSource(trace_api.TracerSource):
         # thread safe
         self._active_span_processor.add_span_processor(span_processor)
 
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        """Flushes the span processors added to the tracer.
+
+        Args:
+            timeout_millis: The maximum amount of time to wait for all span
+                processors to flush.
+
+        Returns:
+            False if the timeout is exceeded, True otherwise.
+        """
+        return self._active_span_processor.force_flush(timeout_millis)
+
     def shutdown(self):
         """Shut down the span processors added to the tracer."""
         self._active_span_processor.shutdown()
@@ -0,0 +1,110 @@
+# Copyright 2019, OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from types import TracebackType
+from typing import Optional, Type
+
+# Only used for type checks, the classes are defined by the package that
+# imports this module.
+import opentelemetry.sdk.trace  # pylint: disable=unused-import
+from opentelemetry import trace as trace_api
+from opentelemetry.context.base_context import BaseRuntimeContext
+from opentelemetry.trace.status import Status, StatusCanonicalCode
+
+
+class _Completed:
+    """Awaitable that completes immediately with a value.
+
+    Lets `_ActiveSpan` support ``async with`` without coroutines, which also
+    keeps the module importable on Python 3.4.
+    """
+
+    __slots__ = ("_value",)
+
+    def __init__(self, value: object) -> None:
+        self._value = value
+
+    def __await__(self) -> "_Completed":
+        return self
+
+    def __iter__(self) -> "_Completed":
+        return self
+
+    def __next__(self) -> None:
+        raise StopIteration(self._value)
+
+
+class _ActiveSpan:
+    """Context manager that makes a span the current span, see
+    `opentelemetry.sdk.trace.Tracer.use_span`.
+
+    A plain class rather than a generator based context manager, which keeps
+    entering the non-recording spans of unsampled traces cheap. The previous
+    span is restored with the token of the context slot, a
+    `contextvars.Token` where context variables are available. Supports
+    ``async with`` as well.
+    """
+
+    __slots__ = ("_slot", "_span", "_end_on_exit", "_token")
+
+    def __init__(
+        self,
+        slot: BaseRuntimeContext.Slot,
+        span: trace_api.Span,
+        end_on_exit: bool,
+    ) -> None:
+        self._slot = slot
+        self._span = span
+        self._end_on_exit = end_on_exit
+        self._token = None  # type: object
+
+    def __enter__(self) -> trace_api.Span:
+        self._token = self._slot.attach(self._span)
+        return self._span
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        span = self._span
+        self._slot.detach(self._token)
+        self._token = None
+        if (
+            isinstance(exc_val, Exception)
+            and isinstance(span, opentelemetry.sdk.trace.Span)
+            and span.status is None
+            and span._set_status_on_exception  # pylint:disable=protected-access
+        ):
+            span.set_status(
+                Status(
+                    canonical_code=StatusCanonicalCode.UNKNOWN,
+                    description="{}: {}".format(exc_type.__name__, exc_val),
+                )
+            )
+        if self._end_on_exit:
+            span.end()
+
+    def __aenter__(self) -> _Completed:
+        return _Completed(self.__enter__())
+
+    def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> _Completed:
+        return _Completed(self.__exit__(exc_type, exc_val, exc_tb))
@@ -0,0 +1,139 @@
+# Copyright 2019, OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+from typing import Optional, Sequence
+
+from opentelemetry.sdk.trace.export import BatchExportSpanProcessor
+from opentelemetry.trace import Link, SpanContext, SpanKind, sampling
+from opentelemetry.util.types import Attributes
+
+# Queue fill level above which the sampling rate is lowered regardless of the
+# observed span rate.
+_QUEUE_HIGH_WATERMARK = 0.5
+
+
+class AdaptiveSampler(sampling.Sampler):
+    """Sampler that adjusts its sampling rate to a target export rate.
+
+    New traces are sampled with a probability, like with
+    `opentelemetry.trace.sampling.ProbabilitySampler`, and spans with a
+    parent follow the parent's sampled flag. Every ``adjust_interval_millis``
+    the probability is set to the ratio between ``target_spans_per_second``
+    and the rate of spans started since the last adjustment, but it grows at
+    most twofold per interval so that spikes after quiet periods are damped.
+
+    If a `BatchExportSpanProcessor` is given, the fill level of its queue is
+    taken into account as well: once the queue is more than half full the
+    probability is lowered in proportion to the remaining space, so spans
+    are dropped when traces start instead of once the queue overflows.
+
+    The span counters are updated without locking, so they may be slightly
+    off when many threads start spans concurrently.
+
+    Args:
+        target_spans_per_second: The rate of sampled spans to aim for.
+        span_processor: The `BatchExportSpanProcessor` whose queue is
+            watched.
+        adjust_interval_millis: The delay between adjustments of the
+            sampling rate.
+        initial_rate: The sampling probability to start with.
+        min_rate: The lowest sampling probability to adjust to.
+    """
+
+    def __init__(
+        self,
+        target_spans_per_second: float,
+        span_processor: Optional[BatchExportSpanProcessor] = None,
+        adjust_interval_millis: float = 1000,
+        initial_rate: float = 1.0,
+        min_rate: float = 0.0,
+    ):
+        if target_spans_per_second <= 0:
+            raise ValueError("target_spans_per_second must be positive.")
+        if adjust_interval_millis <= 0:
+            raise ValueError("adjust_interval_millis must be positive.")
+        if not 0.0 <= min_rate <= initial_rate <= 1.0:
+            raise ValueError(
+                "min_rate and initial_rate must be probabilities and "
+                "min_rate must not exceed initial_rate."
+            )
+
+        self.target_spans_per_second = target_spans_per_second
+        self.span_processor = span_processor
+        self.min_rate = min_rate
+        self._adjust_interval = adjust_interval_millis / 1e3
+        self._sampler = sampling.ProbabilitySampler(initial_rate)
+        self._started_spans = 0
+        self._last_adjustment = time.monotonic()
+        self._adjust_lock = threading.Lock()
+
+    @property
+    def rate(self) -> float:
+        """The current sampling probability of new traces."""
+        return self._sampler.rate
+
+    def should_sample(
+        self,
+        parent_context: Optional[SpanContext],
+        trace_id: int,
+        span_id: int,
+        name: str,
+        attributes: Optional[Attributes] = None,
+        links: Sequence[Link] = (),
+        kind: Optional[SpanKind] = None,
+    ) -> sampling.Decision:
+        self._started_spans += 1
+        if time.monotonic() - self._last_adjustment >= self._adjust_interval:
+            self._adjust()
+        return self._sampler.should_sample(
+            parent_context, trace_id, span_id, name
+        )
+
+    def _adjust(self) -> None:
+        # Only one thread adjusts the rate, the others keep sampling at the
+        # current rate in the meantime.
+        if not self._adjust_lock.acquire(blocking=False):
+            return
+        try:
+            now = time.monotonic()
+            elapsed = now - self._last_adjustment
+            if elapsed < self._adjust_interval:
+                return
+            started_spans = self._started_spans
+            self._started_spans = 0
+            self._last_adjustment = now
+
+            rate = self._sampler.rate
+            new_rate = (
+                self.target_spans_per_second * elapsed / max(started_spans, 1)
+            )
+            if rate:
+                new_rate = min(new_rate, rate * 2)
+
+            span_processor = self.span_processor
+            if span_processor is not None:
+                fill = (
+                    len(span_processor.queue) / span_processor.max_queue_size
+                )
+                if fill > _QUEUE_HIGH_WATERMARK:
+                    new_rate = min(
+                        new_rate,
+                        rate * (1.0 - fill) / (1.0 - _QUEUE_HIGH_WATERMARK),
+                    )
+
+            self._sampler.rate = max(self.min_rate, min(new_rate, 1.0))
+        finally:
+            self._adjust_lock.release()
@@ -18,11 +18,12 @@ import threading
 import typing
 from enum import Enum
 
-from opentelemetry.context import Context
+from opentelemetry.context import SUPPRESS_INSTRUMENTATION
 from opentelemetry.trace import DefaultSpan
 from opentelemetry.util import time_ns
 
-from .. import Span, SpanProcessor
+# pylint: disable=unused-import
+from .. import ReadableSpan, Span, SpanPool, SpanProcessor  # noqa: F401
 
 logger = logging.getLogger(__name__)
 
@@ -43,11 +44,15 @@ class SpanExporter:
     `SimpleExportSpanProcessor` or a `BatchExportSpanProcessor`.
     """
 
-    def export(self, spans: typing.Sequence[Span]) -> "SpanExportResult":
+    def export(
+        self, spans: typing.Sequence[ReadableSpan]
+    ) -> "SpanExportResult":
         """Exports a batch of telemetry data.
 
         Args:
-            spans: The list of `opentelemetry.trace.Span` objects to be exported
+            spans: The list of
+                `opentelemetry.sdk.trace.readable_span.ReadableSpan` objects
+                to be exported
 
         Returns:
             The result of the export
@@ -70,16 +75,15 @@ class SimpleExportSpanProcessor(SpanProcessor):
     def __init__(self, span_exporter: SpanExporter):
         self.span_exporter = span_exporter
 
-    def on_start(self, span: Span) -> None:
-        pass
-
-    def on_end(self, span: Span) -> None:
-        with Context.use(suppress_instrumentation=True):
-            try:
-                self.span_exporter.export((span,))
-            # pylint: disable=broad-except
-            except Exception:
-                logger.exception("Exception while exporting Span.")
+    def on_end(self, span: ReadableSpan) -> None:
+        token = SUPPRESS_INSTRUMENTATION.attach(True)
+        try:
+            self.span_exporter.export((span.resolve_attributes(),))
+        # pylint: disable=broad-except
+        except Exception:
+            logger.exception("Exception while exporting Span.")
+        finally:
+            SUPPRESS_INSTRUMENTATION.detach(token)
 
     def shutdown(self) -> None:
         self.span_exporter.shutdown()
@@ -94,6 +98,13 @@ class BatchExportSpanProcessor(SpanProcessor):
 
     BatchExportSpanProcessor is an implementation of `SpanProcessor` that
     batches ended spans and pushes them to the configured `SpanExporter`.
+    Attribute values are resolved and validated on its worker thread, see
+    `opentelemetry.sdk.trace.readable_span.ReadableSpan.resolve_attributes`.
+
+    If a ``span_pool`` is given, the processor keeps track of the spans it
+    sees start and releases the ones of each batch that the exporter
+    exported successfully to the pool, see
+    `opentelemetry.sdk.trace.span_pool.SpanPool`.
     """
 
     _FLUSH_TOKEN_SPAN = DefaultSpan(context=None)
@@ -104,6 +115,7 @@ class BatchExportSpanProcessor(SpanProcessor):
         max_queue_size: int = 2048,
         schedule_delay_millis: float = 5000,
         max_export_batch_size: int = 512,
+        span_pool: typing.Optional[SpanPool] = None,
     ):
         if max_queue_size <= 0:
             raise ValueError("max_queue_size must be a positive integer.")
@@ -124,7 +136,7 @@ class BatchExportSpanProcessor(SpanProcessor):
         self.span_exporter = span_exporter
         self.queue = collections.deque(
             [], max_queue_size
-        )  # type: typing.Deque[Span]
+        )  # type: typing.Deque[ReadableSpan]
         self.worker_thread = threading.Thread(target=self.worker, daemon=True)
         self.condition = threading.Condition(threading.Lock())
         self.flush_condition = threading.Condition(threading.Lock())
@@ -133,19 +145,32 @@ class BatchExportSpanProcessor(SpanProcessor):
         self.schedule_delay_millis = schedule_delay_millis
         self.max_export_batch_size = max_export_batch_size
         self.max_queue_size = max_queue_size
+        self.span_pool = span_pool
+        # Started spans by span ID, released to the span pool after export.
+        self._pooled_spans = (
+            collections.OrderedDict()
+        )  # type: collections.OrderedDict
+        self._pooled_spans_lock = threading.Lock()
+        if span_pool is not None:
+            # Only pay for the on_start hook when pooling.
+            self.on_start = self._track_span
         self.done = False
         # flag that indicates that spans are being dropped
         self._spans_dropped = False
         # precallocated list to send spans to exporter
         self.spans_list = [
             None
-        ] * self.max_export_batch_size  # type: typing.List[typing.Optional[Span]]
+        ] * self.max_export_batch_size  # type: typing.List[typing.Optional[ReadableSpan]]
         self.worker_thread.start()
 
-    def on_start(self, span: Span) -> None:
-        pass
+    def _track_span(self, span: Span) -> None:
+        with self._pooled_spans_lock:
+            self._pooled_spans[span.context.span_id] = span
+            if len(self._pooled_spans) > self.max_queue_size:
+                # Forget the oldest span, the garbage collector frees it.
+                self._pooled_spans.popitem(last=False)
 
-    def on_end(self, span: Span) -> None:
+    def on_end(self, span: ReadableSpan) -> None:
         if self.done:
             logger.warning("Already shutdown, dropping span.")
             return
@@ -197,18 +222,26 @@ class BatchExportSpanProcessor(SpanProcessor):
             if span is self._FLUSH_TOKEN_SPAN:
                 notify_flush = True
             else:
-                self.spans_list[idx] = span
+                # Lazy attribute values are computed and deferred validation
+                # happens here rather than on the thread that ended the span.
+                self.spans_list[idx] = span.resolve_attributes()
                 idx += 1
-        with Context.use(suppress_instrumentation=True):
-            try:
-                # Ignore type b/c the Optional[None]+slicing is too "clever"
-                # for mypy
-                self.span_exporter.export(
-                    self.spans_list[:idx]
-                )  # type: ignore
-            # pylint: disable=broad-except
-            except Exception:
-                logger.exception("Exception while exporting Span batch.")
+        result = None
+        token = SUPPRESS_INSTRUMENTATION.attach(True)
+        try:
+            # Ignore type b/c the Optional[None]+slicing is too "clever"
+            # for mypy
+            result = self.span_exporter.export(
+                self.spans_list[:idx]
+            )  # type: ignore
+        # pylint: disable=broad-except
+        except Exception:
+            logger.exception("Exception while exporting Span batch.")
+        finally:
+            SUPPRESS_INSTRUMENTATION.detach(token)
+
+        if self.span_pool is not None and result is SpanExportResult.SUCCESS:
+            self._release_spans(idx)
 
         if notify_flush:
             with self.flush_condition:
@@ -218,6 +251,19 @@ class BatchExportSpanProcessor(SpanProcessor):
         for index in range(idx):
             self.spans_list[index] = None
 
+    def _release_spans(self, count: int) -> None:
+        """Releases the spans of the first ``count`` exported records."""
+        release = self.span_pool.release
+        pop = self._pooled_spans.pop
+        for index in range(count):
+            record = self.spans_list[index]
+            with self._pooled_spans_lock:
+                span = pop(record.context.span_id, None)
+            # Span IDs may collide, only release the span of the record.
+            if span is not None and span.context is record.context:
+                release(span)
+            span = None
+
     def _drain_queue(self):
         """"Export all elements until queue is empty.
 
@@ -266,7 +312,7 @@ class ConsoleSpanExporter(SpanExporter):
     spans to the console STDOUT.
     """
 
-    def export(self, spans: typing.Sequence[Span]) -> SpanExportResult:
+    def export(self, spans: typing.Sequence[ReadableSpan]) -> SpanExportResult:
         for span in spans:
             print(span)
         return SpanExportResult.SUCCESS
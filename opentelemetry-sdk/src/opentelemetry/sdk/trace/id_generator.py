@@ -0,0 +1,64 @@
+# Copyright 2019, OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import abc
+import random
+
+
+class IdGenerator(abc.ABC):
+    """Interface for generating the IDs of new spans and traces.
+
+    An `IdGenerator` is configured on the
+    :class:`opentelemetry.sdk.trace.TracerSource` and is called from every
+    thread that starts spans, so implementations must be thread safe.
+    """
+
+    @abc.abstractmethod
+    def generate_span_id(self) -> int:
+        """Get a new span ID.
+
+        Returns:
+            A 64-bit int for use as a span ID, it must not be ``0``.
+        """
+
+    @abc.abstractmethod
+    def generate_trace_id(self) -> int:
+        """Get a new trace ID.
+
+        Returns:
+            A 128-bit int for use as a trace ID, it must not be ``0``.
+        """
+
+
+class RandomIdGenerator(IdGenerator):
+    """The default `IdGenerator`.
+
+    Draws IDs from the module level ``random`` generator. Python 3.7+
+    reseeds it in the child after ``os.fork()``; older versions have no fork
+    hooks, so prefork servers should call `reseed` in every worker to keep
+    the workers from repeating the IDs of their parent or of each other.
+    """
+
+    @staticmethod
+    def reseed() -> None:
+        """Reseeds the module level ``random`` generator from
+        ``os.urandom``."""
+        random.seed()
+
+    def generate_span_id(self) -> int:
+        # Zero is the invalid span ID, draw again in the unlikely event.
+        return random.getrandbits(64) or self.generate_span_id()
+
+    def generate_trace_id(self) -> int:
+        return random.getrandbits(128) or self.generate_trace_id()
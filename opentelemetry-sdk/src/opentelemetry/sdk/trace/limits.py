@@ -0,0 +1,138 @@
+# Copyright 2019, OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import itertools
+from typing import Optional
+
+from opentelemetry import trace as trace_api
+from opentelemetry.util import types
+
+MAX_NUM_ATTRIBUTES = 32
+MAX_NUM_EVENTS = 128
+MAX_NUM_LINKS = 32
+
+
+class SpanLimits:
+    """Limits on the data recorded by a span.
+
+    Attributes, events and links beyond the limits are dropped and counted in
+    the span's ``dropped_attributes``, ``dropped_events`` and
+    ``dropped_links``. String attribute values are truncated to
+    ``max_attribute_length`` characters, and sequence values to as many
+    items, with their strings truncated as well. The limits apply when data
+    is added to a span, `opentelemetry.trace.LazyAttributeValue` values are
+    truncated once they are resolved on export, see
+    `opentelemetry.sdk.trace.readable_span.ReadableSpan.resolve_attributes`.
+
+    Args:
+        max_attributes: The maximum number of attributes per span.
+        max_events: The maximum number of events per span.
+        max_links: The maximum number of links per span.
+        max_attributes_per_event: The maximum number of attributes per event.
+        max_attribute_length: The maximum length of attribute values, or
+            ``None`` for no limit.
+    """
+
+    __slots__ = (
+        "max_attributes",
+        "max_events",
+        "max_links",
+        "max_attributes_per_event",
+        "max_attribute_length",
+    )
+
+    def __init__(
+        self,
+        max_attributes: int = MAX_NUM_ATTRIBUTES,
+        max_events: int = MAX_NUM_EVENTS,
+        max_links: int = MAX_NUM_LINKS,
+        max_attributes_per_event: int = MAX_NUM_ATTRIBUTES,
+        max_attribute_length: Optional[int] = None,
+    ):
+        for name, value in (
+            ("max_attributes", max_attributes),
+            ("max_events", max_events),
+            ("max_links", max_links),
+            ("max_attributes_per_event", max_attributes_per_event),
+        ):
+            if not isinstance(value, int) or value < 0:
+                raise ValueError(
+                    "{} must be a non-negative integer.".format(name)
+                )
+        if max_attribute_length is not None and (
+            not isinstance(max_attribute_length, int)
+            or max_attribute_length < 0
+        ):
+            raise ValueError(
+                "max_attribute_length must be None or a non-negative integer."
+            )
+        self.max_attributes = max_attributes
+        self.max_events = max_events
+        self.max_links = max_links
+        self.max_attributes_per_event = max_attributes_per_event
+        self.max_attribute_length = max_attribute_length
+
+    def __repr__(self):
+        return (
+            "{}(max_attributes={}, max_events={}, max_links={}, "
+            "max_attributes_per_event={}, max_attribute_length={})"
+        ).format(
+            type(self).__name__,
+            self.max_attributes,
+            self.max_events,
+            self.max_links,
+            self.max_attributes_per_event,
+            self.max_attribute_length,
+        )
+
+    def truncate_attribute_value(
+        self, value: types.AttributeValue
+    ) -> types.AttributeValue:
+        """Returns ``value`` shortened to ``max_attribute_length``."""
+        max_length = self.max_attribute_length
+        if max_length is None:
+            return value
+        if isinstance(value, str):
+            return value[:max_length]
+        if isinstance(value, (list, tuple)):
+            if len(value) > max_length or any(
+                isinstance(item, str) and len(item) > max_length
+                for item in value
+            ):
+                return type(value)(
+                    item[:max_length] if isinstance(item, str) else item
+                    for item in value[:max_length]
+                )
+        return value
+
+    def limit_event(self, event: trace_api.Event) -> trace_api.Event:
+        """Returns ``event`` with its attributes limited by
+        ``max_attributes_per_event`` and ``max_attribute_length``."""
+        attributes = event.attributes
+        if not attributes or (
+            len(attributes) <= self.max_attributes_per_event
+            and self.max_attribute_length is None
+        ):
+            return event
+        truncate = self.truncate_attribute_value
+        return trace_api.Event(
+            event.name,
+            {
+                key: truncate(value)
+                for key, value in itertools.islice(
+                    attributes.items(), self.max_attributes_per_event
+                )
+            },
+            event.timestamp,
+        )
@@ -0,0 +1,151 @@
+# Copyright 2019, OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import logging
+import sys
+from collections import OrderedDict, namedtuple
+from types import MappingProxyType
+
+# Only used for validation, the classes are defined by the package that
+# imports this module.
+import opentelemetry.sdk.trace  # pylint: disable=unused-import
+from opentelemetry import trace as trace_api
+from opentelemetry.sdk import util
+
+logger = logging.getLogger(__name__)
+
+# Span attributes must keep their insertion order so that the oldest one can
+# be dropped when the span is full, which plain dicts only guarantee since
+# Python 3.7.
+if sys.version_info >= (3, 7):
+    _AttributesDict = dict
+else:
+    _AttributesDict = OrderedDict
+
+# Attribute values of these exact types need no further validation.
+_PRIMITIVE_ATTRIBUTE_TYPES = frozenset((bool, str, int, float))
+
+# Returned by _resolve_lazy_value if the value could not be resolved.
+_UNRESOLVED = object()
+
+
+def _resolve_lazy_value(key: str, value: trace_api.LazyAttributeValue):
+    try:
+        return value.resolve()
+    # pylint: disable=broad-except
+    except Exception:
+        logger.exception("Exception while resolving attribute %s.", key)
+        return _UNRESOLVED
+
+
+class ReadableSpan(
+    namedtuple(
+        "ReadableSpan",
+        (
+            "name",
+            "context",
+            "parent",
+            "kind",
+            "start_time",
+            "end_time",
+            "attributes",
+            "events",
+            "links",
+            "status",
+            "resource",
+            "instrumentation_info",
+            "dropped_attributes",
+            "dropped_events",
+            "dropped_links",
+            "limits",
+        ),
+    )
+):
+    """Immutable record of an ended `opentelemetry.sdk.trace.Span`.
+
+    `opentelemetry.sdk.trace.Span.end` freezes the span into a
+    `ReadableSpan`, which is what span processors and exporters receive. Its
+    attributes, events and links are read-only and it only refers to its
+    parent by `opentelemetry.trace.SpanContext`, so it can be read from any
+    thread without locking and does not keep the live spans of the trace
+    alive while it waits to be exported. ``limits`` are the
+    `opentelemetry.sdk.trace.limits.SpanLimits` the span was recorded with.
+    """
+
+    __slots__ = ()
+
+    def get_context(self) -> trace_api.SpanContext:
+        return self.context
+
+    def resolve_attributes(self) -> "ReadableSpan":
+        """Resolves and validates the span's attribute values.
+
+        `opentelemetry.trace.LazyAttributeValue` values are resolved, and
+        values that are not of a primitive type are validated, which covers
+        the values of spans that defer validation to export. Resolved values
+        are truncated to the ``max_attribute_length`` of the span's
+        `opentelemetry.sdk.trace.limits.SpanLimits`. Values that fail to
+        resolve or are invalid are dropped and counted in
+        ``dropped_attributes``.
+
+        Returns:
+            A copy of this span with the resolved values, or this span if all
+            of its values are primitive.
+        """
+        attributes = self.attributes
+        for value in attributes.values():
+            if type(value) not in _PRIMITIVE_ATTRIBUTE_TYPES:
+                break
+        else:
+            return self
+
+        resolved = _AttributesDict()
+        dropped_attributes = self.dropped_attributes
+        truncate = None
+        if self.limits.max_attribute_length is not None:
+            truncate = self.limits.truncate_attribute_value
+        for key, value in attributes.items():
+            if isinstance(value, trace_api.LazyAttributeValue):
+                value = _resolve_lazy_value(key, value)
+                if value is _UNRESOLVED:
+                    dropped_attributes += 1
+                    continue
+                if truncate is not None:
+                    value = truncate(value)
+            # pylint: disable=protected-access
+            if not opentelemetry.sdk.trace.Span._is_valid_attribute_value(
+                value, allow_lazy=False
+            ):
+                dropped_attributes += 1
+                continue
+            resolved[key] = value
+        return self._replace(
+            attributes=MappingProxyType(resolved),
+            dropped_attributes=dropped_attributes,
+        )
+
+    def __str__(self):
+        return (
+            '{}(name="{}", context={}, kind={}, '
+            "parent={}, start_time={}, end_time={})"
+        ).format(
+            type(self).__name__,
+            self.name,
+            self.context,
+            self.kind,
+            repr(self.parent),
+            util.ns_to_iso_str(self.start_time) if self.start_time else "None",
+            util.ns_to_iso_str(self.end_time) if self.end_time else "None",
+        )
@@ -0,0 +1,117 @@
+# Copyright 2019, OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import collections
+import logging
+import sys
+import threading
+import typing
+
+# Only used in annotations, the classes are defined by the package that
+# imports this module.
+import opentelemetry.sdk.trace  # pylint: disable=unused-import
+
+logger = logging.getLogger(__name__)
+
+# The references to a span while SpanPool.release checks it: the one of the
+# caller, the argument of release and the argument of sys.getrefcount.
+_RELEASED_SPAN_REFERENCES = 3
+
+
+class SpanPool:
+    """Bounded free-list of ended spans that `Tracer.start_span` reuses.
+
+    Reusing spans saves allocating and garbage collecting a `Span` for every
+    span of high-rate instrumentations. Pooling is opt-in: the same pool has
+    to be passed to the `TracerSource` and to a
+    `opentelemetry.sdk.trace.export.BatchExportSpanProcessor`, which keeps
+    track of the spans it sees start and releases them to the pool once
+    their records have been exported successfully::
+
+        span_pool = SpanPool()
+        tracer_source = TracerSource(span_pool=span_pool)
+        tracer_source.add_span_processor(
+            BatchExportSpanProcessor(exporter, span_pool=span_pool)
+        )
+
+    Exported `ReadableSpan` records hold a copy of the span's data and no
+    reference to the span, so exporters may keep them. A span is only
+    recycled if nothing but the caller of `release` refers to it any longer,
+    so spans that application code or child spans still hold on to are left
+    to the garbage collector and counted in ``referenced_spans``.
+
+    The reference check relies on `sys.getrefcount`, on interpreters
+    without it spans are never recycled. Interpreters that do not count every
+    reference, such as borrowed ones, could still let a span slip through
+    while something holds it. Released spans are therefore marked as such:
+    until they are reused, which happens in the order they were released,
+    ending or changing them is rejected and logged as an error.
+
+    Args:
+        max_size: The maximum number of spans kept for reuse.
+    """
+
+    def __init__(self, max_size: int = 1024):
+        if max_size <= 0:
+            raise ValueError("max_size must be a positive integer.")
+        self.max_size = max_size
+        self._spans = (
+            collections.deque()
+        )  # type: typing.Deque[opentelemetry.sdk.trace.Span]
+        self._lock = threading.Lock()
+        # Statistics
+        self.released_spans = 0
+        self.referenced_spans = 0
+
+    def __len__(self) -> int:
+        return len(self._spans)
+
+    def acquire(self) -> typing.Optional["opentelemetry.sdk.trace.Span"]:
+        """Returns an uninitialized recycled span, or `None` if the pool is
+        empty."""
+        try:
+            return self._spans.popleft()
+        except IndexError:
+            return None
+
+    def release(self, span: "opentelemetry.sdk.trace.Span") -> bool:
+        """Recycles an ended span that nothing else refers to.
+
+        The caller has to hold the only other reference to the span and drop
+        it afterwards.
+
+        Args:
+            span: The ended span.
+
+        Returns:
+            Whether the span was added to the pool.
+        """
+        # pylint: disable=protected-access
+        if span._released:
+            logger.error("Releasing a span that was already released.")
+            return False
+        getrefcount = getattr(sys, "getrefcount", None)
+        if (
+            getrefcount is None
+            or getrefcount(span) > _RELEASED_SPAN_REFERENCES
+        ):
+            self.referenced_spans += 1
+            return False
+        with self._lock:
+            if len(self._spans) >= self.max_size:
+                return False
+            span._release()
+            self._spans.append(span)
+            self.released_spans += 1
+        return True
@@ -0,0 +1,295 @@
+# Copyright 2019, OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import queue
+import threading
+import time
+from typing import List, Tuple
+
+# Only used in annotations, the classes are defined by the package that
+# imports this module.
+import opentelemetry.sdk.trace  # pylint: disable=unused-import
+
+logger = logging.getLogger(__name__)
+
+
+class SpanProcessor:
+    """Interface which allows hooks for SDK's `Span` start and end method
+    invocations.
+
+    Span processors can be registered directly using
+    :func:`TracerSource.add_span_processor` and they are invoked
+    in the same order as they were registered.
+    """
+
+    # Whether `on_end` may be called on a worker thread of the
+    # `MultiSpanProcessor`, some time after the span ended and concurrently
+    # with other calls.
+    on_end_async_safe = False
+
+    def on_start(self, span: "opentelemetry.sdk.trace.Span") -> None:
+        """Called when a :class:`opentelemetry.trace.Span` is started.
+
+        This method is called synchronously on the thread that starts the
+        span, therefore it should not block or throw an exception.
+
+        Args:
+            span: The :class:`opentelemetry.trace.Span` that just started.
+        """
+
+    def on_end(self, span: "opentelemetry.sdk.trace.ReadableSpan") -> None:
+        """Called when a :class:`opentelemetry.trace.Span` is ended.
+
+        This method is called synchronously on the thread that ends the
+        span, therefore it should not block or throw an exception.
+
+        Args:
+            span: The `ReadableSpan` the span that just ended was frozen
+                into.
+        """
+
+    def shutdown(self) -> None:
+        """Called when a :class:`opentelemetry.sdk.trace.Tracer` is shutdown.
+        """
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        """Export all ended spans to the configured Exporter that have not yet
+        been exported.
+
+        Args:
+            timeout_millis: The maximum amount of time to wait for spans to be
+                exported.
+
+        Returns:
+            False if the timeout is exceeded, True otherwise.
+        """
+
+
+def _inherits_hook(span_processor: SpanProcessor, name: str) -> bool:
+    """Returns whether a span processor uses the no-op hook of
+    `SpanProcessor`."""
+    method = getattr(span_processor, name)
+    return getattr(method, "__func__", None) is getattr(SpanProcessor, name)
+
+
+class MultiSpanProcessor(SpanProcessor):
+    """Implementation of :class:`SpanProcessor` that forwards all received
+    events to a list of `SpanProcessor`.
+
+    The processors that actually override `SpanProcessor.on_start` and
+    `SpanProcessor.on_end` are determined when they are added, so spans only
+    pay for the hooks that do something.
+
+    With ``max_workers``, `SpanProcessor.on_end` of processors that set
+    `SpanProcessor.on_end_async_safe` is called on a pool of worker threads
+    instead of the thread that ends the span. The pool holds at most
+    ``max_queue_size`` pending spans, beyond that the hooks run on the
+    calling thread again. Once `shutdown` stopped the workers, the hooks
+    always run on the calling thread.
+
+    `shutdown` and `force_flush` call all processors in parallel, and
+    `force_flush` waits for them under a single deadline. Exceptions raised
+    by a processor are logged and count as a failed call.
+
+    Args:
+        max_workers: The number of worker threads for asynchronous
+            `SpanProcessor.on_end` calls, ``0`` to call all processors on the
+            thread that ends the span.
+        max_queue_size: The maximum number of spans waiting for a worker.
+    """
+
+    def __init__(self, max_workers: int = 0, max_queue_size: int = 2048):
+        if max_workers < 0:
+            raise ValueError("max_workers must not be negative.")
+        if max_queue_size <= 0:
+            raise ValueError("max_queue_size must be a positive integer.")
+        # use a tuple to avoid race conditions when adding a new span and
+        # iterating through it on "on_start" and "on_end".
+        self._span_processors = ()  # type: Tuple[SpanProcessor, ...]
+        self._on_start_processors = ()  # type: Tuple[SpanProcessor, ...]
+        self._on_end_processors = ()  # type: Tuple[SpanProcessor, ...]
+        self._async_on_end_processors = ()  # type: Tuple[SpanProcessor, ...]
+        self._lock = threading.Lock()
+        self._max_workers = max_workers
+        self._queue = queue.Queue(max_queue_size)  # type: queue.Queue
+        self._workers = []  # type: List[threading.Thread]
+        self._workers_stopped = False
+
+    def add_span_processor(self, span_processor: SpanProcessor) -> None:
+        """Adds a SpanProcessor to the list handled by this instance."""
+        with self._lock:
+            self._span_processors = self._span_processors + (span_processor,)
+            if not _inherits_hook(span_processor, "on_start"):
+                self._on_start_processors = self._on_start_processors + (
+                    span_processor,
+                )
+            if _inherits_hook(span_processor, "on_end"):
+                return
+            if self._max_workers and span_processor.on_end_async_safe:
+                self._async_on_end_processors = (
+                    self._async_on_end_processors + (span_processor,)
+                )
+                self._start_workers()
+            else:
+                self._on_end_processors = self._on_end_processors + (
+                    span_processor,
+                )
+
+    def _start_workers(self) -> None:
+        if self._workers_stopped:
+            return
+        while len(self._workers) < self._max_workers:
+            worker = threading.Thread(target=self._worker, daemon=True)
+            worker.start()
+            self._workers.append(worker)
+
+    def _worker(self) -> None:
+        while True:
+            span = self._queue.get()
+            try:
+                if span is None:
+                    return
+                self._call_on_end(self._async_on_end_processors, span)
+            finally:
+                self._queue.task_done()
+
+    def _wait_for_workers(self, deadline: float) -> bool:
+        """Waits until the workers are done with all pending spans."""
+        pending = self._queue.all_tasks_done
+        with pending:
+            while self._queue.unfinished_tasks:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    return False
+                pending.wait(timeout)
+        return True
+
+    @staticmethod
+    def _call_on_end(
+        span_processors: Tuple[SpanProcessor, ...],
+        span: "opentelemetry.sdk.trace.ReadableSpan",
+    ) -> None:
+        for sp in span_processors:
+            try:
+                sp.on_end(span)
+            # pylint: disable=broad-except
+            except Exception:
+                logger.exception("Exception in asynchronous on_end().")
+
+    def on_start(self, span: "opentelemetry.sdk.trace.Span") -> None:
+        for sp in self._on_start_processors:
+            sp.on_start(span)
+
+    def on_end(self, span: "opentelemetry.sdk.trace.ReadableSpan") -> None:
+        for sp in self._on_end_processors:
+            sp.on_end(span)
+        if self._async_on_end_processors:
+            if self._workers_stopped:
+                self._call_on_end(self._async_on_end_processors, span)
+                return
+            try:
+                self._queue.put_nowait(span)
+            except queue.Full:
+                self._call_on_end(self._async_on_end_processors, span)
+
+    def _stop_workers(self, deadline: float) -> None:
+        with self._lock:
+            workers, self._workers = self._workers, []
+            # No more workers are started and no more spans are queued, the
+            # asynchronous processors are called on the ending thread from
+            # now on.
+            self._workers_stopped = True
+        for _ in workers:
+            self._queue.put(None)
+        for worker in workers:
+            worker.join(max(deadline - time.monotonic(), 0))
+        # Spans queued by calls to on_end that raced with the shutdown.
+        while True:
+            try:
+                span = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                if span is not None:
+                    self._call_on_end(self._async_on_end_processors, span)
+            finally:
+                self._queue.task_done()
+
+    def _call_all(
+        self, method_name: str, deadline: float, *args
+    ) -> Tuple[bool, ...]:
+        """Calls a method of all span processors in parallel.
+
+        Exceptions are logged and count as failed calls.
+
+        Returns:
+            Whether each call returned before the deadline and did not fail.
+        """
+        span_processors = self._span_processors
+        results = [False] * len(span_processors)
+
+        def call(index: int, span_processor: SpanProcessor) -> None:
+            try:
+                result = getattr(span_processor, method_name)(*args)
+            # pylint: disable=broad-except
+            except Exception:
+                logger.exception("Exception in %s().", method_name)
+                return
+            results[index] = result is not False
+
+        if len(span_processors) == 1:
+            call(0, span_processors[0])
+            return tuple(results)
+
+        threads = [
+            threading.Thread(target=call, args=item, daemon=True)
+            for item in enumerate(span_processors)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(max(deadline - time.monotonic(), 0))
+        return tuple(results)
+
+    def shutdown(self, timeout_millis: int = 30000) -> None:
+        """Shuts down all span processors in parallel.
+
+        Args:
+            timeout_millis: The maximum amount of time to wait for the span
+                processors to shut down.
+        """
+        deadline = time.monotonic() + timeout_millis / 1e3
+        self._stop_workers(deadline)
+        if not all(self._call_all("shutdown", deadline)):
+            logger.warning("Timeout was exceeded in shutdown().")
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        """Flushes all span processors in parallel.
+
+        Args:
+            timeout_millis: The maximum amount of time to wait for all span
+                processors to flush.
+
+        Returns:
+            False if the timeout is exceeded or a span processor failed to
+            flush, True otherwise.
+        """
+        deadline = time.monotonic() + timeout_millis / 1e3
+        if not self._wait_for_workers(deadline):
+            logger.warning("Timeout was exceeded in force_flush().")
+            return False
+        remaining_millis = max(int((deadline - time.monotonic()) * 1e3), 0)
+        results = self._call_all("force_flush", deadline, remaining_millis)
+        return all(results)
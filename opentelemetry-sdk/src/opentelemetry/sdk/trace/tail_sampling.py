@@ -0,0 +1,409 @@
+# Copyright 2019, OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tail-based sampling of whole traces.
+
+The `TailSamplingSpanProcessor` holds back the ended spans of a trace until
+the trace is complete and then forwards either all or none of them, depending
+on `TailSamplingPolicy` objects that can look at the whole trace::
+
+    tracer_source.add_span_processor(
+        TailSamplingSpanProcessor(
+            BatchExportSpanProcessor(exporter),
+            [ErrorPolicy(), LatencyPolicy(500), ProbabilisticPolicy(0.01)],
+        )
+    )
+"""
+
+import abc
+import functools
+import logging
+import operator
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, List, Optional, Sequence, Union
+
+from opentelemetry import trace as trace_api
+from opentelemetry.sdk.trace import ReadableSpan, Span, SpanProcessor
+from opentelemetry.sdk.trace.readable_span import (
+    _UNRESOLVED,
+    _resolve_lazy_value,
+)
+from opentelemetry.trace.sampling import ProbabilitySampler
+from opentelemetry.trace.status import StatusCanonicalCode
+from opentelemetry.util import types
+
+logger = logging.getLogger(__name__)
+
+
+class TailSamplingPolicy(abc.ABC):
+    """Interface for deciding whether a complete trace is kept."""
+
+    @abc.abstractmethod
+    def should_sample(
+        self, trace_id: int, spans: Sequence[ReadableSpan]
+    ) -> bool:
+        """Decides whether to keep a trace.
+
+        Args:
+            trace_id: The ID of the trace.
+            spans: The ended spans of the trace, in the order they ended.
+
+        Returns:
+            True if the spans of the trace should be exported.
+        """
+
+
+class ErrorPolicy(TailSamplingPolicy):
+    """Keeps traces with a span whose status is not OK."""
+
+    def should_sample(
+        self, trace_id: int, spans: Sequence[ReadableSpan]
+    ) -> bool:
+        for span in spans:
+            status = span.status
+            if (
+                status is not None
+                and status.canonical_code is not StatusCanonicalCode.OK
+            ):
+                return True
+        return False
+
+
+class LatencyPolicy(TailSamplingPolicy):
+    """Keeps traces that take longer than a threshold.
+
+    The duration of a trace is the time between the start of its earliest
+    span and the end of its latest span.
+
+    Args:
+        threshold_millis: The minimum duration of kept traces.
+    """
+
+    def __init__(self, threshold_millis: float):
+        self._threshold = int(threshold_millis * 1e6)
+
+    def should_sample(
+        self, trace_id: int, spans: Sequence[ReadableSpan]
+    ) -> bool:
+        start_time = min(span.start_time for span in spans)
+        end_time = max(span.end_time for span in spans)
+        return end_time - start_time > self._threshold
+
+
+class AttributePolicy(TailSamplingPolicy):
+    """Keeps traces with a span that has a given attribute.
+
+    `opentelemetry.trace.LazyAttributeValue` values are resolved before they
+    are compared, values that fail to resolve do not match.
+
+    Args:
+        key: The attribute key.
+        value: The attribute value to compare with ``==``, or a predicate
+            that is called with the attribute value.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        value: Union[
+            types.AttributeValue, Callable[[types.AttributeValue], bool]
+        ],
+    ):
+        self._key = key
+        if callable(value):
+            self._predicate = value
+        else:
+            self._predicate = functools.partial(operator.eq, value)
+
+    def should_sample(
+        self, trace_id: int, spans: Sequence[ReadableSpan]
+    ) -> bool:
+        key = self._key
+        for span in spans:
+            attributes = span.attributes
+            if key not in attributes:
+                continue
+            value = attributes[key]
+            if isinstance(value, trace_api.LazyAttributeValue):
+                value = _resolve_lazy_value(key, value)
+                if value is _UNRESOLVED:
+                    continue
+            if self._predicate(value) is True:
+                return True
+        return False
+
+
+class ProbabilisticPolicy(TailSamplingPolicy):
+    """Keeps a fraction of the traces, chosen by trace ID like
+    `opentelemetry.trace.sampling.ProbabilitySampler` does.
+
+    Args:
+        rate: The probability of keeping a trace.
+    """
+
+    def __init__(self, rate: float):
+        self._bound = ProbabilitySampler.get_bound_for_rate(rate)
+
+    def should_sample(
+        self, trace_id: int, spans: Sequence[ReadableSpan]
+    ) -> bool:
+        return trace_id & ProbabilitySampler.CHECK_BYTES < self._bound
+
+
+class _TraceBuffer:
+    """The spans of a trace waiting for a sampling decision."""
+
+    __slots__ = ("spans", "root_span_id", "deadline")
+
+    def __init__(self, deadline: float) -> None:
+        self.spans = []  # type: List[ReadableSpan]
+        self.root_span_id = None  # type: Optional[int]
+        self.deadline = deadline
+
+
+class TailSamplingSpanProcessor(SpanProcessor):
+    """Span processor that samples complete traces.
+
+    The ended spans of each trace are buffered until the trace's local root
+    span ends, or until ``decision_wait_millis`` have passed since its first
+    span started or ended. The trace is then kept if any of ``policies``
+    says so, in which case all of its spans are forwarded to
+    ``span_processor``'s `SpanProcessor.on_end`; otherwise they are dropped.
+    Spans that end after their trace was decided follow that decision.
+    `SpanProcessor.on_start` is forwarded right away for all spans, before
+    their trace is decided.
+
+    Timeouts are checked whenever a span starts or ends and by a worker
+    thread, so traces are decided in time even if no more spans end.
+    `force_flush` and `shutdown` decide all buffered traces.
+
+    Memory is bounded by ``max_traces`` buffered traces and ``max_spans``
+    buffered spans. When either limit is exceeded the oldest trace is
+    decided early, on the spans it has so far. Spans beyond
+    ``max_spans_per_trace`` are dropped.
+
+    The processor keeps statistics in the following attributes:
+
+    * ``sampled_traces``: traces forwarded to ``span_processor``.
+    * ``dropped_traces``: traces that no policy kept.
+    * ``expired_traces``: traces decided because ``decision_wait_millis``
+      passed before their local root ended.
+    * ``evicted_traces``: traces decided early because ``max_traces`` or
+      ``max_spans`` was reached.
+    * ``dropped_spans``: spans dropped because of ``max_spans_per_trace``.
+
+    Args:
+        span_processor: The `SpanProcessor` that receives the spans of kept
+            traces.
+        policies: The `TailSamplingPolicy` objects, a trace is kept if any of
+            them keeps it.
+        decision_wait_millis: The maximum time to wait for the local root of
+            a trace to end.
+        max_traces: The maximum number of buffered traces.
+        max_spans: The maximum number of buffered spans across all traces.
+        max_spans_per_trace: The maximum number of spans kept per trace.
+    """
+
+    def __init__(
+        self,
+        span_processor: SpanProcessor,
+        policies: Sequence[TailSamplingPolicy],
+        decision_wait_millis: float = 30000,
+        max_traces: int = 1000,
+        max_spans: int = 10000,
+        max_spans_per_trace: int = 1000,
+    ):
+        if decision_wait_millis <= 0:
+            raise ValueError("decision_wait_millis must be positive.")
+        if max_traces <= 0:
+            raise ValueError("max_traces must be a positive integer.")
+        if max_spans <= 0:
+            raise ValueError("max_spans must be a positive integer.")
+        if max_spans_per_trace <= 0:
+            raise ValueError("max_spans_per_trace must be a positive integer.")
+
+        self.span_processor = span_processor
+        self.policies = tuple(policies)
+        self.max_traces = max_traces
+        self.max_spans = max_spans
+        self.max_spans_per_trace = max_spans_per_trace
+        self._decision_wait = decision_wait_millis / 1e3
+        self._lock = threading.Lock()
+        self._condition = threading.Condition(self._lock)
+        self._done = False
+        # Buffered traces by trace ID, oldest first.
+        self._traces = OrderedDict()  # type: OrderedDict[int, _TraceBuffer]
+        self._buffered_spans = 0
+        # Recent decisions by trace ID for spans that end late.
+        self._decisions = OrderedDict()  # type: OrderedDict[int, bool]
+
+        # Statistics, see the class docstring.
+        self.sampled_traces = 0
+        self.dropped_traces = 0
+        self.expired_traces = 0
+        self.evicted_traces = 0
+        self.dropped_spans = 0
+
+        self._worker_thread = threading.Thread(
+            target=self._worker, daemon=True
+        )
+        self._worker_thread.start()
+
+    def on_start(self, span: Span) -> None:
+        if not isinstance(span.parent, trace_api.Span):
+            # Spans without a parent in this process are local roots, their
+            # trace is complete once they end.
+            with self._lock:
+                decided = self._expire(time.monotonic())
+                buffer = self._buffer(span.context.trace_id, decided)
+                buffer.root_span_id = span.context.span_id
+            self._forward(decided)
+        self.span_processor.on_start(span)
+
+    def on_end(self, span: ReadableSpan) -> None:
+        trace_id = span.context.trace_id
+        with self._lock:
+            decided = self._expire(time.monotonic())
+            decision = self._decisions.get(trace_id)
+            if decision is None:
+                buffer = self._buffer(trace_id, decided)
+                if len(buffer.spans) < self.max_spans_per_trace:
+                    buffer.spans.append(span)
+                    self._buffered_spans += 1
+                else:
+                    self.dropped_spans += 1
+                if span.context.span_id == buffer.root_span_id:
+                    del self._traces[trace_id]
+                    decided.append(self._decide(trace_id, buffer))
+                while self._buffered_spans > self.max_spans:
+                    self.evicted_traces += 1
+                    decided.append(self._decide(*self._traces.popitem(False)))
+            elif decision:
+                decided.append((span,))
+        self._forward(decided)
+
+    def _buffer(
+        self, trace_id: int, decided: List[Sequence[ReadableSpan]]
+    ) -> _TraceBuffer:
+        """Returns the buffer of a trace, creating it if necessary.
+
+        Must be called with the lock held.
+        """
+        buffer = self._traces.get(trace_id)
+        if buffer is None:
+            if len(self._traces) >= self.max_traces:
+                self.evicted_traces += 1
+                decided.append(self._decide(*self._traces.popitem(False)))
+            buffer = _TraceBuffer(time.monotonic() + self._decision_wait)
+            self._traces[trace_id] = buffer
+        return buffer
+
+    def _expire(self, now: float) -> List[Sequence[ReadableSpan]]:
+        """Decides the traces whose decision wait has passed.
+
+        Must be called with the lock held.
+
+        Returns:
+            The spans to forward.
+        """
+        decided = []  # type: List[Sequence[ReadableSpan]]
+        traces = self._traces
+        while traces:
+            trace_id, buffer = next(iter(traces.items()))
+            if buffer.deadline > now:
+                break
+            del traces[trace_id]
+            self.expired_traces += 1
+            decided.append(self._decide(trace_id, buffer))
+        return decided
+
+    def _worker(self) -> None:
+        """Decides the traces whose decision wait has passed while no spans
+        start or end."""
+        condition = self._condition
+        while True:
+            with condition:
+                if self._done:
+                    return
+                # Traces are buffered oldest first, so the first one expires
+                # first. New traces expire a full decision wait from now.
+                timeout = self._decision_wait
+                for buffer in self._traces.values():
+                    timeout = buffer.deadline - time.monotonic()
+                    break
+                if timeout > 0:
+                    condition.wait(timeout)
+                    if self._done:
+                        return
+                decided = self._expire(time.monotonic())
+            self._forward(decided)
+
+    def _decide(
+        self, trace_id: int, buffer: _TraceBuffer
+    ) -> Sequence[ReadableSpan]:
+        """Decides a trace that was removed from the buffer.
+
+        Must be called with the lock held.
+
+        Returns:
+            The spans to forward, empty if the trace is dropped.
+        """
+        spans = buffer.spans
+        self._buffered_spans -= len(spans)
+        sampled = False
+        if spans:
+            for policy in self.policies:
+                try:
+                    sampled = policy.should_sample(trace_id, spans)
+                # pylint: disable=broad-except
+                except Exception:
+                    logger.exception("Exception in tail sampling policy.")
+                if sampled:
+                    break
+        if sampled:
+            self.sampled_traces += 1
+        else:
+            self.dropped_traces += 1
+        self._decisions[trace_id] = sampled
+        if len(self._decisions) > self.max_traces:
+            self._decisions.popitem(False)
+        return spans if sampled else ()
+
+    def _forward(self, decided: List[Sequence[ReadableSpan]]) -> None:
+        for spans in decided:
+            for span in spans:
+                self.span_processor.on_end(span)
+
+    def _decide_all(self) -> None:
+        with self._lock:
+            decided = [
+                self._decide(trace_id, buffer)
+                for trace_id, buffer in self._traces.items()
+            ]
+            self._traces.clear()
+        self._forward(decided)
+
+    def shutdown(self) -> None:
+        with self._condition:
+            self._done = True
+            self._condition.notify_all()
+        self._worker_thread.join()
+        self._decide_all()
+        self.span_processor.shutdown()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        self._decide_all()
+        return self.span_processor.force_flush(timeout_millis)
@@ -140,3 +140,51 @@ class BoundedDict(MutableMapping):
         # pylint: disable=protected-access
         bounded_dict._dict = mapping
         return bounded_dict
+
+
+class InternTable:
+    """A bounded table of canonical string instances.
+
+    `intern` returns the first instance it saw of each distinct string, so
+    that equal strings from many sources share a single object whose hash is
+    only computed once. Unlike `sys.intern` the table stops growing once it
+    holds ``maxlen`` strings: further strings are returned unchanged and
+    counted in ``dropped``, so high-cardinality values can not grow it
+    without bound. Strings longer than ``max_length`` are never interned.
+    """
+
+    def __init__(self, maxlen, max_length=256):
+        if not isinstance(maxlen, int) or maxlen < 0:
+            raise ValueError
+        self.maxlen = maxlen
+        self.max_length = max_length
+        self.dropped = 0
+        self._strings = {}  # type: dict
+
+    def __repr__(self):
+        return "{}({} strings, maxlen={})".format(
+            type(self).__name__, len(self._strings), self.maxlen
+        )
+
+    def __len__(self):
+        return len(self._strings)
+
+    def intern(self, string):
+        """Returns the canonical instance of ``string``.
+
+        Values that are not strings are returned unchanged.
+        """
+        if type(string) is not str:  # pylint: disable=unidiomatic-typecheck
+            return string
+        strings = self._strings
+        interned = strings.get(string)
+        if interned is not None:
+            return interned
+        if len(string) > self.max_length:
+            return string
+        if len(strings) >= self.maxlen:
+            self.dropped += 1
+            return string
+        # Concurrent inserts may overshoot maxlen by a few strings, setdefault
+        # makes sure they agree on the instance.
+        return strings.setdefault(string, string)
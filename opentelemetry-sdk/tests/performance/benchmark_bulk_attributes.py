@@ -0,0 +1,74 @@
+# Copyright 2019, OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Microbenchmark for setting the attributes of a database client span.
+
+Compares one ``set_attribute`` call per attribute with a single
+``set_attributes`` call, for the attributes the dbapi integration records on
+each query, and validating them when they are set with validating them on
+export. Run it directly::
+
+    python opentelemetry-sdk/tests/performance/benchmark_bulk_attributes.py
+"""
+
+import timeit
+
+from opentelemetry.sdk import trace
+
+ITERATIONS = 100000
+ATTRIBUTES = {
+    "component": "mysql",
+    "db.type": "sql",
+    "db.instance": "inventory",
+    "db.statement": "SELECT * FROM items WHERE id = %s",
+    "db.user": "reader",
+    "net.peer.name": "db.example.com",
+    "net.peer.port": 3306,
+    "db.statement.parameters": "(42,)",
+    "db.statement.columns": ["id", "name", "price", "stock", "updated"],
+}
+
+
+def run(bulk, defer_validation=False, repeat=5):
+    """Returns the nanoseconds per span."""
+    tracer = trace.TracerSource(
+        shutdown_on_exit=False, defer_attribute_validation=defer_validation
+    ).get_tracer(__name__)
+    items = list(ATTRIBUTES.items())
+
+    def one_by_one():
+        with tracer.start_as_current_span("query") as span:
+            for key, value in items:
+                span.set_attribute(key, value)
+
+    def batched():
+        with tracer.start_as_current_span("query") as span:
+            span.set_attributes(ATTRIBUTES)
+
+    seconds = min(
+        timeit.repeat(
+            batched if bulk else one_by_one, number=ITERATIONS, repeat=repeat
+        )
+    )
+    return seconds / ITERATIONS * 1e9
+
+
+def main():
+    print("set_attribute             {:>6.0f} ns/span".format(run(False)))
+    print("set_attributes            {:>6.0f} ns/span".format(run(True)))
+    print("set_attributes, deferred  {:>6.0f} ns/span".format(run(True, True)))
+
+
+if __name__ == "__main__":
+    main()
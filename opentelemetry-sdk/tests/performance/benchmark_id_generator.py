@@ -0,0 +1,78 @@
+# Copyright 2019, OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Throughput benchmark for span and trace ID generation under threads.
+
+Compares the `RandomIdGenerator` with calling the module level ``random``
+generator through functions, the way the SDK used to. Run it directly::
+
+    python opentelemetry-sdk/tests/performance/benchmark_id_generator.py
+"""
+
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from opentelemetry.sdk.trace.id_generator import RandomIdGenerator
+
+ITERATIONS = 100000
+
+
+def _shared_span_id():
+    return random.getrandbits(64)
+
+
+def _shared_trace_id():
+    return random.getrandbits(128)
+
+
+def _shared_random_ids():
+    for _ in range(ITERATIONS):
+        _shared_span_id()
+        _shared_trace_id()
+
+
+def _generator_ids(generator=RandomIdGenerator()):
+    generate_span_id = generator.generate_span_id
+    generate_trace_id = generator.generate_trace_id
+    for _ in range(ITERATIONS):
+        generate_span_id()
+        generate_trace_id()
+
+
+def run(target, thread_count):
+    """Returns the number of span and trace ID pairs generated per second."""
+    with ThreadPoolExecutor(thread_count) as executor:
+        start = time.perf_counter()
+        futures = [executor.submit(target) for _ in range(thread_count)]
+        for future in futures:
+            future.result()
+        return thread_count * ITERATIONS / (time.perf_counter() - start)
+
+
+def main():
+    for thread_count in (1, 4, 16):
+        for name, target in (
+            ("random.getrandbits", _shared_random_ids),
+            ("RandomIdGenerator", _generator_ids),
+        ):
+            print(
+                "{:>2} thread(s), {:<20} {:>10.0f} ID pairs/s".format(
+                    thread_count, name, run(target, thread_count)
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
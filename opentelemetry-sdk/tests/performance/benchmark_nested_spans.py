@@ -0,0 +1,64 @@
+# Copyright 2019, OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Microbenchmark for nested ``start_as_current_span`` blocks.
+
+Measures the nanoseconds per span when entering and leaving spans nested 1,
+10 and 50 deep, for sampled and unsampled traces. Run it directly::
+
+    python opentelemetry-sdk/tests/performance/benchmark_nested_spans.py
+"""
+
+import timeit
+
+from opentelemetry.sdk import trace
+from opentelemetry.trace import sampling
+
+SPANS = 50000
+DEPTHS = (1, 10, 50)
+
+
+def run(sampler, depth, repeat=5):
+    """Returns the nanoseconds per span of ``depth`` nested spans."""
+    tracer = trace.TracerSource(
+        sampler=sampler, shutdown_on_exit=False
+    ).get_tracer(__name__)
+
+    def nested(level):
+        with tracer.start_as_current_span("span"):
+            if level > 1:
+                nested(level - 1)
+
+    number = SPANS // depth
+    seconds = min(
+        timeit.repeat(lambda: nested(depth), number=number, repeat=repeat)
+    )
+    return seconds / (number * depth) * 1e9
+
+
+def main():
+    for name, sampler in (
+        ("ALWAYS_ON", sampling.ALWAYS_ON),
+        ("ALWAYS_OFF", sampling.ALWAYS_OFF),
+    ):
+        for depth in DEPTHS:
+            print(
+                "{:<10} depth {:>2} {:>7.0f} ns/span".format(
+                    name, depth, run(sampler, depth)
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+# Copyright 2019, OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Allocation benchmark for the span lifecycle.
+
+Measures the bytes allocated while a span is started as the current span
+and ended, including short-lived objects like sampling decisions that are
+freed again before the span ends. ``tracemalloc`` is restarted for every
+measurement so that its peak covers a single span. The numbers depend on
+the CPython version, so this is a benchmark rather than a test. Run it
+directly::
+
+    python opentelemetry-sdk/tests/performance/benchmark_span_allocations.py
+"""
+
+import gc
+import tracemalloc
+
+from opentelemetry.sdk import trace
+from opentelemetry.trace import sampling
+
+REPEAT = 20
+
+
+def _ended_span(tracer):
+    with tracer.start_as_current_span("span"):
+        pass
+
+
+def peak_bytes_per_span(sampler, repeat=REPEAT):
+    """Returns the peak number of bytes allocated during the lifecycle of a
+    span, the lowest of ``repeat`` measurements.
+    """
+    tracer = trace.TracerSource(
+        sampler=sampler, shutdown_on_exit=False
+    ).get_tracer(__name__)
+    # Warm up caches and lazily initialized module state.
+    _ended_span(tracer)
+    results = []
+    for _ in range(repeat):
+        gc.collect()
+        tracemalloc.start()
+        try:
+            before = tracemalloc.get_traced_memory()[0]
+            _ended_span(tracer)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        results.append(peak - before)
+    return min(results)
+
+
+def main():
+    for name, sampler in (
+        ("ALWAYS_ON", sampling.ALWAYS_ON),
+        ("ALWAYS_OFF", sampling.ALWAYS_OFF),
+    ):
+        print(
+            "{:<10} {:>6} bytes/span".format(
+                name, peak_bytes_per_span(sampler)
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
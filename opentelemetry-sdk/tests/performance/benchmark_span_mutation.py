@@ -0,0 +1,90 @@
+# Copyright 2019, OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Multi-threaded microbenchmark for span mutation.
+
+Each thread either records into its own spans or into a single span shared by
+all threads, which is where lock contention shows up. Run it directly::
+
+    python opentelemetry-sdk/tests/performance/benchmark_span_mutation.py
+"""
+
+import threading
+import time
+
+from opentelemetry.sdk import trace
+
+ITERATIONS = 20000
+ATTRIBUTE_KEYS = tuple("attr-{}".format(index) for index in range(8))
+
+
+def _record(span, iterations):
+    for index in range(iterations):
+        span.set_attribute(ATTRIBUTE_KEYS[index % 8], index)
+        if not index % 8:
+            span.add_event("event")
+
+
+def _own_spans(tracer, iterations):
+    for _ in range(iterations // 100):
+        span = tracer.start_span("span", parent=None)
+        _record(span, 100)
+        span.end()
+
+
+def run(thread_count, shared, **tracer_source_kwargs):
+    """Returns the number of span operations per second."""
+    tracer = trace.TracerSource(
+        shutdown_on_exit=False, **tracer_source_kwargs
+    ).get_tracer(__name__)
+    shared_span = tracer.start_span("shared", parent=None)
+
+    if shared:
+        target, args = _record, (shared_span, ITERATIONS)
+    else:
+        target, args = _own_spans, (tracer, ITERATIONS)
+    threads = [
+        threading.Thread(target=target, args=args) for _ in range(thread_count)
+    ]
+
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    return thread_count * ITERATIONS / elapsed
+
+
+def main():
+    for thread_count in (1, 4):
+        print(
+            "{} thread(s), own spans:            {:>10.0f} ops/s".format(
+                thread_count, run(thread_count, shared=False)
+            )
+        )
+        print(
+            "{} thread(s), one shared span:      {:>10.0f} ops/s".format(
+                thread_count, run(thread_count, shared=True)
+            )
+        )
+    print(
+        "1 thread(s), own spans, unlocked:   {:>10.0f} ops/s".format(
+            run(1, shared=False, thread_safe_spans=False)
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+# Copyright 2019, OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark for garbage collections with and without a `SpanPool`.
+
+Starts and ends spans that a `BatchExportSpanProcessor` exports to an
+exporter that discards them, and counts the garbage collections and their
+total pause time. Run it directly::
+
+    python opentelemetry-sdk/tests/performance/benchmark_span_pool.py
+"""
+
+import gc
+import time
+
+from opentelemetry.sdk import trace
+from opentelemetry.sdk.trace import export
+
+BATCHES = 50
+BATCH_SIZE = 2048
+
+
+class _NullSpanExporter(export.SpanExporter):
+    def export(self, spans):
+        return export.SpanExportResult.SUCCESS
+
+
+def run(span_pool=None):
+    """Returns the number of collections per generation, the total pause in
+    milliseconds and the number of spans recycled."""
+    tracer_source = trace.TracerSource(
+        shutdown_on_exit=False, span_pool=span_pool
+    )
+    span_processor = export.BatchExportSpanProcessor(
+        _NullSpanExporter(),
+        max_queue_size=BATCH_SIZE,
+        max_export_batch_size=BATCH_SIZE,
+        span_pool=span_pool,
+    )
+    tracer_source.add_span_processor(span_processor)
+    tracer = tracer_source.get_tracer(__name__)
+
+    collections = [0, 0, 0]
+    pause = [0.0]
+    started = [0.0]
+
+    def callback(phase, info):
+        if phase == "start":
+            started[0] = time.perf_counter()
+        else:
+            collections[info["generation"]] += 1
+            pause[0] += time.perf_counter() - started[0]
+
+    gc.collect()
+    gc.callbacks.append(callback)
+    try:
+        for _ in range(BATCHES):
+            for _ in range(BATCH_SIZE):
+                with tracer.start_as_current_span("span") as span:
+                    span.set_attribute("component", "internal")
+            span = None
+            span_processor.force_flush()
+    finally:
+        gc.callbacks.remove(callback)
+        span_processor.shutdown()
+    recycled = 0 if span_pool is None else span_pool.released_spans
+    return collections, pause[0] * 1e3, recycled
+
+
+def main():
+    for name, span_pool in (
+        ("without pool", None),
+        ("with pool   ", trace.SpanPool(BATCH_SIZE)),
+    ):
+        collections, pause, recycled = run(span_pool)
+        print(
+            "{}: collections {}, {:.1f} ms paused, {} spans recycled".format(
+                name, collections, pause, recycled
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+# Copyright 2019, OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Microbenchmark for spans that the sampler drops.
+
+Measures the nanoseconds spent per unsampled ``start_as_current_span`` block,
+with and without attributes. Run it directly::
+
+    python opentelemetry-sdk/tests/performance/benchmark_unsampled_span.py
+"""
+
+import timeit
+
+from opentelemetry.sdk import trace
+from opentelemetry.trace import sampling
+
+ITERATIONS = 100000
+ATTRIBUTES = {"component": "http", "http.method": "GET", "http.status": 200}
+
+
+def run(sampler, attributes=None, repeat=5):
+    """Returns the nanoseconds per unsampled span."""
+    tracer = trace.TracerSource(
+        sampler=sampler, shutdown_on_exit=False
+    ).get_tracer(__name__)
+
+    def unsampled_span():
+        with tracer.start_as_current_span("span", attributes=attributes):
+            pass
+
+    seconds = min(
+        timeit.repeat(unsampled_span, number=ITERATIONS, repeat=repeat)
+    )
+    return seconds / ITERATIONS * 1e9
+
+
+def main():
+    for name, sampler in (
+        ("ALWAYS_OFF", sampling.ALWAYS_OFF),
+        ("DEFAULT_OFF", sampling.DEFAULT_OFF),
+    ):
+        print("{:<12}            {:>6.0f} ns/span".format(name, run(sampler)))
+        print(
+            "{:<12} attributes {:>6.0f} ns/span".format(
+                name, run(sampler, ATTRIBUTES)
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+# Copyright 2019, OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests that the span lifecycle shares the objects it can share.
+
+Statuses, sampling decisions and empty attribute, event and link containers
+are the same for many spans and must not be allocated again for every span.
+The bytes allocated per span are measured by
+``benchmark_span_allocations.py``.
+"""
+
+import unittest
+
+from opentelemetry import trace as trace_api
+from opentelemetry.sdk import trace
+from opentelemetry.sdk.trace.export import SimpleExportSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+    InMemorySpanExporter,
+)
+from opentelemetry.trace import sampling
+
+
+def _ended_spans(sampler, count=2):
+    tracer_source = trace.TracerSource(sampler=sampler, shutdown_on_exit=False)
+    exporter = InMemorySpanExporter()
+    tracer_source.add_span_processor(SimpleExportSpanProcessor(exporter))
+    tracer = tracer_source.get_tracer(__name__)
+    for _ in range(count):
+        with tracer.start_as_current_span("span"):
+            pass
+    return exporter.get_finished_spans()
+
+
+class TestSpanAllocations(unittest.TestCase):
+    def test_shared_status(self):
+        spans = _ended_spans(sampling.ALWAYS_ON)
+        self.assertIs(spans[0].status, spans[1].status)
+
+    def test_shared_empty_containers(self):
+        for span in _ended_spans(sampling.ALWAYS_ON):
+            self.assertIs(span.attributes, trace.Span.empty_attributes)
+            self.assertIs(span.events, trace.Span.empty_events)
+            self.assertIs(span.links, trace.Span.empty_links)
+        context = trace_api.SpanContext(1, 2)
+        self.assertIs(
+            trace_api.Link(context).attributes,
+            trace_api.Link(context).attributes,
+        )
+
+    def test_shared_decisions(self):
+        for sampler in (
+            sampling.ALWAYS_ON,
+            sampling.ALWAYS_OFF,
+            sampling.DEFAULT_ON,
+            sampling.DEFAULT_OFF,
+            sampling.RateLimitingSampler(0),
+        ):
+            decisions = [
+                sampler.should_sample(None, trace_id, 1, "span")
+                for trace_id in (1, 2)
+            ]
+            self.assertIs(decisions[0], decisions[1])
+        self.assertIs(
+            sampling.Decision(True).attributes,
+            sampling.Decision(False).attributes,
+        )
@@ -0,0 +1,171 @@
+# Copyright 2019, OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Memory footprint benchmarks for SDK spans.
+
+The tests assert an upper bound on the number of bytes retained per ended
+span so that layout regressions fail the build. The bounds leave headroom for
+the differences between CPython versions, other interpreters lack
+`tracemalloc` or lay out objects differently and skip the tests. Run this
+module directly to print the measured values::
+
+    python opentelemetry-sdk/tests/performance/test_span_memory.py
+"""
+
+import gc
+import platform
+import unittest
+
+from opentelemetry.sdk import trace
+
+try:
+    import tracemalloc
+except ImportError:  # PyPy
+    tracemalloc = None
+
+SPAN_COUNT = 2000
+LARGE_VALUE_LENGTH = 10000
+ADVERSARIAL_LIMITS = trace.SpanLimits(
+    max_attributes=16,
+    max_events=16,
+    max_attributes_per_event=4,
+    max_attribute_length=64,
+)
+
+
+def _bare_span(tracer):
+    span = tracer.start_span("span", parent=None)
+    span.end()
+    return span
+
+
+def _span_with_data(tracer):
+    span = tracer.start_span("span", parent=None)
+    span.set_attribute("component", "http")
+    span.set_attribute("http.method", "GET")
+    span.set_attribute("http.status_code", 200)
+    span.add_event("event")
+    span.end()
+    return span
+
+
+def _span_with_built_strings(tracer):
+    # Names and keys formatted for every span, like instrumentations do.
+    span = tracer.start_span("GET /{}".format("users"), parent=None)
+    for key in ("method", "url", "status_code", "host"):
+        span.set_attribute("http.{}".format(key), 1)
+    span.end()
+    return span
+
+
+def _span_with_constant_strings(tracer):
+    span = tracer.start_span("GET /users", parent=None)
+    for key in ("http.method", "http.url", "http.status_code", "http.host"):
+        span.set_attribute(key, 1)
+    span.end()
+    return span
+
+
+def _large_value():
+    # A new string every time, like a bulk INSERT statement would be.
+    return "x" * LARGE_VALUE_LENGTH
+
+
+def _adversarial_span(tracer):
+    span = tracer.start_span("span", parent=None)
+    span.set_attributes(
+        {
+            "db.statement.{}".format(index): _large_value()
+            for index in range(64)
+        }
+    )
+    span.set_attribute("db.rows", [_large_value() for _ in range(100)])
+    for _ in range(16):
+        span.add_event(
+            "event",
+            {"value.{}".format(index): _large_value() for index in range(8)},
+        )
+    span.end()
+    return span
+
+
+def bytes_per_span(make_span, count=SPAN_COUNT, span_limits=None):
+    """Returns the average number of bytes retained by a span created with
+    ``make_span``.
+    """
+    tracer = trace.TracerSource(
+        shutdown_on_exit=False, span_limits=span_limits
+    ).get_tracer(__name__)
+    # Warm up caches, lazily initialized module state and interned strings.
+    make_span(tracer)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        spans = [make_span(tracer) for _ in range(count)]
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    # The list holding the spans is not part of the span footprint.
+    retained = after - before - spans.__sizeof__()
+    return retained / count
+
+
+@unittest.skipIf(
+    platform.python_implementation() != "CPython",
+    "Memory footprints are measured with CPython's tracemalloc.",
+)
+class TestSpanMemory(unittest.TestCase):
+    def test_bare_span(self):
+        self.assertLess(bytes_per_span(_bare_span), 1000)
+
+    def test_span_with_data(self):
+        self.assertLess(bytes_per_span(_span_with_data), 1600)
+
+    def test_span_with_built_strings(self):
+        # The name and keys are interned, so they are not retained per span
+        # and the span is as large as one with constant strings. A single
+        # retained string would take more than 48 bytes.
+        self.assertLess(
+            bytes_per_span(_span_with_built_strings)
+            - bytes_per_span(_span_with_constant_strings),
+            48,
+        )
+
+    def test_adversarial_span(self):
+        # 16 attributes and 16 events with 4 attributes each, all values
+        # truncated to 64 characters, where the default limits retain
+        # megabytes.
+        self.assertLess(
+            bytes_per_span(
+                _adversarial_span, count=50, span_limits=ADVERSARIAL_LIMITS
+            ),
+            50000,
+        )
+
+
+if __name__ == "__main__":
+    for _name, _factory in (
+        ("bare span", _bare_span),
+        ("span with 3 attributes and 1 event", _span_with_data),
+        ("span with formatted name and keys", _span_with_built_strings),
+    ):
+        print("{}: {:.0f} bytes/span".format(_name, bytes_per_span(_factory)))
+    for _limits in (trace.SpanLimits(), ADVERSARIAL_LIMITS):
+        print(
+            "adversarial span with {}: {:.0f} bytes/span".format(
+                _limits,
+                bytes_per_span(_adversarial_span, 20, span_limits=_limits),
+            )
+        )
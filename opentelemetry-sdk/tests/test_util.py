@@ -15,7 +15,7 @@
 import collections
 import unittest
 
-from opentelemetry.sdk.util import BoundedDict, BoundedList
+from opentelemetry.sdk.util import BoundedDict, BoundedList, InternTable
 
 
 class TestBoundedList(unittest.TestCase):
@@ -211,3 +211,40 @@ class TestBoundedDict(unittest.TestCase):
 
         with self.assertRaises(KeyError):
             _ = bdict["new-name"]
+
+
+class TestInternTable(unittest.TestCase):
+    def test_negative_maxlen(self):
+        with self.assertRaises(ValueError):
+            InternTable(-1)
+
+    def test_intern(self):
+        table = InternTable(2, max_length=11)
+        first = "".join(("http", ".method"))
+        second = "".join(("http", ".method"))
+        self.assertIsNot(first, second)
+        self.assertIs(table.intern(first), first)
+        self.assertIs(table.intern(second), first)
+
+        # Strings that are too long are not stored.
+        long_string = "".join(("db", ".statement"))
+        self.assertIs(table.intern(long_string), long_string)
+        self.assertEqual(len(table), 1)
+
+        # Values that are not strings are returned unchanged.
+        self.assertEqual(table.intern(None), None)
+        self.assertEqual(table.intern(42), 42)
+
+    def test_maxlen(self):
+        table = InternTable(2)
+        for key in ("a", "b", "c"):
+            table.intern("".join((key, "-key")))
+        self.assertEqual(len(table), 2)
+        self.assertEqual(table.dropped, 1)
+
+        # Known strings are still interned once the table is full.
+        key = "".join(("a", "-key"))
+        self.assertIsNot(table.intern(key), key)
+        key = "".join(("c", "-key"))
+        self.assertIs(table.intern(key), key)
+        self.assertEqual(table.dropped, 2)
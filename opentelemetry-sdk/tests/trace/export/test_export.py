@@ -12,14 +12,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import threading
 import time
 import unittest
 from logging import WARNING
 from unittest import mock
 
+from opentelemetry import context
 from opentelemetry import trace as trace_api
 from opentelemetry.sdk import trace
 from opentelemetry.sdk.trace import export
+from opentelemetry.sdk.trace.export import in_memory_span_exporter
 
 
 class MySpanExporter(export.SpanExporter):
@@ -71,6 +74,17 @@ class TestSimpleExportSpanProcessor(unittest.TestCase):
         span_processor.shutdown()
         self.assertTrue(my_exporter.is_shutdown)
 
+    def test_simple_span_processor_suppresses_instrumentation(self):
+        suppressed = []
+        exporter = mock.Mock(spec=export.SpanExporter)
+        exporter.export.side_effect = lambda spans: suppressed.append(
+            context.is_instrumentation_suppressed()
+        )
+        span_processor = export.SimpleExportSpanProcessor(exporter)
+        _create_start_and_end_span("foo", span_processor)
+        self.assertEqual(suppressed, [True])
+        self.assertFalse(context.is_instrumentation_suppressed())
+
     def test_simple_span_processor_no_context(self):
         """Check that we process spans that are never made active.
 
@@ -204,6 +218,93 @@ class TestBatchExportSpanProcessor(unittest.TestCase):
         self.assertEqual(len(spans_names_list), 1024)
         span_processor.shutdown()
 
+    def test_batch_span_processor_lazy_attributes(self):
+        """Lazy attribute values are resolved on the worker thread."""
+        exported_spans = []
+        exporter = mock.Mock(spec=export.SpanExporter)
+        exporter.export.side_effect = exported_spans.extend
+        span_processor = export.BatchExportSpanProcessor(exporter)
+        threads = []
+
+        def resolve():
+            threads.append(threading.current_thread())
+            return "value"
+
+        span = trace.Span(
+            "lazy",
+            mock.Mock(spec=trace_api.SpanContext),
+            span_processor=span_processor,
+        )
+        span.start()
+        span.set_attribute("lazy", trace_api.LazyAttributeValue(resolve))
+        span.end()
+
+        self.assertTrue(span_processor.force_flush())
+        self.assertEqual(exported_spans[0].attributes["lazy"], "value")
+        self.assertEqual(threads, [span_processor.worker_thread])
+        span_processor.shutdown()
+
+    def test_batch_span_processor_deferred_validation(self):
+        exported_spans = []
+        exporter = mock.Mock(spec=export.SpanExporter)
+        exporter.export.side_effect = exported_spans.extend
+        span_processor = export.BatchExportSpanProcessor(exporter)
+        tracer_source = trace.TracerSource(defer_attribute_validation=True)
+        tracer_source.add_span_processor(span_processor)
+        tracer = tracer_source.get_tracer(__name__)
+
+        with tracer.start_as_current_span("root") as span:
+            span.set_attributes(
+                {"valid": [1, 2], "invalid": {}, "mixed": [1, "two"]}
+            )
+            span.set_attribute("component", "http")
+            # Stored unchecked until the span is exported.
+            self.assertEqual(len(span.attributes), 4)
+
+        with self.assertLogs(level=WARNING):
+            self.assertTrue(span_processor.force_flush())
+        self.assertEqual(
+            dict(exported_spans[0].attributes),
+            {"valid": [1, 2], "component": "http"},
+        )
+        self.assertEqual(exported_spans[0].dropped_attributes, 2)
+        span_processor.shutdown()
+
+    def test_batch_span_processor_span_pool(self):
+        span_pool = trace.SpanPool()
+        exporter = in_memory_span_exporter.InMemorySpanExporter()
+        span_processor = export.BatchExportSpanProcessor(
+            exporter, span_pool=span_pool
+        )
+        tracer_source = trace.TracerSource(
+            span_pool=span_pool, shutdown_on_exit=False
+        )
+        tracer_source.add_span_processor(span_processor)
+        tracer = tracer_source.get_tracer(__name__)
+
+        with tracer.start_as_current_span("exported") as span:
+            span.set_attribute("component", "http")
+        span_id = id(span)
+        del span
+        self.assertTrue(span_processor.force_flush())
+        self.assertEqual(len(span_pool), 1)
+
+        # The exporter keeps the record, which stays valid when the span is
+        # reused.
+        with tracer.start_as_current_span("reused") as span:
+            self.assertEqual(id(span), span_id)
+        record = exporter.get_finished_spans()[0]
+        self.assertEqual(record.name, "exported")
+        self.assertEqual(record.attributes["component"], "http")
+        self.assertTrue(str(record).startswith('ReadableSpan(name="exported"'))
+        del span
+
+        # Spans are only released after a successful export.
+        exporter.shutdown()
+        self.assertTrue(span_processor.force_flush())
+        self.assertEqual(len(span_pool), 0)
+        span_processor.shutdown()
+
     def test_batch_span_processor_scheduled_delay(self):
         """Test that spans are exported each schedule_delay_millis"""
         spans_names_list = []
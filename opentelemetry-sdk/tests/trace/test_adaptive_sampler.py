@@ -0,0 +1,131 @@
+# Copyright 2019, OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from unittest import mock
+
+from opentelemetry import trace as trace_api
+from opentelemetry.sdk import trace
+from opentelemetry.sdk.trace.adaptive_sampler import AdaptiveSampler
+
+
+def start_spans(sampler, count):
+    for trace_id in range(count):
+        sampler.should_sample(None, trace_id, 0xDEADBEEF, "span")
+
+
+@mock.patch("time.monotonic")
+class TestAdaptiveSampler(unittest.TestCase):
+    def test_adjusts_to_target(self, monotonic):
+        monotonic.return_value = 100.0
+        sampler = AdaptiveSampler(10)
+        self.assertEqual(sampler.rate, 1.0)
+
+        # 1000 spans/s with a target of 10 spans/s.
+        start_spans(sampler, 1000)
+        monotonic.return_value = 101.0
+        start_spans(sampler, 1)
+        self.assertAlmostEqual(sampler.rate, 10 / 1000, 4)
+
+        # Traffic drops to 100 spans/s, the rate can at most double.
+        start_spans(sampler, 99)
+        monotonic.return_value = 102.0
+        start_spans(sampler, 1)
+        self.assertAlmostEqual(sampler.rate, 20 / 1000, 4)
+        for second in range(103, 106):
+            start_spans(sampler, 99)
+            monotonic.return_value = float(second)
+            start_spans(sampler, 1)
+        self.assertAlmostEqual(sampler.rate, 10 / 100, 4)
+
+    def test_samples_new_traces_by_rate(self, monotonic):
+        monotonic.return_value = 100.0
+        sampler = AdaptiveSampler(1, initial_rate=0.5)
+        self.assertTrue(
+            sampler.should_sample(
+                None, 0x7FFFFFFFFFFFFFFF, 0xDEADBEEF, "span"
+            ).sampled
+        )
+        self.assertFalse(
+            sampler.should_sample(
+                None, 0x8000000000000000, 0xDEADBEEF, "span"
+            ).sampled
+        )
+        sampled_parent = trace_api.SpanContext(
+            0x8000000000000000,
+            0xDEADBEEF,
+            trace_api.TraceOptions(trace_api.TraceOptions.SAMPLED),
+        )
+        self.assertTrue(
+            sampler.should_sample(
+                sampled_parent, 0x8000000000000000, 0xDEADBEF0, "span"
+            ).sampled
+        )
+
+    def test_queue_fill(self, monotonic):
+        monotonic.return_value = 100.0
+        span_processor = mock.Mock(
+            spec=trace.export.BatchExportSpanProcessor,
+            queue=[None] * 75,
+            max_queue_size=100,
+        )
+        sampler = AdaptiveSampler(1000, span_processor=span_processor)
+
+        # Below the target, but the queue is three quarters full.
+        start_spans(sampler, 10)
+        monotonic.return_value = 101.0
+        start_spans(sampler, 1)
+        self.assertAlmostEqual(sampler.rate, 0.5)
+
+        span_processor.queue = [None] * 100
+        monotonic.return_value = 102.0
+        start_spans(sampler, 1)
+        self.assertEqual(sampler.rate, 0.0)
+
+        # Once the queue drains the rate recovers from zero.
+        span_processor.queue = []
+        start_spans(sampler, 1999)
+        monotonic.return_value = 103.0
+        start_spans(sampler, 1)
+        self.assertAlmostEqual(sampler.rate, 0.5)
+
+    def test_min_rate(self, monotonic):
+        monotonic.return_value = 100.0
+        sampler = AdaptiveSampler(1, min_rate=0.1)
+        start_spans(sampler, 1000)
+        monotonic.return_value = 101.0
+        start_spans(sampler, 1)
+        self.assertEqual(sampler.rate, 0.1)
+
+    def test_invalid_arguments(self, monotonic):
+        monotonic.return_value = 100.0
+        with self.assertRaises(ValueError):
+            AdaptiveSampler(0)
+        with self.assertRaises(ValueError):
+            AdaptiveSampler(1, adjust_interval_millis=0)
+        with self.assertRaises(ValueError):
+            AdaptiveSampler(1, initial_rate=0.1, min_rate=0.2)
+        with self.assertRaises(ValueError):
+            AdaptiveSampler(1, initial_rate=2)
+
+
+class TestTracerSourceSampling(unittest.TestCase):
+    def test_root_sampled_flag(self):
+        tracer = trace.TracerSource(
+            sampler=trace_api.sampling.DEFAULT_ON
+        ).get_tracer(__name__)
+        with tracer.start_as_current_span("root") as root:
+            self.assertTrue(root.get_context().trace_options.sampled)
+            with tracer.start_as_current_span("child") as child:
+                self.assertIsInstance(child, trace.Span)
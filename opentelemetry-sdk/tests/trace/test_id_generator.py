@@ -0,0 +1,112 @@
+# Copyright 2019, OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import threading
+import unittest
+from unittest import mock
+
+from opentelemetry.sdk import trace
+from opentelemetry.sdk.trace.id_generator import IdGenerator, RandomIdGenerator
+
+
+class SequentialIdGenerator(IdGenerator):
+    def __init__(self):
+        self.next_id = 0
+
+    def generate_span_id(self):
+        self.next_id += 1
+        return self.next_id
+
+    def generate_trace_id(self):
+        self.next_id += 1
+        return self.next_id
+
+
+class TestRandomIdGenerator(unittest.TestCase):
+    def test_id_range(self):
+        generator = RandomIdGenerator()
+        for _ in range(100):
+            span_id = generator.generate_span_id()
+            trace_id = generator.generate_trace_id()
+            self.assertTrue(0 < span_id < 2 ** 64)
+            self.assertTrue(0 < trace_id < 2 ** 128)
+
+    def test_zero_is_skipped(self):
+        generator = RandomIdGenerator()
+        with mock.patch("random.getrandbits", side_effect=[0, 0, 7, 9]):
+            self.assertEqual(generator.generate_span_id(), 7)
+            self.assertEqual(generator.generate_trace_id(), 9)
+
+    def test_unique_across_threads(self):
+        generator = RandomIdGenerator()
+        span_ids = []
+
+        def generate():
+            ids = [generator.generate_span_id() for _ in range(1000)]
+            span_ids.extend(ids)
+
+        threads = [threading.Thread(target=generate) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(set(span_ids)), 4000)
+
+    def test_reseed(self):
+        with mock.patch("random.seed") as seed:
+            RandomIdGenerator().reseed()
+        seed.assert_called_once_with()
+
+    @unittest.skipUnless(
+        hasattr(os, "register_at_fork"), "requires os.register_at_fork"
+    )
+    def test_fork_reseeds(self):
+        generator = RandomIdGenerator()
+        generator.generate_span_id()
+
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover
+            os.close(read_fd)
+            os.write(write_fd, str(generator.generate_span_id()).encode())
+            os._exit(0)  # pylint: disable=protected-access
+
+        os.close(write_fd)
+        with os.fdopen(read_fd) as child_output:
+            child_span_id = int(child_output.read())
+        os.waitpid(pid, 0)
+        self.assertNotEqual(child_span_id, generator.generate_span_id())
+
+
+class TestTracerSourceIdGenerator(unittest.TestCase):
+    def test_custom_id_generator(self):
+        tracer_source = trace.TracerSource(
+            id_generator=SequentialIdGenerator()
+        )
+        tracer = tracer_source.get_tracer(__name__)
+        with tracer.start_as_current_span("root") as root:
+            with tracer.start_as_current_span("child") as child:
+                pass
+
+        self.assertEqual(root.context.trace_id, 1)
+        self.assertEqual(root.context.span_id, 2)
+        self.assertEqual(child.context.trace_id, 1)
+        self.assertEqual(child.context.span_id, 3)
+
+    def test_default_id_generator(self):
+        self.assertIsInstance(
+            trace.TracerSource().id_generator, RandomIdGenerator
+        )
@@ -0,0 +1,141 @@
+# Copyright 2019, OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from unittest import mock
+
+from opentelemetry import trace as trace_api
+from opentelemetry.sdk import trace
+
+
+class TestSpanLimits(unittest.TestCase):
+    def setUp(self):
+        self.tracer = trace.TracerSource().get_tracer(__name__)
+
+    def test_attributes_dropped(self):
+        with self.tracer.start_as_current_span("root") as root:
+            for index in range(trace.MAX_NUM_ATTRIBUTES + 2):
+                root.set_attribute("attr-{}".format(index), index)
+            # overwriting an existing key does not drop anything
+            root.set_attribute("attr-2", "updated")
+
+            self.assertEqual(len(root.attributes), trace.MAX_NUM_ATTRIBUTES)
+            self.assertEqual(root.dropped_attributes, 2)
+            self.assertNotIn("attr-0", root.attributes)
+            self.assertNotIn("attr-1", root.attributes)
+            # the updated key became the newest one
+            self.assertEqual(list(root.attributes)[-1], "attr-2")
+
+    def test_events_dropped(self):
+        with self.tracer.start_as_current_span("root") as root:
+            for index in range(trace.MAX_NUM_EVENTS + 3):
+                root.add_event("event-{}".format(index))
+
+            self.assertEqual(len(root.events), trace.MAX_NUM_EVENTS)
+            self.assertEqual(root.dropped_events, 3)
+            self.assertEqual(root.events[0].name, "event-3")
+
+    def test_links_dropped(self):
+        links = [
+            trace_api.Link(trace_api.SpanContext(1, index + 1))
+            for index in range(trace.MAX_NUM_LINKS + 1)
+        ]
+        with self.tracer.start_as_current_span("root", links=links) as root:
+            self.assertEqual(len(root.links), trace.MAX_NUM_LINKS)
+            self.assertEqual(root.dropped_links, 1)
+            self.assertEqual(root.links[0].context.span_id, 2)
+
+    def test_span_limits(self):
+        limits = trace.SpanLimits(
+            max_attributes=2,
+            max_events=2,
+            max_links=1,
+            max_attributes_per_event=1,
+            max_attribute_length=3,
+        )
+        tracer = trace.TracerSource(span_limits=limits).get_tracer(__name__)
+        links = [
+            trace_api.Link(trace_api.SpanContext(1, index + 1))
+            for index in range(3)
+        ]
+        with tracer.start_as_current_span(
+            "root", attributes={"component": "http"}, links=links
+        ) as root:
+            root.set_attributes(
+                {"db.statement": "SELECT", "db.rows": ["abcd", "e", "f", "g"]}
+            )
+            for index in range(3):
+                root.add_event(
+                    "event-{}".format(index), {"a": "long", "b": "value"}
+                )
+
+        self.assertEqual(
+            dict(root.attributes),
+            {"db.statement": "SEL", "db.rows": ["abc", "e", "f"]},
+        )
+        self.assertEqual(root.dropped_attributes, 1)
+        self.assertEqual(
+            [event.name for event in root.events], ["event-1", "event-2"]
+        )
+        self.assertEqual(dict(root.events[0].attributes), {"a": "lon"})
+        self.assertEqual(root.dropped_events, 1)
+        self.assertEqual(len(root.links), 1)
+        self.assertEqual(root.links[0].context.span_id, 3)
+        self.assertEqual(root.dropped_links, 2)
+
+    def test_zero_span_limits(self):
+        limits = trace.SpanLimits(max_attributes=0, max_events=0, max_links=0)
+        tracer = trace.TracerSource(span_limits=limits).get_tracer(__name__)
+        links = [trace_api.Link(trace_api.SpanContext(1, 2))]
+        with tracer.start_as_current_span(
+            "root", attributes={"component": "http"}, links=links
+        ) as root:
+            root.set_attribute("db.statement", "SELECT")
+            root.add_event("event")
+
+        self.assertEqual(len(root.attributes), 0)
+        self.assertEqual(root.dropped_attributes, 2)
+        self.assertEqual(len(root.events), 0)
+        self.assertEqual(root.dropped_events, 1)
+        self.assertEqual(len(root.links), 0)
+        self.assertEqual(root.dropped_links, 1)
+
+    def test_lazy_attribute_limits(self):
+        limits = trace.SpanLimits(max_attribute_length=3)
+        tracer_source = trace.TracerSource(span_limits=limits)
+        span_processor = mock.Mock(spec=trace.SpanProcessor)
+        tracer_source.add_span_processor(span_processor)
+        tracer = tracer_source.get_tracer(__name__)
+        with tracer.start_as_current_span("root") as root:
+            root.set_attribute(
+                "db.statement.parameters",
+                trace_api.LazyAttributeValue(lambda: "('a', 'b')"),
+            )
+        readable_span = span_processor.on_end.call_args[0][0]
+        self.assertIs(readable_span.limits, limits)
+        self.assertEqual(
+            dict(readable_span.resolve_attributes().attributes),
+            {"db.statement.parameters": "('a"},
+        )
+
+    def test_invalid_span_limits(self):
+        for kwargs in (
+            {"max_attributes": -1},
+            {"max_events": None},
+            {"max_links": None},
+            {"max_attributes_per_event": None},
+            {"max_attribute_length": -1},
+        ):
+            with self.assertRaises(ValueError):
+                trace.SpanLimits(**kwargs)
@@ -0,0 +1,67 @@
+# Copyright 2019, OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from unittest import mock
+
+from opentelemetry import trace as trace_api
+from opentelemetry.sdk import trace
+from opentelemetry.trace.status import StatusCanonicalCode
+
+
+class TestReadableSpan(unittest.TestCase):
+    def setUp(self):
+        self.tracer = trace.TracerSource().get_tracer(__name__)
+
+    def test_ended_span_is_frozen(self):
+        root = self.tracer.start_span("root")
+        root.set_attribute("component", "http")
+        root.add_event("event0")
+        root.end()
+
+        with self.assertRaises(TypeError):
+            root.attributes["component"] = "db"
+        self.assertIsInstance(root.events, tuple)
+        self.assertEqual(root.attributes["component"], "http")
+        self.assertEqual(root.events[0].name, "event0")
+
+    def test_readable_span_on_end(self):
+        span_processor = mock.Mock(spec=trace.SpanProcessor)
+        self.tracer.source.add_span_processor(span_processor)
+        with self.tracer.start_as_current_span("root") as root:
+            with self.tracer.start_as_current_span("child") as child:
+                child.set_attribute("component", "http")
+                child.add_event("event0")
+                child.update_name("child-renamed")
+
+        readable = span_processor.on_end.call_args_list[0][0][0]
+        self.assertIsInstance(readable, trace.ReadableSpan)
+        self.assertEqual(readable.name, "child-renamed")
+        self.assertIs(readable.context, child.context)
+        self.assertIs(readable.get_context(), child.context)
+        self.assertIs(readable.parent, root.context)
+        self.assertIs(readable.kind, trace_api.SpanKind.INTERNAL)
+        self.assertEqual(readable.start_time, child.start_time)
+        self.assertEqual(readable.end_time, child.end_time)
+        self.assertEqual(readable.attributes, {"component": "http"})
+        self.assertEqual(readable.events[0].name, "event0")
+        self.assertEqual(readable.links, ())
+        self.assertIs(readable.status.canonical_code, StatusCanonicalCode.OK)
+        self.assertEqual(readable.dropped_attributes, 0)
+
+        with self.assertRaises(AttributeError):
+            readable.name = "other"
+        with self.assertRaises(TypeError):
+            readable.attributes["component"] = "db"
+        self.assertIn('ReadableSpan(name="child-renamed"', str(readable))
@@ -0,0 +1,108 @@
+# Copyright 2019, OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from logging import WARNING
+from unittest import mock
+
+from opentelemetry import trace as trace_api
+from opentelemetry.sdk import trace
+from opentelemetry.trace.status import StatusCanonicalCode
+
+
+class TestSpanPool(unittest.TestCase):
+    def test_span_pool(self):
+        span_pool = trace.SpanPool(max_size=1)
+        tracer_source = trace.TracerSource(
+            span_pool=span_pool, shutdown_on_exit=False
+        )
+        ended_spans = []
+        span_processor = trace.SpanProcessor()
+        span_processor.on_end = ended_spans.append
+        tracer_source.add_span_processor(span_processor)
+        tracer = tracer_source.get_tracer(__name__)
+
+        with tracer.start_as_current_span("root") as root:
+            with tracer.start_as_current_span("child") as child:
+                child.set_attribute("component", "http")
+        child_record = ended_spans[0]
+
+        # The root is still referenced by the child.
+        self.assertFalse(span_pool.release(root))
+        self.assertEqual(span_pool.referenced_spans, 1)
+
+        self.assertTrue(span_pool.release(child))
+        child_id = id(child)
+        del child
+        self.assertEqual(len(span_pool), 1)
+        self.assertEqual(span_pool.released_spans, 1)
+
+        # The pool is full.
+        self.assertFalse(span_pool.release(root))
+        self.assertEqual(span_pool.released_spans, 1)
+
+        span = tracer.start_span("reused")
+        self.assertEqual(id(span), child_id)
+        self.assertEqual(len(span_pool), 0)
+        self.assertEqual(span.name, "reused")
+        self.assertIsNone(span.parent)
+        self.assertEqual(len(span.attributes), 0)
+        span.end()
+
+        # Records do not refer to the recycled span.
+        self.assertEqual(child_record.name, "child")
+        self.assertEqual(child_record.attributes["component"], "http")
+        self.assertIn("name='child'", repr(child_record))
+        self.assertNotIn(span, child_record)
+
+        with self.assertRaises(ValueError):
+            trace.SpanPool(max_size=0)
+
+    def test_span_pool_use_after_release(self):
+        span_pool = trace.SpanPool()
+        tracer = trace.TracerSource(
+            span_pool=span_pool, shutdown_on_exit=False
+        ).get_tracer(__name__)
+        span = tracer.start_span("span")
+        span.end()
+
+        # Simulates an interpreter that misses the reference of this test.
+        with mock.patch("sys.getrefcount", return_value=3):
+            self.assertTrue(span_pool.release(span))
+        with self.assertLogs(level=WARNING) as logs:
+            span.set_attribute("component", "http")
+            span.set_attributes({"component": "http"})
+            span.add_event("event")
+            span.update_name("renamed")
+            span.set_status(
+                trace_api.status.Status(StatusCanonicalCode.UNKNOWN)
+            )
+            span.end()
+        self.assertEqual(len(logs.records), 6)
+        for record in logs.records:
+            self.assertEqual(record.levelname, "ERROR")
+            self.assertIn("released to a SpanPool", record.getMessage())
+        self.assertEqual(span.name, "span")
+        self.assertEqual(len(span.attributes), 0)
+        self.assertEqual(len(span.events), 0)
+        self.assertIsNone(span.status)
+
+        with self.assertLogs(level=WARNING):
+            self.assertFalse(span_pool.release(span))
+        self.assertEqual(len(span_pool), 1)
+
+        # The span is live again once it is reused.
+        self.assertIs(tracer.start_span("reused"), span)
+        span.set_attribute("component", "http")
+        self.assertEqual(span.attributes["component"], "http")
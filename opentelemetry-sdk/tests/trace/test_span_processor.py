@@ -0,0 +1,142 @@
+# Copyright 2019, OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import unittest
+from unittest import mock
+
+from opentelemetry.sdk import trace
+
+
+class EndOnlySpanProcessor(trace.SpanProcessor):
+    def __init__(self):
+        self.ended_spans = []
+        self.threads = set()
+
+    def on_end(self, span: "trace.ReadableSpan") -> None:
+        self.threads.add(threading.current_thread())
+        self.ended_spans.append(span)
+
+
+class TestMultiSpanProcessor(unittest.TestCase):
+    def test_skips_inherited_hooks(self):
+        multi_processor = trace.MultiSpanProcessor()
+        end_only = EndOnlySpanProcessor()
+        multi_processor.add_span_processor(end_only)
+        multi_processor.add_span_processor(trace.SpanProcessor())
+        # pylint: disable=protected-access
+        self.assertEqual(multi_processor._on_start_processors, ())
+        self.assertEqual(multi_processor._on_end_processors, (end_only,))
+
+    def test_async_on_end(self):
+        tracer_source = trace.TracerSource(span_processor_workers=2)
+        tracer = tracer_source.get_tracer(__name__)
+        sync_processor = EndOnlySpanProcessor()
+        async_processor = EndOnlySpanProcessor()
+        async_processor.on_end_async_safe = True
+        tracer_source.add_span_processor(sync_processor)
+        tracer_source.add_span_processor(async_processor)
+
+        for _ in range(10):
+            with tracer.start_as_current_span("span"):
+                pass
+        self.assertTrue(tracer_source.force_flush())
+
+        self.assertEqual(len(sync_processor.ended_spans), 10)
+        self.assertEqual(len(async_processor.ended_spans), 10)
+        self.assertEqual(sync_processor.threads, {threading.current_thread()})
+        self.assertNotIn(threading.current_thread(), async_processor.threads)
+        tracer_source.shutdown()
+
+    def test_async_on_end_queue_full(self):
+        multi_processor = trace.MultiSpanProcessor(
+            max_workers=1, max_queue_size=1
+        )
+        blocked = threading.Event()
+        release = threading.Event()
+        span_processor = mock.Mock(spec=trace.SpanProcessor)
+        span_processor.on_end_async_safe = True
+
+        def on_end(span):
+            if span == "first":
+                blocked.set()
+                release.wait(5)
+
+        span_processor.on_end.side_effect = on_end
+        multi_processor.add_span_processor(span_processor)
+
+        multi_processor.on_end("first")
+        self.assertTrue(blocked.wait(5))
+        multi_processor.on_end("queued")
+        # The queue is full, so the span is handled on the calling thread.
+        multi_processor.on_end("inline")
+        self.assertEqual(
+            span_processor.on_end.call_args_list[-1], mock.call("inline")
+        )
+        release.set()
+        self.assertTrue(multi_processor.force_flush())
+        self.assertEqual(span_processor.on_end.call_count, 3)
+
+    def test_on_end_after_shutdown(self):
+        multi_processor = trace.MultiSpanProcessor(max_workers=1)
+        span_processor = EndOnlySpanProcessor()
+        span_processor.on_end_async_safe = True
+        multi_processor.add_span_processor(span_processor)
+        multi_processor.shutdown()
+
+        # The workers are gone, so the span is handled on the calling thread.
+        multi_processor.on_end("span")
+        self.assertEqual(span_processor.ended_spans, ["span"])
+        self.assertEqual(span_processor.threads, {threading.current_thread()})
+
+    def test_failing_processors(self):
+        for count in (1, 2):
+            multi_processor = trace.MultiSpanProcessor()
+            for _ in range(count):
+                span_processor = mock.Mock(spec=trace.SpanProcessor)
+                span_processor.force_flush.side_effect = RuntimeError
+                span_processor.shutdown.side_effect = RuntimeError
+                multi_processor.add_span_processor(span_processor)
+            with self.assertLogs(level="ERROR"):
+                self.assertFalse(multi_processor.force_flush())
+            with self.assertLogs(level="ERROR"):
+                multi_processor.shutdown()
+
+    def test_parallel_shutdown(self):
+        multi_processor = trace.MultiSpanProcessor()
+        barrier = threading.Barrier(2, timeout=5)
+        span_processors = [
+            mock.Mock(spec=trace.SpanProcessor) for _ in range(2)
+        ]
+        for span_processor in span_processors:
+            # Only returns if both processors shut down concurrently.
+            span_processor.shutdown.side_effect = barrier.wait
+            multi_processor.add_span_processor(span_processor)
+        multi_processor.shutdown()
+        self.assertFalse(barrier.broken)
+
+    def test_force_flush_deadline(self):
+        multi_processor = trace.MultiSpanProcessor()
+        release = threading.Event()
+        slow_processor = mock.Mock(spec=trace.SpanProcessor)
+        slow_processor.force_flush.side_effect = lambda timeout: release.wait()
+        fast_processor = mock.Mock(spec=trace.SpanProcessor)
+        fast_processor.force_flush.return_value = True
+        multi_processor.add_span_processor(slow_processor)
+        multi_processor.add_span_processor(fast_processor)
+
+        self.assertFalse(multi_processor.force_flush(timeout_millis=50))
+        release.set()
+        fast_processor.force_flush.assert_called_once()
+        self.assertLessEqual(fast_processor.force_flush.call_args[0][0], 50)
@@ -0,0 +1,237 @@
+# Copyright 2019, OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import threading
+import unittest
+from unittest import mock
+
+from opentelemetry import trace as trace_api
+from opentelemetry.sdk import trace
+from opentelemetry.sdk.trace.export import (
+    SimpleExportSpanProcessor,
+    in_memory_span_exporter,
+)
+from opentelemetry.sdk.trace.tail_sampling import (
+    AttributePolicy,
+    ErrorPolicy,
+    LatencyPolicy,
+    ProbabilisticPolicy,
+    TailSamplingSpanProcessor,
+)
+from opentelemetry.trace.status import Status, StatusCanonicalCode
+
+
+class TestTailSamplingSpanProcessor(unittest.TestCase):
+    def setUp(self):
+        self.tracer_source = trace.TracerSource()
+        self.tracer = self.tracer_source.get_tracer(__name__)
+        self.exporter = in_memory_span_exporter.InMemorySpanExporter()
+
+    def add_processor(self, policies, **kwargs):
+        processor = TailSamplingSpanProcessor(
+            SimpleExportSpanProcessor(self.exporter), policies, **kwargs
+        )
+        self.tracer_source.add_span_processor(processor)
+        return processor
+
+    def finished_span_names(self):
+        return [span.name for span in self.exporter.get_finished_spans()]
+
+    def test_whole_trace_forwarded_when_root_ends(self):
+        processor = self.add_processor([ErrorPolicy()])
+        with self.tracer.start_as_current_span("root"):
+            with self.tracer.start_as_current_span("child"):
+                pass
+            with self.tracer.start_as_current_span("failed") as failed:
+                failed.set_status(Status(StatusCanonicalCode.INTERNAL))
+            self.assertEqual(self.finished_span_names(), [])
+        self.assertEqual(
+            self.finished_span_names(), ["child", "failed", "root"]
+        )
+
+        with self.tracer.start_as_current_span("root"):
+            with self.tracer.start_as_current_span("child"):
+                pass
+        self.assertEqual(len(self.exporter.get_finished_spans()), 3)
+        self.assertEqual(processor.sampled_traces, 1)
+        self.assertEqual(processor.dropped_traces, 1)
+
+    def test_remote_parent_is_local_root(self):
+        self.add_processor([ErrorPolicy()])
+        remote_parent = trace_api.SpanContext(0xDEADBEEF, 0xDEADBEF0)
+        with self.tracer.start_as_current_span("server", remote_parent):
+            with self.tracer.start_as_current_span("failed") as failed:
+                failed.set_status(Status(StatusCanonicalCode.INTERNAL))
+        self.assertEqual(self.finished_span_names(), ["failed", "server"])
+
+    def test_latency_policy(self):
+        self.add_processor([LatencyPolicy(10)])
+        root = self.tracer.start_span("fast", start_time=0)
+        root.end(end_time=10 * 10 ** 6)
+        root = self.tracer.start_span("slow", start_time=0)
+        child = self.tracer.start_span("child", root, start_time=0)
+        child.end(end_time=11 * 10 ** 6)
+        root.end(end_time=1)
+        self.assertEqual(self.finished_span_names(), ["child", "slow"])
+
+    def test_attribute_policy(self):
+        self.add_processor(
+            [
+                AttributePolicy("http.status_code", lambda code: code >= 500),
+                AttributePolicy("debug", True),
+            ]
+        )
+        for name, attributes in (
+            ("ok", {"http.status_code": 200}),
+            ("error", {"http.status_code": 503}),
+            ("debug", {"debug": True}),
+            ("mismatch", {"debug": "true"}),
+        ):
+            with self.tracer.start_as_current_span(
+                name, attributes=attributes
+            ):
+                pass
+        self.assertEqual(self.finished_span_names(), ["error", "debug"])
+
+    def test_attribute_policy_numbers(self):
+        policy = AttributePolicy("http.status_code", 500)
+        for value in (500, 500.0):
+            span = mock.Mock(attributes={"http.status_code": value})
+            self.assertTrue(policy.should_sample(1, (span,)))
+        span = mock.Mock(attributes={"http.status_code": 200})
+        self.assertFalse(policy.should_sample(1, (span,)))
+
+    def test_attribute_policy_lazy_value(self):
+        def fail():
+            raise ValueError("unavailable")
+
+        def lazy_span(function):
+            return mock.Mock(
+                attributes={"tenant": trace_api.LazyAttributeValue(function)}
+            )
+
+        policy = AttributePolicy("tenant", "acme")
+        self.assertTrue(policy.should_sample(1, (lazy_span(lambda: "acme"),)))
+        self.assertFalse(
+            policy.should_sample(1, (lazy_span(lambda: "other"),))
+        )
+        with self.assertLogs(level=logging.ERROR):
+            self.assertFalse(policy.should_sample(1, (lazy_span(fail),)))
+
+    def test_probabilistic_policy(self):
+        policy = ProbabilisticPolicy(0.5)
+        self.assertTrue(policy.should_sample(0x7FFFFFFFFFFFFFFF, ()))
+        self.assertFalse(policy.should_sample(0x8000000000000000, ()))
+
+    def test_late_spans_follow_decision(self):
+        self.add_processor([AttributePolicy("keep", True)])
+        for keep in (True, False):
+            root = self.tracer.start_span("root", attributes={"keep": keep})
+            child = self.tracer.start_span("late", root)
+            root.end()
+            child.end()
+        self.assertEqual(self.finished_span_names(), ["root", "late"])
+
+    @mock.patch("time.monotonic")
+    def test_decision_wait(self, monotonic):
+        monotonic.return_value = 100.0
+        processor = self.add_processor(
+            [ErrorPolicy(), ProbabilisticPolicy(1.0)],
+            decision_wait_millis=1000,
+        )
+        root = self.tracer.start_span("root")
+        self.tracer.start_span("child", root).end()
+        self.assertEqual(self.finished_span_names(), [])
+
+        monotonic.return_value = 101.0
+        self.tracer.start_span("other").end()
+        self.assertEqual(self.finished_span_names(), ["child", "other"])
+        self.assertEqual(processor.expired_traces, 1)
+
+    def test_decision_wait_without_new_spans(self):
+        forwarded = threading.Event()
+        span_processor = mock.Mock(spec=trace.SpanProcessor)
+        span_processor.on_end.side_effect = lambda span: forwarded.set()
+        processor = TailSamplingSpanProcessor(
+            span_processor,
+            [ProbabilisticPolicy(1.0)],
+            decision_wait_millis=10,
+        )
+        self.tracer_source.add_span_processor(processor)
+
+        root = self.tracer.start_span("root")
+        self.tracer.start_span("child", root).end()
+        # Decided by the worker thread although no other span ends.
+        self.assertTrue(forwarded.wait(10))
+        self.assertEqual(processor.expired_traces, 1)
+        processor.shutdown()
+
+    def test_max_traces(self):
+        processor = self.add_processor(
+            [ProbabilisticPolicy(1.0)], max_traces=2
+        )
+        for index in range(3):
+            root = self.tracer.start_span(str(index))
+            self.tracer.start_span("child-{}".format(index), root).end()
+        self.assertEqual(self.finished_span_names(), ["child-0"])
+        self.assertEqual(processor.evicted_traces, 1)
+
+    def test_max_spans(self):
+        processor = self.add_processor(
+            [ProbabilisticPolicy(1.0)], max_spans=3, max_spans_per_trace=2
+        )
+        root = self.tracer.start_span("root")
+        for index in range(3):
+            self.tracer.start_span("child-{}".format(index), root).end()
+        self.assertEqual(processor.dropped_spans, 1)
+
+        other = self.tracer.start_span("other")
+        self.tracer.start_span("other-child", other).end()
+        self.tracer.start_span("other-child", other).end()
+        self.assertEqual(self.finished_span_names(), ["child-0", "child-1"])
+        self.assertEqual(processor.evicted_traces, 1)
+
+    def test_force_flush_and_shutdown(self):
+        span_processor = mock.Mock(spec=trace.SpanProcessor)
+        processor = TailSamplingSpanProcessor(
+            span_processor, [ProbabilisticPolicy(1.0)]
+        )
+        self.tracer_source.add_span_processor(processor)
+
+        root = self.tracer.start_span("root")
+        self.tracer.start_span("child", root).end()
+        # Start callbacks are forwarded before the trace is decided.
+        self.assertEqual(span_processor.on_start.call_count, 2)
+        self.assertEqual(span_processor.on_end.call_count, 0)
+        processor.force_flush(100)
+        self.assertEqual(span_processor.on_end.call_count, 1)
+        span_processor.force_flush.assert_called_once_with(100)
+
+        self.tracer.start_span("child", root).end()
+        processor.shutdown()
+        self.assertEqual(span_processor.on_end.call_count, 2)
+        span_processor.shutdown.assert_called_once_with()
+
+    def test_invalid_arguments(self):
+        for kwargs in (
+            {"decision_wait_millis": 0},
+            {"max_traces": 0},
+            {"max_spans": 0},
+            {"max_spans_per_trace": 0},
+        ):
+            with self.assertRaises(ValueError):
+                TailSamplingSpanProcessor(
+                    trace.SpanProcessor(), [ErrorPolicy()], **kwargs
+                )
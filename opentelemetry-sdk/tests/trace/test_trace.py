@@ -14,6 +14,7 @@
 
 import shutil
 import subprocess
+import threading
 import unittest
 from logging import ERROR, WARNING
 from unittest import mock
@@ -185,6 +186,52 @@ class TestSpanCreation(unittest.TestCase):
             tracer1.instrumentation_info.name, "ERROR:MISSING MODULE NAME"
         )
 
+    def test_tracer_registry(self):
+        tracer_source = trace.TracerSource()
+        tracer = tracer_source.get_tracer("instr1", "1.0")
+        self.assertIs(tracer_source.get_tracer("instr1", "1.0"), tracer)
+        self.assertIsNot(tracer_source.get_tracer("instr1", "1.1"), tracer)
+        self.assertIsNot(
+            trace.TracerSource().get_tracer("instr1", "1.0"), tracer
+        )
+
+        barrier = threading.Barrier(8)
+        tracers = []
+
+        def get_tracer():
+            barrier.wait()
+            tracers.append(tracer_source.get_tracer("instr2"))
+
+        threads = [threading.Thread(target=get_tracer) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(set(map(id, tracers))), 1)
+
+    def test_disable_instrumentation(self):
+        tracer_source = trace.TracerSource()
+        tracer = tracer_source.get_tracer("instr1", "1.0")
+        other_tracer = tracer_source.get_tracer("instr2")
+        tracer_source.disable_instrumentation("instr1")
+
+        self.assertIsInstance(tracer.start_span("root"), trace_api.DefaultSpan)
+        with other_tracer.start_as_current_span("root") as root:
+            with tracer.start_as_current_span("disabled") as disabled:
+                self.assertIsInstance(disabled, trace_api.DefaultSpan)
+                self.assertEqual(disabled.get_context(), root.get_context())
+                child = other_tracer.start_span("child")
+        self.assertEqual(child.parent.get_context(), root.get_context())
+
+        tracer_v2 = tracer_source.get_tracer("instr1", "2.0")
+        self.assertIsInstance(
+            tracer_v2.start_span("root"), trace_api.DefaultSpan
+        )
+
+        tracer_source.enable_instrumentation("instr1")
+        self.assertIsInstance(tracer.start_span("root"), trace.Span)
+        self.assertIsInstance(tracer_v2.start_span("root"), trace.Span)
+
     def test_span_processor_for_source(self):
         tracer_source = trace.TracerSource()
         tracer1 = tracer_source.get_tracer("instr1")
@@ -313,6 +360,30 @@ class TestSpanCreation(unittest.TestCase):
         self.assertIsNone(tracer.get_current_span())
         self.assertIsNotNone(root.end_time)
 
+    def test_start_as_current_span_async(self):
+        # Drives ``async with`` by hand, async syntax would break Python 3.4.
+        def complete(awaitable):
+            try:
+                next(awaitable.__await__())
+            except StopIteration as stop:
+                return stop.value
+            raise AssertionError("awaitable did not complete")
+
+        tracer = new_tracer()
+        activation = tracer.start_as_current_span("root")
+        entered = complete(activation.__aenter__())
+        root = tracer.get_current_span()
+        self.assertIs(entered, root)
+        self.assertIsNone(root.end_time)
+
+        error = ValueError("error")
+        self.assertFalse(
+            complete(activation.__aexit__(ValueError, error, None))
+        )
+        self.assertIsNone(tracer.get_current_span())
+        self.assertIsNotNone(root.end_time)
+        self.assertIs(root.status.canonical_code, StatusCanonicalCode.UNKNOWN)
+
     def test_start_as_current_span_explicit(self):
         tracer = new_tracer()
 
@@ -407,6 +478,29 @@ class TestSpan(unittest.TestCase):
             self.assertEqual(root.attributes["attr-key2"], "val2")
             self.assertEqual(root.attributes["attr-in-both"], "span-attr")
 
+    def test_span_layout(self):
+        span = trace.Span("name", mock.Mock(spec=trace_api.SpanContext))
+        self.assertFalse(hasattr(span, "__dict__"))
+        # containers are shared placeholders until something is recorded
+        self.assertIs(span.attributes, trace.Span.empty_attributes)
+        self.assertIs(span.events, trace.Span.empty_events)
+        self.assertIs(span.links, trace.Span.empty_links)
+
+    def test_thread_confined_spans(self):
+        tracer = trace.TracerSource(thread_safe_spans=False).get_tracer(
+            __name__
+        )
+        with tracer.start_as_current_span("root") as root:
+            # pylint: disable=protected-access
+            self.assertIsNone(root._lock)
+            root.set_attribute("component", "http")
+            root.add_event("event0")
+            root.update_name("toor")
+            self.assertEqual(root.attributes["component"], "http")
+            self.assertEqual(len(root.events), 1)
+        self.assertEqual(root.name, "toor")
+        self.assertIsNotNone(root.end_time)
+
     def test_invalid_attribute_values(self):
         with self.tracer.start_as_current_span("root") as root:
             root.set_attribute("non-primitive-data-type", dict())
@@ -424,6 +518,101 @@ class TestSpan(unittest.TestCase):
 
             self.assertEqual(len(root.attributes), 0)
 
+    def test_interned_strings(self):
+        spans = []
+        for _ in range(2):
+            span = self.tracer.start_span("/".join(("", "users", "list")))
+            span.set_attribute(".".join(("http", "method")), "GET")
+            span.update_name(" ".join(("GET", "/users/list")))
+            spans.append(span)
+        self.assertIs(spans[0].name, spans[1].name)
+        self.assertIs(
+            next(iter(spans[0].attributes)), next(iter(spans[1].attributes))
+        )
+
+    def test_set_attributes(self):
+        with self.tracer.start_as_current_span("root") as root:
+            root.set_attribute("component", "http")
+            with self.assertLogs(level=WARNING):
+                root.set_attributes(
+                    {
+                        "http.method": "GET",
+                        "non-primitive-data-type": dict(),
+                        "component": "db",
+                        "db.rows": [1, 2],
+                    }
+                )
+            self.assertEqual(
+                list(root.attributes.items()),
+                [
+                    ("http.method", "GET"),
+                    ("component", "db"),
+                    ("db.rows", [1, 2]),
+                ],
+            )
+
+            root.set_attributes(
+                {
+                    "attr-{}".format(index): index
+                    for index in range(trace.MAX_NUM_ATTRIBUTES)
+                }
+            )
+            self.assertEqual(len(root.attributes), trace.MAX_NUM_ATTRIBUTES)
+            self.assertEqual(root.dropped_attributes, 3)
+            self.assertNotIn("component", root.attributes)
+
+        with self.assertLogs(level=WARNING):
+            root.set_attributes({"http.status_code": 200})
+        self.assertNotIn("http.status_code", root.attributes)
+
+    def test_lazy_attribute_values(self):
+        function = mock.Mock(return_value="value")
+        tracer = trace.TracerSource(sampling.ALWAYS_OFF).get_tracer(__name__)
+        with tracer.start_as_current_span("unsampled") as span:
+            span.set_attribute("lazy", trace_api.LazyAttributeValue(function))
+
+        with self.tracer.start_as_current_span("root") as root:
+            root.set_attributes(
+                {
+                    "lazy": trace_api.LazyAttributeValue(function),
+                    "invalid": trace_api.LazyAttributeValue(dict),
+                    "error": trace_api.LazyAttributeValue(lambda: 1 / 0),
+                    "plain": 1,
+                }
+            )
+        # pylint: disable=protected-access
+        readable_span = root._readable_span()
+        function.assert_not_called()
+
+        with self.assertLogs(level=WARNING):
+            resolved = readable_span.resolve_attributes()
+        function.assert_called_once_with()
+        self.assertEqual(
+            dict(resolved.attributes), {"lazy": "value", "plain": 1}
+        )
+        self.assertEqual(resolved.dropped_attributes, 2)
+        self.assertIs(resolved.resolve_attributes(), resolved)
+
+    def test_add_events(self):
+        with self.tracer.start_as_current_span("root") as root:
+            root.add_event("first")
+            root.add_events(
+                trace_api.Event("event-{}".format(index), {}, index)
+                for index in range(trace.MAX_NUM_EVENTS)
+            )
+            self.assertEqual(len(root.events), trace.MAX_NUM_EVENTS)
+            self.assertEqual(root.dropped_events, 1)
+            self.assertEqual(root.events[0].name, "event-0")
+            self.assertEqual(
+                root.events[-1].timestamp, trace.MAX_NUM_EVENTS - 1
+            )
+
+        with self.assertLogs(level=WARNING):
+            root.add_events([trace_api.Event("late", {}, 0)])
+        self.assertEqual(
+            root.events[-1].name, "event-{}".format(trace.MAX_NUM_EVENTS - 1)
+        )
+
     def test_check_sequence_helper(self):
         # pylint: disable=protected-access
         self.assertEqual(
@@ -597,6 +786,29 @@ class TestSpan(unittest.TestCase):
         span.end(end_time)
         self.assertEqual(end_time, span.end_time)
 
+    @mock.patch("opentelemetry.sdk.trace.perf_counter_ns")
+    @mock.patch("opentelemetry.sdk.trace.time_ns")
+    def test_monotonic_timing(self, time_ns_mock, perf_counter_ns):
+        time_ns_mock.return_value = 10 ** 18
+        perf_counter_ns.return_value = 5000
+        span = self.tracer.start_span("root")
+        self.assertEqual(span.start_time, 10 ** 18)
+
+        # The wall clock jumps back by an hour while the span is running.
+        time_ns_mock.return_value = 10 ** 18 - 3600 * 10 ** 9
+        perf_counter_ns.return_value = 7000
+        span.add_event("event")
+        perf_counter_ns.return_value = 9000
+        span.end()
+        self.assertEqual(span.events[0].timestamp, 10 ** 18 + 2000)
+        self.assertEqual(span.end_time, 10 ** 18 + 4000)
+
+        # Spans with an explicit start time cannot be anchored to the
+        # monotonic clock.
+        span = self.tracer.start_span("explicit", start_time=10 ** 18)
+        span.end()
+        self.assertEqual(span.end_time, 10 ** 18 - 3600 * 10 ** 9)
+
     def test_ended_span(self):
         """"Events, attributes are not allowed after span is ended"""
 
@@ -0,0 +1,79 @@
+# Copyright 2019, OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from unittest import mock
+
+from opentelemetry import trace as trace_api
+from opentelemetry.sdk import trace
+from opentelemetry.trace import sampling
+
+
+class TestTracerSampling(unittest.TestCase):
+    def test_sampler_span_kind(self):
+        sampler = sampling.RuleBasedSampler(
+            [
+                sampling.SamplingRule(
+                    sampling.ALWAYS_OFF, kind=trace_api.SpanKind.CLIENT
+                )
+            ]
+        )
+        tracer = trace.TracerSource(sampler).get_tracer(__name__)
+        client_span = tracer.start_span(
+            "client", kind=trace_api.SpanKind.CLIENT
+        )
+        self.assertIsInstance(client_span, trace_api.DefaultSpan)
+        server_span = tracer.start_span(
+            "server", kind=trace_api.SpanKind.SERVER
+        )
+        self.assertIsInstance(server_span, trace.Span)
+
+    def test_sampler_without_span_kind(self):
+        class LegacySampler(sampling.Sampler):
+            # pylint: disable=arguments-differ,unused-argument
+            def should_sample(
+                self,
+                parent_context,
+                trace_id,
+                span_id,
+                name,
+                attributes=None,
+                links=(),
+            ):
+                return sampling.Decision(name == "sampled")
+
+        tracer = trace.TracerSource(LegacySampler()).get_tracer(__name__)
+        self.assertIsInstance(tracer.start_span("sampled"), trace.Span)
+        self.assertIsInstance(
+            tracer.start_span("unsampled", kind=trace_api.SpanKind.CLIENT),
+            trace_api.DefaultSpan,
+        )
+
+    def test_unsampled_span_ignores_attributes(self):
+        tracer = trace.TracerSource(sampling.ALWAYS_OFF).get_tracer(__name__)
+        attributes = mock.MagicMock()
+        with tracer.start_as_current_span(
+            "root", attributes=attributes
+        ) as root:
+            self.assertIs(tracer.get_current_span(), root)
+            root.set_attribute("component", "http")
+        self.assertIsNone(tracer.get_current_span())
+        self.assertEqual(attributes.mock_calls, [])
+
+    def test_unsampled_span_exception(self):
+        tracer = trace.TracerSource(sampling.ALWAYS_OFF).get_tracer(__name__)
+        with self.assertRaises(ValueError):
+            with tracer.start_as_current_span("root"):
+                raise ValueError("invalid")
+        self.assertIsNone(tracer.get_current_span())